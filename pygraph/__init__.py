@@ -1,20 +1,29 @@
 # Graph class objects
-from .classes import DirectedGraph, UndirectedGraph
+from .classes import DirectedGraph, UndirectedGraph, SubgraphView, GraphObserver
 
 # Useful Functions
 from .functions import (a_star_search,
                         breadth_first_search,
                         depth_first_search, depth_first_search_with_parent_data,
-                        is_planar,
+                        k_hop_neighborhood, ego_graph,
+                        is_planar, find_planar_embedding, find_embedding_faces,
                         get_connected_components, get_connected_components_as_subgraphs,
-                        find_articulation_vertices, find_biconnected_components,
+                        get_strongly_connected_components, get_condensation_graph, get_weakly_connected_components,
+                        ComponentIndex, get_connected_components_vectorized,
+                        find_articulation_vertices, find_biconnected_components, find_biconnected_structure,
+                        build_block_cut_tree, BlockCutTree, find_bridges, find_2_edge_connected_components,
+                        find_triconnected_components, find_separation_pairs,
+                        build_spqr_tree, build_spqr_trees, SPQRTree,
                         find_minimum_spanning_tree, find_minimum_spanning_tree_as_subgraph,
-                        find_minimum_spanning_forest, find_minimum_spanning_forest_as_subgraphs)
+                        find_minimum_spanning_forest, find_minimum_spanning_forest_as_subgraphs,
+                        NeighborSampler,
+                        IncrementalConnectivity, DynamicConnectivity, offline_dynamic_connectivity,
+                        MSTMaintainer, TreeQueryIndex)
 
-from .helpers import (make_subgraph, merge_graphs, create_graph_from_adjacency_matrix)
+from .helpers import (make_subgraph, merge_graphs, create_graph_from_adjacency_matrix, CSRGraph)
 
 # --For testing
-from .helpers import DisjointSet
+from .helpers import DisjointSet, IndexedDisjointSet, RollbackDisjointSet
 
 # Predefined graph factories
 from .predefined_graphs import (build_cycle_graph,
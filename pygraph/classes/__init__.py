@@ -1,3 +1,5 @@
 from .directed_graph import DirectedGraph
 from .undirected_graph import UndirectedGraph
+from .subgraph_view import SubgraphView
+from .graph_observer import GraphObserver
 
@@ -16,6 +16,7 @@ class DirectedGraph(object):
         self.edges = {}
         self._num_nodes = 0
         self._num_edges = 0
+        self._observers = []
 
     def __deepcopy__(self, memo=None):
         graph = DirectedGraph()
@@ -35,6 +36,20 @@ class DirectedGraph(object):
         """Returns the current number of edges in the graph."""
         return self._num_edges
 
+    def add_observer(self, observer):
+        """Registers a GraphObserver to be notified of every structural change to the graph.
+        Observers are not carried over when the graph is copied."""
+        self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Stops notifying a previously registered GraphObserver."""
+        self._observers.remove(observer)
+
+    def _notify(self, event, *args):
+        """Forwards a structural change to all the registered observers."""
+        for observer in self._observers:
+            getattr(observer, event)(*args)
+
     def generate_node_id(self):
         node_id = self.next_node_id
         self.next_node_id += 1
@@ -59,6 +74,8 @@ class DirectedGraph(object):
 
         self._num_nodes += 1
 
+        self._notify('on_new_node', node_id)
+
         return node_id
 
     def new_edge(self, node_a, node_b, cost=1):
@@ -85,12 +102,18 @@ class DirectedGraph(object):
         }
 
         self.edges[edge_id] = edge
-        self.nodes[node_a]['edges'].append(edge_id)
+        self._attach_edge(edge_id, node_a, node_b)
 
         self._num_edges += 1
 
+        self._notify('on_new_edge', edge_id, node_a, node_b)
+
         return edge_id
 
+    def _attach_edge(self, edge_id, node_a, node_b):
+        """Records a new edge in the edge lists of the nodes it can be followed from."""
+        self.nodes[node_a]['edges'].append(edge_id)
+
     def neighbors(self, node_id):
         """Find all the nodes where there is an edge from the specified node to that node.
         Returns a list of node ids."""
@@ -165,6 +188,8 @@ class DirectedGraph(object):
 
         self._num_edges -= 1
 
+        self._notify('on_delete_edge', edge_id, *edge['vertices'])
+
     def delete_edge_by_nodes(self, node_a, node_b):
         """Removes all the edges from node_a to node_b from the graph."""
         node = self.get_node(node_a)
@@ -185,8 +210,9 @@ class DirectedGraph(object):
         node = self.get_node(node_id)
 
         # Remove all edges from the node
-        for e in node['edges']:
-            self.delete_edge_by_id(e)
+        # --Deleting an edge removes it from the node's edge list, so we keep taking the first one
+        while len(node['edges']) > 0:
+            self.delete_edge_by_id(node['edges'][0])
 
         # Remove all edges to the node
         edges = [edge_id for edge_id, edge in list(self.edges.items()) if edge['vertices'][1] == node_id]
@@ -198,10 +224,13 @@ class DirectedGraph(object):
 
         self._num_nodes -= 1
 
+        self._notify('on_delete_node', node_id)
+
     def move_edge_source(self, edge_id, node_a, node_b):
         """Moves an edge originating from node_a so that it originates from node_b."""
         # Grab the edge
         edge = self.get_edge(edge_id)
+        old_vertices = edge['vertices']
 
         # Alter the vertices
         edge['vertices'] = (node_b, edge['vertices'][1])
@@ -214,14 +243,23 @@ class DirectedGraph(object):
         node = self.get_node(node_b)
         node['edges'].append(edge_id)
 
+        # Observers see a move as the removal of the old edge and the addition of the new one
+        self._notify('on_delete_edge', edge_id, *old_vertices)
+        self._notify('on_new_edge', edge_id, *edge['vertices'])
+
     def move_edge_target(self, edge_id, node_a):
         """Moves an edge so that it targets node_a."""
         # Grab the edge
         edge = self.get_edge(edge_id)
+        old_vertices = edge['vertices']
 
         # Alter the vertices
         edge['vertices'] = (edge['vertices'][0], node_a)
 
+        # Observers see a move as the removal of the old edge and the addition of the new one
+        self._notify('on_delete_edge', edge_id, *old_vertices)
+        self._notify('on_new_edge', edge_id, *edge['vertices'])
+
     def get_edge_ids_by_node_ids(self, node_a, node_b):
         """Returns a list of edge ids connecting node_a to node_b."""
         # Check if the nodes are adjacent
@@ -0,0 +1,23 @@
+"""Implements the base class for objects that follow structural changes to a graph."""
+
+
+class GraphObserver(object):
+    """Base class for objects registered with ''graph.add_observer''.
+    The graph calls these methods after each structural change; subclasses override the ones they care about.
+    """
+
+    def on_new_node(self, node_id):
+        """Called after a node has been added to the graph."""
+        pass
+
+    def on_new_edge(self, edge_id, node_a, node_b):
+        """Called after an edge from node_a to node_b has been added to the graph."""
+        pass
+
+    def on_delete_edge(self, edge_id, node_a, node_b):
+        """Called after the edge from node_a to node_b has been removed from the graph."""
+        pass
+
+    def on_delete_node(self, node_id):
+        """Called after a node has been removed from the graph. Its edges have already been reported as deleted."""
+        pass
@@ -0,0 +1,106 @@
+"""Implements a read-only view of a subgraph of an existing graph."""
+
+from ..exceptions import NonexistentNodeError, NonexistentEdgeError
+
+
+class SubgraphView(object):
+    """A read-only view of the subgraph induced by a set of nodes.
+    Nothing is copied: the node and edge objects are those of the underlying graph,
+    so the view reflects later changes to the underlying graph."""
+
+    def __init__(self, graph, node_ids):
+        self.graph = graph
+        self._node_ids = set(node_ids)
+
+    def __contains__(self, node_id):
+        return node_id in self._node_ids
+
+    def num_nodes(self):
+        """Returns the current number of nodes in the view."""
+        return len(self._node_ids)
+
+    def num_edges(self):
+        """Returns the current number of edges in the view."""
+        return len(self.get_all_edge_ids())
+
+    def neighbors(self, node_id):
+        """Find all the nodes in the view where there is an edge from the specified node to that node.
+        Returns a list of node ids."""
+        self.__verify_node(node_id)
+        return [n for n in self.graph.neighbors(node_id) if n in self._node_ids]
+
+    def adjacent(self, node_a, node_b):
+        """Determines whether there is an edge from node_a to node_b within the view.
+        Returns True if such an edge exists, otherwise returns False."""
+        return node_b in self.neighbors(node_a)
+
+    def edge_cost(self, node_a, node_b):
+        """Returns the cost of moving between the edge that connects node_a to node_b.
+        Returns +inf if no such edge exists within the view."""
+        self.__verify_node(node_a)
+        if node_b not in self._node_ids:
+            return float('inf')
+        return self.graph.edge_cost(node_a, node_b)
+
+    def get_node(self, node_id):
+        """Returns a node object for "node_id", listing only the edges within the view.
+        The 'data' dict is shared with the underlying graph."""
+        self.__verify_node(node_id)
+        node = self.graph.get_node(node_id)
+        return {'id': node['id'],
+                'edges': [edge_id for edge_id in node['edges'] if self.__contains_edge(edge_id)],
+                'data': node['data']
+        }
+
+    def get_all_node_ids(self):
+        """Returns a list of all the node ids in the view."""
+        return list(self._node_ids)
+
+    def get_all_node_objects(self):
+        """Returns a list of all the node objects in the view."""
+        return [self.get_node(node_id) for node_id in self._node_ids]
+
+    def get_edge(self, edge_id):
+        """Returns the edge object identified by "edge_id"."""
+        edge = self.graph.get_edge(edge_id)
+        if not self.__contains_edge(edge_id):
+            raise NonexistentEdgeError(edge_id)
+        return edge
+
+    def get_all_edge_ids(self):
+        """Returns a list of all the edge ids in the view."""
+        edge_ids = set()
+        for node_id in self._node_ids:
+            for edge_id in self.graph.get_node(node_id)['edges']:
+                if self.__contains_edge(edge_id):
+                    edge_ids.add(edge_id)
+        return list(edge_ids)
+
+    def get_all_edge_objects(self):
+        """Returns a list of all the edge objects in the view."""
+        return [self.graph.get_edge(edge_id) for edge_id in self.get_all_edge_ids()]
+
+    def get_edge_ids_by_node_ids(self, node_a, node_b):
+        """Returns a list of edge ids connecting node_a to node_b within the view."""
+        self.__verify_node(node_a)
+        if node_b not in self._node_ids:
+            return []
+        return self.graph.get_edge_ids_by_node_ids(node_a, node_b)
+
+    def get_first_edge_id_by_node_ids(self, node_a, node_b):
+        """Returns the first (and possibly only) edge connecting node_a and node_b within the view."""
+        ret = self.get_edge_ids_by_node_ids(node_a, node_b)
+        if not ret:
+            return None
+        else:
+            return ret[0]
+
+    def __verify_node(self, node_id):
+        """Raises an error if the node is not part of the view."""
+        if node_id not in self._node_ids:
+            raise NonexistentNodeError(node_id)
+
+    def __contains_edge(self, edge_id):
+        """Determines whether both endpoints of an edge are part of the view."""
+        a, b = self.graph.get_edge(edge_id)['vertices']
+        return a in self._node_ids and b in self._node_ids
@@ -20,9 +20,12 @@ class UndirectedGraph(DirectedGraph):
     def new_edge(self, node_a, node_b, cost=1):
         """Adds a new, undirected edge between node_a and node_b with a cost.
         Returns the edge id of the new edge."""
-        edge_id = super(UndirectedGraph, self).new_edge(node_a, node_b, cost)
+        return super(UndirectedGraph, self).new_edge(node_a, node_b, cost)
+
+    def _attach_edge(self, edge_id, node_a, node_b):
+        """Records a new edge in the edge lists of both of its nodes."""
+        self.nodes[node_a]['edges'].append(edge_id)
         self.nodes[node_b]['edges'].append(edge_id)
-        return edge_id
 
     def neighbors(self, node_id):
         """Find all the nodes where there is an edge from the specified node to that node.
@@ -61,10 +64,13 @@ class UndirectedGraph(DirectedGraph):
 
         self._num_edges -= 1
 
+        self._notify('on_delete_edge', edge_id, *edge['vertices'])
+
     def move_edge_target(self, edge_id, node_a):
         """Moves an edge so that it targets node_a."""
         # Grab the edge
         edge = self.get_edge(edge_id)
+        old_vertices = edge['vertices']
 
         # Remove the edge from the original "target node"
         original_target_node_id = edge['vertices'][1]
@@ -79,6 +85,10 @@ class UndirectedGraph(DirectedGraph):
         # Alter the vertices on the edge
         edge['vertices'] = (edge['vertices'][0], node_a)
 
+        # Observers see a move as the removal of the old edge and the addition of the new one
+        self._notify('on_delete_edge', edge_id, *old_vertices)
+        self._notify('on_new_edge', edge_id, *edge['vertices'])
+
     def get_edge_ids_by_node_ids(self, node_a, node_b):
         """Returns a list of edge ids connecting node_a to node_b."""
         # Check if the nodes are adjacent
@@ -1,14 +1,35 @@
 from .searching import (a_star_search,
                         breadth_first_search,
-                        depth_first_search, depth_first_search_with_parent_data)
+                        depth_first_search, depth_first_search_with_parent_data,
+                        k_hop_neighborhood, ego_graph)
 
-from .connected_components import get_connected_components, get_connected_components_as_subgraphs
+from .connected_components import (get_connected_components, get_connected_components_as_subgraphs,
+                                   get_strongly_connected_components, get_condensation_graph,
+                                   get_weakly_connected_components, ComponentIndex)
+
+from .vectorized_connected_components import get_connected_components_vectorized
 
 from .biconnected_components import (find_biconnected_components, find_articulation_vertices,
-                                     find_biconnected_components_as_subgraphs)
+                                     find_biconnected_components_as_subgraphs, find_biconnected_structure,
+                                     build_block_cut_tree)
+
+from .block_cut_tree import BlockCutTree
+
+from .bridges import find_bridges, find_2_edge_connected_components
+
+from .triconnected_components import (find_triconnected_components, find_separation_pairs,
+                                     build_spqr_tree, build_spqr_trees, SPQRTree)
 
 from .spanning_tree import (find_minimum_spanning_tree, find_minimum_spanning_tree_as_subgraph,
                             find_minimum_spanning_forest, find_minimum_spanning_forest_as_subgraphs)
 
-from .planarity import is_planar
+from .planarity import is_planar, find_planar_embedding, find_embedding_faces
+
+from .sampling import NeighborSampler, sample_blocks
+
+from .dynamic_connectivity import IncrementalConnectivity, DynamicConnectivity, offline_dynamic_connectivity
+
+from .dynamic_spanning_tree import MSTMaintainer
+
+from .tree_queries import TreeQueryIndex
 
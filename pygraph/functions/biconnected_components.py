@@ -1,35 +1,25 @@
 """Implements functionality to find biconnected components."""
 
-from collections import deque, defaultdict
+from ..helpers import get_subgraph_from_edge_list, parallel_map, pack_subgraph, unpack_subgraph, batch_by_size
+from .connected_components import get_weakly_connected_components
+from .block_cut_tree import BlockCutTree
 
-from .connected_components import get_connected_components_as_subgraphs
-from ..helpers import get_subgraph_from_edge_list
 
-
-def find_biconnected_components(graph):
+def find_biconnected_components(graph, executor=None, workers=None):
     """Finds all the biconnected components in a graph.
     Returns a list of lists, each containing the edges that form a biconnected component.
     Returns an empty list for an empty graph.
+    Connected components can be searched in parallel with ''executor'' or ''workers'' (see ''parallel_map'').
     """
-
-    list_of_components = []
-
-    # Run the algorithm on each of the connected components of the graph
-    components = get_connected_components_as_subgraphs(graph)
-    for component in components:
-        # --Call the internal biconnnected components function to find
-        # --the edge lists for this particular connected component
-        edge_list = _internal_get_biconnected_components_edge_lists(component)
-        list_of_components.extend(edge_list)
-
-    return list_of_components
+    blocks, _ = __get_blocks_and_articulation_vertices(graph, executor, workers)
+    return _internal_filter_biconnected_components(graph, blocks)
 
 
-def find_biconnected_components_as_subgraphs(graph):
+def find_biconnected_components_as_subgraphs(graph, executor=None, workers=None):
     """Finds the biconnected components and returns them as subgraphs."""
     list_of_graphs = []
 
-    list_of_components = find_biconnected_components(graph)
+    list_of_components = find_biconnected_components(graph, executor, workers)
     for edge_list in list_of_components:
         subgraph = get_subgraph_from_edge_list(graph, edge_list)
         list_of_graphs.append(subgraph)
@@ -37,254 +27,223 @@ def find_biconnected_components_as_subgraphs(graph):
     return list_of_graphs
 
 
-def find_articulation_vertices(graph):
+def find_articulation_vertices(graph, executor=None, workers=None):
     """Finds all of the articulation vertices within a graph.
     Returns a list of all articulation vertices within the graph.
     Returns an empty list for an empty graph.
+    Connected components can be searched in parallel with ''executor'' or ''workers'' (see ''parallel_map'').
     """
-
-    articulation_vertices = []
-
-    all_nodes = graph.get_all_node_ids()
-    if len(all_nodes) == 0:
-        return articulation_vertices
-
-    # Run the algorithm on each of the connected components of the graph
-    components = get_connected_components_as_subgraphs(graph)
-    for component in components:
-        # --Call the internal articulation vertices function to find
-        # --the node list for this particular connected component
-        vertex_list = _internal_get_cut_vertex_list(component)
-        articulation_vertices.extend(vertex_list)
-
+    _, articulation_vertices = __get_blocks_and_articulation_vertices(graph, executor, workers)
     return articulation_vertices
 
 
-# Helper functions
-def _internal_get_biconnected_components_edge_lists(graph):
-    """Works on a single connected component to produce the edge lists of the biconnected components.
-    Returns a list of lists, each containing the edges that combine to produce the connected component.
-    Returns a single nested list with 1 edge if there is only 1 edge in the graph (a 2-node graph is a
-    special case, generally considered to be a biconnected graph).
-    Returns an empty list if there are no edges in the graph (i.e. if it's a single-node or empty graph).
+def find_biconnected_structure(graph, include_block_cut_tree=False, executor=None, workers=None):
+    """Finds the articulation vertices and the biconnected components of a graph with a single traversal,
+    for callers that need both.
+    Returns a tuple of (articulation_vertices, biconnected_components, block_cut_tree), where the first two
+    are the results of ''find_articulation_vertices'' and ''find_biconnected_components''. The block-cut tree
+    is only built if ''include_block_cut_tree'' is True, and is None otherwise.
+    Connected components can be searched in parallel with ''executor'' or ''workers'' (see ''parallel_map'').
     """
-    list_of_components = []
+    blocks, articulation_vertices = __get_blocks_and_articulation_vertices(graph, executor, workers)
+    biconnected_components = _internal_filter_biconnected_components(graph, blocks)
+    block_cut_tree = BlockCutTree(graph, blocks) if include_block_cut_tree else None
+    return articulation_vertices, biconnected_components, block_cut_tree
 
-    num_nodes = graph.num_nodes()
-    num_edges = graph.num_edges()
-    if num_nodes <= 2:
-        if num_edges == 1:
-            list_of_components.append(graph.get_all_edge_ids())
-        return list_of_components
 
-    dfs_count = 0
-    edge_stack = deque()
-    dfs_stack = deque()
-    visited = defaultdict(lambda: False)
-    parent = defaultdict(lambda: None)
-    depth = {}
-    low = {}
-    preorder_processed = defaultdict(lambda: False)
-    postorder_processed = defaultdict(lambda: False)
-
-    # We're simulating a recursive DFS with an explicit stack, since Python has a really small function stack
-    unvisited_nodes = set(graph.get_all_node_ids())
-    while len(unvisited_nodes) > 0:
-        # --Initialize the first stack frame, simulating the DFS call on the root node
-        u = unvisited_nodes.pop()
-        parent[u] = u
-        stack_frame = {
-            'u': u,
-            'v': None,
-            'remaining_children': graph.neighbors(u)
-        }
-        dfs_stack.appendleft(stack_frame)
-
-        while len(dfs_stack) > 0:
-            frame = dfs_stack.popleft()
-            u = frame['u']
-            v = frame['v']
-
-            if not visited[u]:
-                if u in unvisited_nodes:
-                    unvisited_nodes.remove(u)
-                visited[u] = True
-                dfs_count += 1
-                depth[u] = dfs_count
-                low[u] = depth[u]
-                if len(frame['remaining_children']) > 0:
-                    v = frame['remaining_children'].pop()
-                    frame['v'] = v
-
-            if v is None:
-                # --u has no neighbor nodes
-                continue
+def build_block_cut_tree(graph):
+    """Builds the block-cut tree of a graph.
+    Returns a BlockCutTree object.
+    """
+    blocks, _ = _internal_get_blocks_and_articulation_vertices(graph)
+    return BlockCutTree(graph, blocks)
 
-            if not preorder_processed[v]:
-                # --This is the preorder processing, done for each neighbor node ''v'' of u
-                node_v = graph.get_node(v)
-                for edge_id in node_v['edges']:
-                    edge = graph.get_edge(edge_id)
-                    tpl_a = (u, v)
-                    tpl_b = (v, u)
-                    if tpl_a == edge['vertices'] or tpl_b == edge['vertices']:
-                        edge_stack.appendleft(edge_id)
-                        break
-                parent[v] = u
-                preorder_processed[v] = True
-                # print 'preorder for {}'.format(v)
-                dfs_stack.appendleft(frame)
-
-                # --Simulate the recursion to call the DFS on v
-                new_frame = {
-                    'u': v,
-                    'v': None,
-                    'remaining_children': graph.neighbors(v)
-                }
-                dfs_stack.appendleft(new_frame)
-                continue
 
-            elif not postorder_processed[v] and u == parent[v]:
-                # --This is the postorder processing, done for each neighbor node ''v'' of u
-                if low[v] >= depth[u]:
-                    component = output_component(graph, edge_stack, u, v)
-                    if len(component) > 2:
-                        # --You can't have a biconnected component with less than 3 edges
-                        list_of_components.append(component)
-                low[u] = min(low[u], low[v])
-                postorder_processed[v] = True
-                # print 'postorder for {}'.format(v)
-
-            elif visited[v] and (parent[u] != v) and (depth[v] < depth[u]):
-                # (u,v) is a backedge from u to its ancestor v
-                node_v = graph.get_node(v)
-                for edge_id in node_v['edges']:
-                    edge = graph.get_edge(edge_id)
-                    tpl_a = (u, v)
-                    tpl_b = (v, u)
-                    if tpl_a == edge['vertices'] or tpl_b == edge['vertices']:
-                        edge_stack.appendleft(edge_id)
-                        break
-                low[u] = min(low[u], depth[v])
+# Helper functions
+def __get_blocks_and_articulation_vertices(graph, executor, workers):
+    """Finds the blocks and articulation vertices of the graph, searching its connected components
+    across worker processes if asked to."""
+    if executor is None and (workers is None or workers <= 1):
+        return _internal_get_blocks_and_articulation_vertices(graph)
+
+    # --Sort the edges into their connected components; components without any edges have no blocks
+    # --The search treats directed edges as undirected, so directed graphs are split into their weak components
+    component_of = {}
+    list_of_components = get_weakly_connected_components(graph)
+    for index, component in enumerate(list_of_components):
+        for node_id in component:
+            component_of[node_id] = index
+    component_edges = [[] for _ in list_of_components]
+    for edge_id in graph.get_all_edge_ids():
+        node_a, _ = graph.get_edge(edge_id)['vertices']
+        component_edges[component_of[node_a]].append(edge_id)
+    component_edges = [edge_list for edge_list in component_edges if len(edge_list) > 0]
+
+    # --Ship the components in compact form, batching small ones together
+    packed_subgraphs = [pack_subgraph(graph, edge_list) for edge_list in component_edges]
+    batches = batch_by_size(packed_subgraphs, [len(edge_list) for edge_list in component_edges])
+    batch_results = parallel_map(_blocks_and_articulation_vertices_task, batches,
+                                 executor=executor, workers=workers)
+
+    blocks = []
+    articulation_vertices = []
+    for batch_result in batch_results:
+        for component_blocks, component_articulation_vertices in batch_result:
+            blocks.extend(component_blocks)
+            articulation_vertices.extend(component_articulation_vertices)
 
-            if len(frame['remaining_children']) > 0:
-                # --Continue onto the next neighbor node of u
-                v = frame['remaining_children'].pop()
-                frame['v'] = v
-                dfs_stack.appendleft(frame)
+    return blocks, articulation_vertices
 
-    return list_of_components
 
+def _blocks_and_articulation_vertices_task(packed_subgraphs):
+    """Worker task: finds the blocks and articulation vertices of each packed subgraph in a batch."""
+    return [_internal_get_blocks_and_articulation_vertices(unpack_subgraph(packed_subgraph))
+            for packed_subgraph in packed_subgraphs]
 
-def output_component(graph, edge_stack, u, v):
-    """Helper function to pop edges off the stack and produce a list of them."""
-    edge_list = []
-    while len(edge_stack) > 0:
-        edge_id = edge_stack.popleft()
-        edge_list.append(edge_id)
 
-        edge = graph.get_edge(edge_id)
-        tpl_a = (u, v)
-        tpl_b = (v, u)
-        if tpl_a == edge['vertices'] or tpl_b == edge['vertices']:
-            break
+def _internal_filter_biconnected_components(graph, blocks):
+    """Picks out the blocks that count as biconnected components: those with at least 3 edges,
+    and single edges that make up an entire connected component.
+    """
+    list_of_components = []
+    degree = None
+
+    for block in blocks:
+        if len(block) > 2:
+            list_of_components.append(block)
+        elif len(block) == 1:
+            # --A lone edge only counts when it makes up its entire connected component
+            # --(a 2-node graph is a special case, generally considered to be a biconnected graph)
+            if degree is None:
+                degree = _count_incident_edges(graph)
+            node_a, node_b = graph.get_edge(block[0])['vertices']
+            if degree[node_a] == 1 and degree[node_b] == 1:
+                list_of_components.append(block)
 
-    return edge_list
+    return list_of_components
 
 
-def _internal_get_cut_vertex_list(graph):
-    """Works on a single connected component to produce the node list of cut vertices.
-    Returns a list of nodes.
-    Returns an empty list if there are no nodes in the graph (i.e. if it's an empty graph).
+def _count_incident_edges(graph):
+    """Counts the edges incident to each node, from the edge objects so that the in-edges
+    of a directed graph are counted too."""
+    degree = dict((node_id, 0) for node_id in graph.get_all_node_ids())
+    for edge in graph.get_all_edge_objects():
+        node_a, node_b = edge['vertices']
+        degree[node_a] += 1
+        if node_b != node_a:
+            degree[node_b] += 1
+    return degree
+
+
+def _get_incidence_lists(graph):
+    """Builds the list of edge ids incident to each node from the edge objects, so that directed graphs
+    are treated as undirected. Self-loops are left out, since they never affect biconnectivity."""
+    incidence = dict((node_id, []) for node_id in graph.get_all_node_ids())
+    for edge in graph.get_all_edge_objects():
+        node_a, node_b = edge['vertices']
+        if node_a != node_b:
+            incidence[node_a].append(edge['id'])
+            incidence[node_b].append(edge['id'])
+    return incidence
+
+
+def _internal_get_blocks_and_articulation_vertices(graph):
+    """Finds every block and articulation vertex of the graph in a single pass of the Hopcroft-Tarjan algorithm.
+    Returns a tuple of the list of blocks, each a list of edge ids, and the list of articulation vertices.
+    Unlike ''find_biconnected_components'', the blocks include those made of a single edge (bridges)
+    or of a pair of parallel edges. Self-loops don't belong to any block.
+    Runs in O(V + E) time: the search follows each node's edge list by edge id, so every edge is looked at
+    a constant number of times, and the tree edge into each node is known without searching for it.
+    Directed graphs are treated as undirected.
     """
-    list_of_cut_vertices = set()
-    if graph.num_nodes() == 0:
-        return list(list_of_cut_vertices)
+    blocks = []
+    articulation_vertices = []
+    is_articulation_vertex = set()
 
     dfs_count = 0
-    root_dfs_count = 1
-    dfs_stack = deque()
-    visited = defaultdict(lambda: False)
-    parent = defaultdict(lambda: None)
-    children = defaultdict(lambda: [])
     depth = {}
     low = {}
-    preorder_processed = defaultdict(lambda: False)
-    postorder_processed = defaultdict(lambda: False)
-
-    # We're simulating a recursive DFS with an explicit stack, since Python has a really small function stack
-    unvisited_nodes = set(graph.get_all_node_ids())
-    while len(unvisited_nodes) > 0:
-        # --Initialize the first stack frame, simulating the DFS call on the root node
-        u = unvisited_nodes.pop()
-        parent[u] = u
-        stack_frame = {
-            'u': u,
-            'v': None,
-            'remaining_children': graph.neighbors(u)
-        }
-        dfs_stack.appendleft(stack_frame)
-
-        while len(dfs_stack) > 0:
-            frame = dfs_stack.popleft()
-            u = frame['u']
-            v = frame['v']
-
-            if not visited[u]:
-                if u in unvisited_nodes:
-                    unvisited_nodes.remove(u)
-                visited[u] = True
-                dfs_count += 1
-                depth[u] = dfs_count
-                low[u] = depth[u]
-                if len(frame['remaining_children']) > 0:
-                    v = frame['remaining_children'].pop()
-                    frame['v'] = v
-
-            if v is None:
-                # --u has no neighbor nodes
+    edge_stack = []
+    incidence = _get_incidence_lists(graph)
+
+    # We're simulating a recursive DFS with an explicit stack, since Python has a really small function stack;
+    # --each frame is held across parallel lists: the node, the tree edge into it, its edge list
+    # --and the next position in it
+    node_stack = []
+    parent_edge_stack = []
+    edge_list_stack = []
+    position_stack = []
+
+    for root in graph.get_all_node_ids():
+        if root in depth:
+            continue
+        dfs_count += 1
+        depth[root] = low[root] = dfs_count
+        node_stack.append(root)
+        parent_edge_stack.append(None)
+        edge_list_stack.append(incidence[root])
+        position_stack.append(0)
+        # --The root is an articulation vertex iff it has multiple children, each of which closes a block at the root
+        root_blocks = 0
+
+        while len(node_stack) > 0:
+            u = node_stack[-1]
+            incident_edges = edge_list_stack[-1]
+            position = position_stack[-1]
+
+            if position < len(incident_edges):
+                position_stack[-1] = position + 1
+                edge_id = incident_edges[position]
+                if edge_id == parent_edge_stack[-1]:
+                    continue
+                a, b = graph.get_edge(edge_id)['vertices']
+                v = b if a == u else a
+                if v not in depth:
+                    # (u,v) is a tree edge; simulate the recursive call on v
+                    edge_stack.append(edge_id)
+                    dfs_count += 1
+                    depth[v] = low[v] = dfs_count
+                    node_stack.append(v)
+                    parent_edge_stack.append(edge_id)
+                    edge_list_stack.append(incidence[v])
+                    position_stack.append(0)
+                elif depth[v] < depth[u]:
+                    # (u,v) is a backedge from u to its ancestor v
+                    edge_stack.append(edge_id)
+                    if depth[v] < low[u]:
+                        low[u] = depth[v]
+                # --Otherwise v is a descendant of u, and the edge was already seen from v's end
                 continue
 
-            if not preorder_processed[v]:
-                # --This is the preorder processing, done for each neighbor node ''v'' of u
-                parent[v] = u
-                children[u].append(v)
-                preorder_processed[v] = True
-                # print 'preorder for {}'.format(v)
-                dfs_stack.appendleft(frame)
-
-                # --Simulate the recursion to call the DFS on v
-                new_frame = {
-                    'u': v,
-                    'v': None,
-                    'remaining_children': graph.neighbors(v)
-                }
-                dfs_stack.appendleft(new_frame)
+            # --All of u's edges have been explored, so return from the call on u
+            node_stack.pop()
+            parent_edge = parent_edge_stack.pop()
+            edge_list_stack.pop()
+            position_stack.pop()
+            if parent_edge is None:
                 continue
 
-            elif not postorder_processed[v] and u == parent[v]:
-                # --This is the postorder processing, done for each neighbor node ''v'' of u
-                if low[v] >= depth[u] and depth[u] > 1:
-                    list_of_cut_vertices.add(u)
-                low[u] = min(low[u], low[v])
-                postorder_processed[v] = True
-                # print 'postorder for {}'.format(v)
-
-            elif visited[v] and (parent[u] != v) and (depth[v] < depth[u]):
-                # (u,v) is a backedge from u to its ancestor v
-                low[u] = min(low[u], depth[v])
-
-            if len(frame['remaining_children']) > 0:
-                # --Continue onto the next neighbor node of u
-                v = frame['remaining_children'].pop()
-                frame['v'] = v
-                dfs_stack.appendleft(frame)
-
-    # The root node gets special treatment; it's a cut vertex iff it has multiple children
-    if len(children[root_dfs_count]) > 1:
-        for node_id, dfs in list(depth.items()):
-            if dfs == root_dfs_count:
-                list_of_cut_vertices.add(node_id)
-                break
-
-    return list(list_of_cut_vertices)
\ No newline at end of file
+            parent = node_stack[-1]
+            if low[u] < low[parent]:
+                low[parent] = low[u]
+            if low[u] >= depth[parent]:
+                # --parent separates u's subtree from the rest of the graph,
+                # --so the edges above the tree edge form a block
+                block = []
+                while True:
+                    edge_id = edge_stack.pop()
+                    block.append(edge_id)
+                    if edge_id == parent_edge:
+                        break
+                blocks.append(block)
+
+                if parent == root:
+                    root_blocks += 1
+                elif parent not in is_articulation_vertex:
+                    is_articulation_vertex.add(parent)
+                    articulation_vertices.append(parent)
+
+        if root_blocks > 1:
+            articulation_vertices.append(root)
+
+    return blocks, articulation_vertices
@@ -0,0 +1,119 @@
+"""Implements the block-cut tree of a graph, for answering queries about cut vertices."""
+
+from collections import defaultdict
+
+from ..classes import UndirectedGraph
+from ..exceptions import NonexistentNodeError
+from .tree_queries import TreeQueryIndex
+
+
+class BlockCutTree(object):
+    """The block-cut tree of a graph: a forest with a node for every block and every articulation vertex,
+    joining each articulation vertex to the blocks that contain it.
+    Every block is included, bridges among them; a node without any edges forms a block of its own, with no edges.
+    The tree is a snapshot and does not follow later changes to the graph.
+
+    Attributes:
+        * tree:                the block-cut forest, as an UndirectedGraph; the data of each of its nodes holds
+                               either a 'block' index or an 'articulation' vertex id
+        * blocks:              a list of the blocks, each a list of edge ids; blocks are referred to by their index here
+        * node_blocks:         a dict from each node of the graph to the list of blocks that contain it
+        * articulation_blocks: a dict from each articulation vertex to the list of blocks that contain it
+    """
+
+    def __init__(self, graph, blocks):
+        self.blocks = list(blocks)
+        self.node_blocks = defaultdict(list)
+        for index, block in enumerate(self.blocks):
+            block_nodes = set()
+            for edge_id in block:
+                block_nodes.update(graph.get_edge(edge_id)['vertices'])
+            for n in block_nodes:
+                self.node_blocks[n].append(index)
+        for n in graph.get_all_node_ids():
+            if n not in self.node_blocks:
+                self.node_blocks[n].append(len(self.blocks))
+                self.blocks.append([])
+        self.node_blocks = dict(self.node_blocks)
+
+        # A node is an articulation vertex exactly when it belongs to more than one block
+        self.articulation_blocks = dict((n, block_list) for n, block_list in self.node_blocks.items()
+                                        if len(block_list) > 1)
+
+        self.tree = UndirectedGraph()
+        self.__block_tree_nodes = []
+        for index in range(len(self.blocks)):
+            tree_node = self.tree.new_node()
+            self.tree.get_node(tree_node)['data']['block'] = index
+            self.__block_tree_nodes.append(tree_node)
+        self.__articulation_tree_nodes = {}
+        for n, block_list in self.articulation_blocks.items():
+            tree_node = self.tree.new_node()
+            self.tree.get_node(tree_node)['data']['articulation'] = n
+            self.__articulation_tree_nodes[n] = tree_node
+            for index in block_list:
+                self.tree.new_edge(tree_node, self.__block_tree_nodes[index])
+
+        self.__index = TreeQueryIndex(self.tree, self.tree.get_all_edge_ids(), key=lambda edge: 1)
+
+    def num_blocks(self):
+        """Returns the number of blocks."""
+        return len(self.blocks)
+
+    def get_articulation_vertices(self):
+        """Returns a list of the articulation vertices of the graph."""
+        return list(self.articulation_blocks)
+
+    def is_articulation_vertex(self, node_id):
+        """Determines whether removing the node would split its connected component."""
+        self.__verify_node(node_id)
+        return node_id in self.articulation_blocks
+
+    def blocks_of(self, node_id):
+        """Returns the list of blocks that contain the node."""
+        self.__verify_node(node_id)
+        return self.node_blocks[node_id]
+
+    def separates(self, node_x, node_a, node_b):
+        """Determines whether removing node_x disconnects node_a from node_b.
+        Returns False if node_a and node_b are not connected to begin with, or if either of them is node_x.
+        Takes O(log n) time.
+        """
+        tree_node_x = self.__articulation_tree_nodes.get(node_x)
+        tree_node_a = self.__tree_node_of(node_a)
+        tree_node_b = self.__tree_node_of(node_b)
+        if tree_node_x is None or node_x in (node_a, node_b):
+            return False
+        if not self.__index.same_tree(tree_node_a, tree_node_b):
+            return False
+        return self.__index.is_on_path(tree_node_x, tree_node_a, tree_node_b)
+
+    def blocks_on_path(self, node_a, node_b):
+        """Returns the list of blocks that every path from node_a to node_b passes through, in order.
+        Raises a DisconnectedGraphError if the nodes are not connected.
+        """
+        path = self.__index.path_nodes(self.__tree_node_of(node_a), self.__tree_node_of(node_b))
+        return [self.tree.get_node(tree_node)['data']['block'] for tree_node in path
+                if 'block' in self.tree.get_node(tree_node)['data']]
+
+    def articulation_vertices_on_path(self, node_a, node_b):
+        """Returns the list of articulation vertices that every path from node_a to node_b passes through, in order.
+        The ends themselves are included when they are articulation vertices.
+        Raises a DisconnectedGraphError if the nodes are not connected.
+        """
+        path = self.__index.path_nodes(self.__tree_node_of(node_a), self.__tree_node_of(node_b))
+        return [self.tree.get_node(tree_node)['data']['articulation'] for tree_node in path
+                if 'articulation' in self.tree.get_node(tree_node)['data']]
+
+    def __tree_node_of(self, node_id):
+        """Returns the tree node that stands for a graph node: its own articulation node, or else its only block."""
+        self.__verify_node(node_id)
+        tree_node = self.__articulation_tree_nodes.get(node_id)
+        if tree_node is None:
+            tree_node = self.__block_tree_nodes[self.node_blocks[node_id][0]]
+        return tree_node
+
+    def __verify_node(self, node_id):
+        """Raises an error if the node is not part of the graph the tree was built from."""
+        if node_id not in self.node_blocks:
+            raise NonexistentNodeError(node_id)
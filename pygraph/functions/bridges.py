@@ -0,0 +1,111 @@
+"""Implements functionality to find bridges and 2-edge-connected components."""
+
+from .biconnected_components import _get_incidence_lists
+
+def find_bridges(graph):
+    """Finds all the bridges in a graph: the edges whose removal would split their connected component.
+    Returns a list of edge ids.
+    Returns an empty list for an empty graph.
+    """
+    bridges, _ = _internal_get_bridges_and_components(graph)
+    return bridges
+
+
+def find_2_edge_connected_components(graph):
+    """Finds all the 2-edge-connected components of a graph: the groups of nodes that stay connected
+    after removing any single edge.
+    Returns a list of lists, each containing the nodes that form a 2-edge-connected component.
+    Returns an empty list for an empty graph.
+    """
+    _, components = _internal_get_bridges_and_components(graph)
+    return components
+
+
+# Helper functions
+def _internal_get_bridges_and_components(graph):
+    """Finds the bridges and the 2-edge-connected components together, in a single lowpoint depth-first search.
+    Returns a tuple of the list of bridge edge ids and the list of component node lists.
+    The search skips the tree edge into each node by its edge id rather than by the parent node,
+    so a pair of parallel edges is correctly treated as a cycle. Runs in O(V + E) time.
+    Directed graphs are treated as undirected.
+    """
+    bridges = []
+    components = []
+
+    dfs_count = 0
+    depth = {}
+    low = {}
+    # --Nodes are pushed here as they are discovered; a bridge's subtree is popped off as one component
+    node_stack = []
+    incidence = _get_incidence_lists(graph)
+
+    # We're simulating a recursive DFS with an explicit stack, since Python has a really small function stack;
+    # --each frame is held across parallel lists: the node, the tree edge into it, its edge list
+    # --and the next position in it
+    frame_node_stack = []
+    parent_edge_stack = []
+    edge_list_stack = []
+    position_stack = []
+
+    for root in graph.get_all_node_ids():
+        if root in depth:
+            continue
+        dfs_count += 1
+        depth[root] = low[root] = dfs_count
+        node_stack.append(root)
+        frame_node_stack.append(root)
+        parent_edge_stack.append(None)
+        edge_list_stack.append(incidence[root])
+        position_stack.append(0)
+
+        while len(frame_node_stack) > 0:
+            u = frame_node_stack[-1]
+            incident_edges = edge_list_stack[-1]
+            position = position_stack[-1]
+
+            if position < len(incident_edges):
+                position_stack[-1] = position + 1
+                edge_id = incident_edges[position]
+                if edge_id == parent_edge_stack[-1]:
+                    continue
+                a, b = graph.get_edge(edge_id)['vertices']
+                v = b if a == u else a
+
+                if v not in depth:
+                    # (u,v) is a tree edge; simulate the recursive call on v
+                    dfs_count += 1
+                    depth[v] = low[v] = dfs_count
+                    node_stack.append(v)
+                    frame_node_stack.append(v)
+                    parent_edge_stack.append(edge_id)
+                    edge_list_stack.append(incidence[v])
+                    position_stack.append(0)
+                elif depth[v] < low[u]:
+                    # (u,v) is a backedge
+                    low[u] = depth[v]
+                continue
+
+            # --All of u's edges have been explored, so return from the call on u
+            frame_node_stack.pop()
+            parent_edge = parent_edge_stack.pop()
+            edge_list_stack.pop()
+            position_stack.pop()
+            if parent_edge is not None:
+                parent = frame_node_stack[-1]
+                if low[u] < low[parent]:
+                    low[parent] = low[u]
+                if low[u] <= depth[parent]:
+                    # --Some edge from u's subtree reaches the parent or above, so the tree edge lies on a cycle
+                    continue
+                bridges.append(parent_edge)
+
+            # --Either the tree edge into u is a bridge, or u is the root: u's remaining subtree is a component
+            component = []
+            while True:
+                n = node_stack.pop()
+                component.append(n)
+                if n == u:
+                    break
+            components.append(component)
+
+    return bridges, components
@@ -1,8 +1,16 @@
 """Implements finding connected components."""
 
-from collections import deque
+from array import array
+from collections import deque, defaultdict
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..classes import DirectedGraph
 from ..helpers import make_subgraph
+from ..exceptions import NonexistentNodeError
 
 
 def get_connected_components(graph):
@@ -48,22 +56,224 @@ def get_connected_components_as_subgraphs(graph):
     """
     components = get_connected_components(graph)
 
-    list_of_graphs = []
+    # Label each node with the index of its component
+    component_lookup = {}
+    for index, c in enumerate(components):
+        for n in c:
+            component_lookup[n] = index
 
-    for c in components:
-        edge_ids = set()
-        nodes = [graph.get_node(node) for node in c]
-        for n in nodes:
-            # --Loop through the edges in each node, to determine if it should be included
-            for e in n['edges']:
-                # --Only add the edge to the subgraph if both ends are in the subgraph
-                edge = graph.get_edge(e)
-                a, b = edge['vertices']
-                if a in c and b in c:
-                    edge_ids.add(e)
-        # --Build the subgraph and add it to the list
-        list_of_edges = list(edge_ids)
+    # Bucket the edges by component in a single sweep
+    # --Only add the edge to a component if both ends are in that component
+    edge_buckets = [[] for _ in components]
+    for edge in graph.get_all_edge_objects():
+        a, b = edge['vertices']
+        index = component_lookup[a]
+        if index == component_lookup[b]:
+            edge_buckets[index].append(edge['id'])
+
+    # Build the subgraphs directly from the buckets
+    list_of_graphs = []
+    for c, list_of_edges in zip(components, edge_buckets):
         subgraph = make_subgraph(graph, c, list_of_edges)
         list_of_graphs.append(subgraph)
 
     return list_of_graphs
+
+
+def get_strongly_connected_components(graph):
+    """Finds all strongly connected components of a directed graph, using an iterative version of Tarjan's algorithm.
+    Returns a list of lists, each containing the nodes that form a strongly connected component.
+    The components are listed in reverse topological order: no component has an edge into a later one.
+    Returns an empty list for an empty graph.
+    """
+    list_of_components = []
+
+    dfs_count = 0
+    depth = {}
+    low = {}
+    component_stack = []
+    on_component_stack = set()
+
+    # We're simulating a recursive DFS with an explicit stack, since Python has a really small function stack
+    for root in graph.get_all_node_ids():
+        if root in depth:
+            continue
+
+        depth[root] = low[root] = dfs_count
+        dfs_count += 1
+        component_stack.append(root)
+        on_component_stack.add(root)
+        dfs_stack = [(root, iter(graph.neighbors(root)))]
+
+        while len(dfs_stack) > 0:
+            u, remaining_children = dfs_stack[-1]
+            for v in remaining_children:
+                if v not in depth:
+                    # --Simulate the recursion to call the DFS on v
+                    depth[v] = low[v] = dfs_count
+                    dfs_count += 1
+                    component_stack.append(v)
+                    on_component_stack.add(v)
+                    dfs_stack.append((v, iter(graph.neighbors(v))))
+                    break
+                elif v in on_component_stack:
+                    low[u] = min(low[u], depth[v])
+            else:
+                # --All the children of u are done, so this is the postorder processing for u
+                dfs_stack.pop()
+                if len(dfs_stack) > 0:
+                    parent = dfs_stack[-1][0]
+                    low[parent] = min(low[parent], low[u])
+                if low[u] == depth[u]:
+                    # --u is the root of a strongly connected component, which sits on top of the component stack
+                    component = []
+                    while True:
+                        n = component_stack.pop()
+                        on_component_stack.remove(n)
+                        component.append(n)
+                        if n == u:
+                            break
+                    list_of_components.append(component)
+
+    return list_of_components
+
+
+def get_condensation_graph(graph):
+    """Builds the condensation of a directed graph: the acyclic graph with one node per strongly connected component.
+    Each node of the condensation lists the nodes of its component in its data, under the key 'nodes'.
+    There is a single edge between two condensation nodes if there is any edge between their components.
+    Returns a tuple containing the condensation graph and a dict mapping original node ids to condensation node ids.
+    """
+    condensation = DirectedGraph()
+    component_lookup = {}
+
+    for component in get_strongly_connected_components(graph):
+        component_id = condensation.new_node()
+        condensation.get_node(component_id)['data']['nodes'] = component
+        for n in component:
+            component_lookup[n] = component_id
+
+    # Determine the connections between components, ignoring duplicates and edges within a component
+    condensation_edges = set()
+    for edge in graph.get_all_edge_objects():
+        a, b = edge['vertices']
+        tpl = (component_lookup[a], component_lookup[b])
+        if tpl[0] != tpl[1] and tpl not in condensation_edges:
+            condensation_edges.add(tpl)
+            condensation.new_edge(*tpl)
+
+    return condensation, component_lookup
+
+
+def get_weakly_connected_components(graph):
+    """Finds all weakly connected components of a directed graph, treating each edge as if it were undirected.
+    Returns a list of lists, each containing the nodes that form a weakly connected component.
+    Returns an empty list for an empty graph.
+    """
+    list_of_components = []
+
+    # Build the predecessor lookup in a single sweep of the edges, rather than copying the graph into an undirected one
+    predecessors = defaultdict(list)
+    for edge in graph.get_all_edge_objects():
+        a, b = edge['vertices']
+        predecessors[b].append(a)
+
+    unreached = set(graph.get_all_node_ids())
+    for root in graph.get_all_node_ids():
+        if root not in unreached:
+            continue
+        unreached.remove(root)
+        component = [root]
+        to_explore = deque([root])
+
+        # This is the BFS that searches for connected vertices, in both edge directions
+        while len(to_explore) > 0:
+            n = to_explore.pop()
+            for m in graph.neighbors(n) + predecessors[n]:
+                if m in unreached:
+                    unreached.remove(m)
+                    component.append(m)
+                    to_explore.append(m)
+
+        list_of_components.append(component)
+
+    return list_of_components
+
+
+class ComponentIndex(object):
+    """A lookup table from nodes to their connected components, for answering bulk membership queries.
+    Components are numbered densely from 0, and the number of each node is held in an array indexed by node id,
+    so each lookup is a single array access. The index is a snapshot and does not follow later changes to the graph.
+    """
+
+    def __init__(self, graph):
+        self.__components = get_connected_components(graph)
+
+        node_ids = graph.get_all_node_ids()
+        size = max(node_ids) + 1 if node_ids else 0
+        self.__labels = array('l', [-1]) * size
+        self.__sizes = array('l', [len(c) for c in self.__components])
+        for label, c in enumerate(self.__components):
+            for n in c:
+                self.__labels[n] = label
+
+    def num_components(self):
+        """Returns the number of connected components."""
+        return len(self.__components)
+
+    def component_of(self, node_id):
+        """Returns the number of the component containing the node."""
+        label = self.__labels[node_id] if 0 <= node_id < len(self.__labels) else -1
+        if label < 0:
+            raise NonexistentNodeError(node_id)
+        return label
+
+    def component_nodes(self, label):
+        """Returns the list of nodes in the numbered component."""
+        return self.__components[label]
+
+    def same_component(self, pairs):
+        """Determines, for each (node_a, node_b) pair, whether the two nodes are in the same component.
+        Returns a list of booleans, in the same order as the pairs.
+        When NumPy is available, the whole batch is looked up at once through an array index.
+        """
+        if numpy is not None:
+            return self.__same_component_vectorized(pairs)
+
+        labels = self.__labels
+        size = len(labels)
+        results = []
+        for a, b in pairs:
+            label_a = labels[a] if 0 <= a < size else -1
+            label_b = labels[b] if 0 <= b < size else -1
+            if label_a < 0 or label_b < 0:
+                raise NonexistentNodeError(a if label_a < 0 else b)
+            results.append(label_a == label_b)
+        return results
+
+    def __same_component_vectorized(self, pairs):
+        """Answers a batch of ''same_component'' queries with NumPy array indexing."""
+        labels = numpy.asarray(self.__labels)
+        nodes = numpy.array(list(pairs), dtype=labels.dtype).reshape(-1, 2)
+
+        # --Out-of-range node ids get label -1, the same as deleted nodes
+        in_range = (nodes >= 0) & (nodes < len(labels))
+        node_labels = numpy.full(nodes.shape, -1, dtype=labels.dtype)
+        node_labels[in_range] = labels[nodes[in_range]]
+
+        missing = node_labels < 0
+        if missing.any():
+            # --Report the first missing node, in the same order as the loop would find it
+            raise NonexistentNodeError(int(nodes.ravel()[missing.ravel().argmax()]))
+        return (node_labels[:, 0] == node_labels[:, 1]).tolist()
+
+    def component_sizes(self):
+        """Returns an array holding the number of nodes in each component, indexed by component number."""
+        return array('l', self.__sizes)
+
+    def largest_component(self):
+        """Returns the list of nodes in the largest component, or an empty list for an empty graph."""
+        if not self.__components:
+            return []
+        largest = max(range(len(self.__sizes)), key=lambda label: self.__sizes[label])
+        return self.__components[largest]
@@ -0,0 +1,323 @@
+"""Implements connectivity structures that stay current as a graph changes."""
+
+from bisect import bisect_left
+from collections import defaultdict
+
+from ..classes import GraphObserver
+from ..helpers import IndexedDisjointSet, RollbackDisjointSet, EulerTourForest
+from ..exceptions import NonexistentNodeError, NonexistentEdgeError
+
+
+class IncrementalConnectivity(GraphObserver):
+    """Tracks the connected components of a graph as nodes and edges are added to it.
+    Attaching the tracker costs a single pass over the graph; after that, each new node or edge
+    and each query takes near-constant time. Edges are treated as undirected, so on a directed graph
+    the tracked components are the weakly connected components.
+    A union/find structure cannot split sets, so deleting an edge or node marks the tracker as stale,
+    and the next query rebuilds it from the graph.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.__build()
+        graph.add_observer(self)
+
+    def detach(self):
+        """Stops tracking changes to the graph."""
+        self.graph.remove_observer(self)
+
+    def connected(self, node_a, node_b):
+        """Determines whether node_a and node_b are in the same connected component."""
+        return self.component_of(node_a) == self.component_of(node_b)
+
+    def component_of(self, node_id):
+        """Returns a label for the connected component containing the node.
+        Nodes in the same component share the same label; labels may change when components merge.
+        """
+        self.__refresh()
+        try:
+            return self.__forest.find(node_id)
+        except KeyError:
+            raise NonexistentNodeError(node_id)
+
+    def num_components(self):
+        """Returns the current number of connected components."""
+        self.__refresh()
+        return len(self.__forest)
+
+    def on_new_node(self, node_id):
+        self.__forest.add(node_id)
+
+    def on_new_edge(self, edge_id, node_a, node_b):
+        self.__forest.union(node_a, node_b)
+
+    def on_delete_edge(self, edge_id, node_a, node_b):
+        self.__stale = True
+
+    def on_delete_node(self, node_id):
+        self.__stale = True
+
+    def __refresh(self):
+        """Rebuilds the tracker if a deletion has invalidated it."""
+        if self.__stale:
+            self.__build()
+
+    def __build(self):
+        """Builds the union/find forest from the current state of the graph."""
+        self.__forest = IndexedDisjointSet()
+        self.__stale = False
+        for node_id in self.graph.get_all_node_ids():
+            self.on_new_node(node_id)
+        for edge in self.graph.get_all_edge_objects():
+            self.on_new_edge(edge['id'], *edge['vertices'])
+
+
+class DynamicConnectivity(GraphObserver):
+    """Tracks the connected components of a graph as edges are both added and removed.
+    Implements the Holm, de Lichtenberg and Thorup structure: every edge has a level, and each level
+    keeps a spanning forest of the edges at or above it as Euler tour trees. Adding or removing an edge
+    takes O(log^2 n) amortized time and a connectivity query takes O(log n) time.
+    Edges are treated as undirected, so on a directed graph the tracked components are the weakly
+    connected components.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.__forests = []
+        self.__non_tree_edges = []
+        self.__edge_lookup = {}
+        self.__node_ids = set()
+        self.__num_components = 0
+
+        for node_id in graph.get_all_node_ids():
+            self.on_new_node(node_id)
+        for edge in graph.get_all_edge_objects():
+            self.on_new_edge(edge['id'], *edge['vertices'])
+        graph.add_observer(self)
+
+    def detach(self):
+        """Stops tracking changes to the graph."""
+        self.graph.remove_observer(self)
+
+    def connected(self, node_a, node_b):
+        """Determines whether node_a and node_b are in the same connected component."""
+        self.__verify_node(node_a)
+        self.__verify_node(node_b)
+        return self.__forest(0).connected(node_a, node_b)
+
+    def component_size(self, node_id):
+        """Returns the number of nodes in the connected component containing the node."""
+        self.__verify_node(node_id)
+        return self.__forest(0).tree_size(node_id)
+
+    def num_components(self):
+        """Returns the current number of connected components."""
+        return self.__num_components
+
+    def on_new_node(self, node_id):
+        self.__node_ids.add(node_id)
+        self.__num_components += 1
+
+    def on_new_edge(self, edge_id, node_a, node_b):
+        # --Edge records hold: [node_a, node_b, level, is_tree_edge]
+        record = [node_a, node_b, 0, False]
+        self.__edge_lookup[edge_id] = record
+        if node_a == node_b:
+            # --Self-loops never affect connectivity
+            return
+
+        forest = self.__forest(0)
+        if forest.connected(node_a, node_b):
+            self.__add_non_tree_edge(edge_id, record)
+        else:
+            record[3] = True
+            forest.link(node_a, node_b, edge_id)
+            forest.set_edge_flag(edge_id, True)
+            self.__num_components -= 1
+
+    def on_delete_edge(self, edge_id, node_a, node_b):
+        record = self.__edge_lookup.pop(edge_id)
+        node_a, node_b, level, is_tree_edge = record
+        if node_a == node_b:
+            return
+        if not is_tree_edge:
+            self.__remove_non_tree_edge(edge_id, record)
+            return
+
+        for i in range(level + 1):
+            self.__forests[i].cut(edge_id)
+
+        # Look for a replacement edge, starting at the level of the deleted edge and working down
+        for i in range(level, -1, -1):
+            if self.__replace(node_a, node_b, i):
+                return
+        self.__num_components += 1
+
+    def on_delete_node(self, node_id):
+        # --All the edges of the node have already been deleted, so it's an isolated node
+        self.__node_ids.remove(node_id)
+        self.__num_components -= 1
+        for forest in self.__forests:
+            forest.remove_vertex(node_id)
+
+    def __replace(self, node_a, node_b, level):
+        """Searches level ''level'' for an edge reconnecting the trees of node_a and node_b.
+        Returns whether such an edge was found and added to the forests."""
+        forest = self.__forest(level)
+        higher_forest = self.__forest(level + 1)
+
+        # --Work on the smaller of the two trees, so that promoting its edges preserves the size invariant
+        if forest.tree_size(node_a) > forest.tree_size(node_b):
+            node_a, node_b = node_b, node_a
+
+        # Push the tree edges of this level up a level; the smaller tree is small enough to fit there
+        edge_id = forest.find_flagged_edge(node_a)
+        while edge_id is not None:
+            record = self.__edge_lookup[edge_id]
+            forest.set_edge_flag(edge_id, False)
+            record[2] = level + 1
+            higher_forest.link(record[0], record[1], edge_id)
+            higher_forest.set_edge_flag(edge_id, True)
+            edge_id = forest.find_flagged_edge(node_a)
+
+        # Check the non-tree edges of this level: each one either reconnects the trees or gets pushed up a level
+        non_tree_edges = self.__non_tree_edges[level]
+        x = forest.find_flagged_vertex(node_a)
+        while x is not None:
+            for edge_id in list(non_tree_edges[x]):
+                record = self.__edge_lookup[edge_id]
+                self.__remove_non_tree_edge(edge_id, record)
+                other = record[1] if record[0] == x else record[0]
+                if forest.connected(other, node_a):
+                    record[2] = level + 1
+                    self.__add_non_tree_edge(edge_id, record)
+                else:
+                    record[3] = True
+                    for i in range(level + 1):
+                        self.__forests[i].link(record[0], record[1], edge_id)
+                    forest.set_edge_flag(edge_id, True)
+                    return True
+            x = forest.find_flagged_vertex(node_a)
+
+        return False
+
+    def __add_non_tree_edge(self, edge_id, record):
+        """Records a non-tree edge at its level."""
+        node_a, node_b, level, _ = record
+        forest = self.__forest(level)
+        non_tree_edges = self.__non_tree_edges[level]
+        for n in (node_a, node_b):
+            non_tree_edges[n].add(edge_id)
+            forest.set_vertex_flag(n, True)
+
+    def __remove_non_tree_edge(self, edge_id, record):
+        """Forgets a non-tree edge at its level."""
+        node_a, node_b, level, _ = record
+        forest = self.__forests[level]
+        non_tree_edges = self.__non_tree_edges[level]
+        for n in (node_a, node_b):
+            non_tree_edges[n].discard(edge_id)
+            if not non_tree_edges[n]:
+                del non_tree_edges[n]
+                forest.set_vertex_flag(n, False)
+
+    def __forest(self, level):
+        """Returns the spanning forest for a level, creating any missing levels."""
+        while len(self.__forests) <= level:
+            self.__forests.append(EulerTourForest())
+            self.__non_tree_edges.append(defaultdict(set))
+        return self.__forests[level]
+
+    def __verify_node(self, node_id):
+        """Raises an error if the node is not being tracked."""
+        if node_id not in self.__node_ids:
+            raise NonexistentNodeError(node_id)
+
+
+def offline_dynamic_connectivity(events):
+    """Answers connectivity queries against a timeline of edge insertions and deletions, all at once.
+    ''events'' is a sequence of tuples, processed in order:
+        * ('add', node_a, node_b):    adds an undirected edge between the nodes
+        * ('remove', node_a, node_b): removes one previously added edge between the nodes
+        * ('query', node_a, node_b):  asks whether the nodes are connected at that point in the timeline
+    Nodes can be any hashable values and don't need to be declared up front.
+    Returns a list with the answer (True or False) to each query, in order.
+    Runs in O((E + Q) log Q log n) time: each edge is attached to the O(log Q) nodes of a segment tree over
+    the queries that cover its lifetime, and a depth-first walk of the tree joins and rolls back the edges.
+    """
+    labels = {}
+    ds = RollbackDisjointSet()
+    queries = []
+    query_times = []
+    lifetimes = []
+    open_edges = defaultdict(list)
+
+    for time, (kind, node_a, node_b) in enumerate(events):
+        for n in (node_a, node_b):
+            if n not in labels:
+                labels[n] = ds.add_set()
+        key = (labels[node_a], labels[node_b]) if labels[node_a] < labels[node_b] else (labels[node_b], labels[node_a])
+        if kind == 'add':
+            open_edges[key].append(time)
+        elif kind == 'remove':
+            if not open_edges[key]:
+                raise NonexistentEdgeError((node_a, node_b))
+            lifetimes.append((labels[node_a], labels[node_b], open_edges[key].pop(), time))
+        elif kind == 'query':
+            queries.append((node_a, node_b))
+            query_times.append(time)
+        else:
+            raise ValueError('Unknown event type "{}"'.format(kind))
+
+    num_queries = len(queries)
+    if num_queries == 0:
+        return []
+
+    # Edges that are never removed stay until the end of the timeline
+    for (label_a, label_b), start_times in list(open_edges.items()):
+        for start in start_times:
+            lifetimes.append((label_a, label_b, start, len(events)))
+
+    # Attach each edge to the segment tree nodes that cover the queries it is alive for
+    size = 1
+    while size < num_queries:
+        size *= 2
+    segments = defaultdict(list)
+    for label_a, label_b, start, end in lifetimes:
+        low = bisect_left(query_times, start) + size
+        high = bisect_left(query_times, end) + size
+        pair = (label_a, label_b)
+        while low < high:
+            if low & 1:
+                segments[low].append(pair)
+                low += 1
+            if high & 1:
+                high -= 1
+                segments[high].append(pair)
+            low //= 2
+            high //= 2
+
+    # Walk the segment tree, joining the edges of each node on the way down and rolling them back on the way up
+    answers = [False] * num_queries
+    stack = [(1, True)]
+    while len(stack) > 0:
+        tree_node, entering = stack.pop()
+        if not entering:
+            for _ in segments.get(tree_node, ()):
+                ds.rollback()
+            continue
+
+        for label_a, label_b in segments.get(tree_node, ()):
+            ds.union(label_a, label_b)
+        stack.append((tree_node, False))
+
+        if tree_node >= size:
+            index = tree_node - size
+            if index < num_queries:
+                node_a, node_b = queries[index]
+                answers[index] = ds.find(labels[node_a]) == ds.find(labels[node_b])
+        else:
+            stack.append((2 * tree_node + 1, True))
+            stack.append((2 * tree_node, True))
+
+    return answers
@@ -0,0 +1,198 @@
+"""Implements a minimum spanning forest that stays current as a graph changes."""
+
+from collections import defaultdict, deque
+
+from ..classes import GraphObserver
+from ..helpers import LinkCutTree
+
+
+class MSTMaintainer(GraphObserver):
+    """Tracks a minimum spanning forest of a graph as edges are added, removed and repriced.
+    The forest is held in a link/cut tree, so adding an edge, or lowering the cost of any edge, takes
+    O(log n) amortized time: the new edge replaces the most expensive edge on the cycle it closes, if it is cheaper.
+    Raising the cost of a forest edge or removing it can only be repaired by finding the cheapest edge
+    that reconnects the two halves, which takes a search of the smaller half and the non-tree edges leaving it.
+    Edges are treated as undirected; equal costs are broken by edge id.
+    Edge costs must be changed through ''update_cost'', since the graph doesn't report them.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.__forest = LinkCutTree()
+        # --Both lookups map edge ids to their endpoints
+        self.__non_tree_edges = {}
+        self.__tree_edges = {}
+        # --The ids of the tree edges and non-tree edges at each node
+        self.__tree_incidence = defaultdict(set)
+        self.__non_tree_incidence = defaultdict(set)
+        self.__total_cost = 0
+
+        for edge in graph.get_all_edge_objects():
+            self.on_new_edge(edge['id'], *edge['vertices'])
+        graph.add_observer(self)
+
+    def detach(self):
+        """Stops tracking changes to the graph."""
+        self.graph.remove_observer(self)
+
+    def get_forest_edges(self):
+        """Returns a list of the edge ids in the current minimum spanning forest."""
+        return list(self.__tree_edges)
+
+    def is_forest_edge(self, edge_id):
+        """Determines whether the edge is part of the current minimum spanning forest."""
+        return edge_id in self.__tree_edges
+
+    def total_cost(self):
+        """Returns the total cost of the current minimum spanning forest."""
+        return self.__total_cost
+
+    def connected(self, node_a, node_b):
+        """Determines whether node_a and node_b are in the same tree of the forest."""
+        self.graph.get_node(node_a)
+        self.graph.get_node(node_b)
+        return self.__forest.connected(node_a, node_b)
+
+    def update_cost(self, edge_id, cost):
+        """Changes the cost of an edge in the graph, and updates the forest to match."""
+        edge = self.graph.get_edge(edge_id)
+        old_cost = edge['cost']
+        edge['cost'] = cost
+
+        if edge_id in self.__non_tree_edges:
+            if cost < old_cost:
+                node_a, node_b = self.__remove_non_tree_edge(edge_id)
+                self.__insert(edge_id, node_a, node_b)
+            return
+
+        self.__total_cost += cost - old_cost
+        self.__forest.set_edge_weight(edge_id, (cost, edge_id))
+        if cost > old_cost:
+            # The edge stays only if nothing cheaper reconnects the trees without it
+            node_a, node_b = self.__tree_edges[edge_id]
+            self.__remove_tree_edge(edge_id)
+            replacement = self.__find_replacement(node_a, node_b, (cost, edge_id))
+            if replacement is None:
+                self.__add_tree_edge(edge_id, node_a, node_b)
+            else:
+                self.__add_non_tree_edge(edge_id, node_a, node_b)
+                self.__promote(replacement)
+
+    def on_new_edge(self, edge_id, node_a, node_b):
+        self.__insert(edge_id, node_a, node_b)
+
+    def on_delete_edge(self, edge_id, node_a, node_b):
+        if edge_id in self.__non_tree_edges:
+            self.__remove_non_tree_edge(edge_id)
+            return
+
+        self.__remove_tree_edge(edge_id)
+        replacement = self.__find_replacement(node_a, node_b, None)
+        if replacement is not None:
+            self.__promote(replacement)
+
+    def on_delete_node(self, node_id):
+        # --All the edges of the node have already been deleted, so it's an isolated node
+        self.__forest.remove_vertex(node_id)
+
+    def __insert(self, edge_id, node_a, node_b):
+        """Adds an edge that isn't in the forest, swapping it in if it belongs there."""
+        forest = self.__forest
+        if node_a == node_b:
+            self.__add_non_tree_edge(edge_id, node_a, node_b)
+            return
+        if not forest.connected(node_a, node_b):
+            self.__add_tree_edge(edge_id, node_a, node_b)
+            return
+
+        # The new edge closes a cycle; it belongs in the forest only if it beats the most expensive edge on that cycle
+        heaviest = forest.path_max(node_a, node_b)
+        if self.__weight(edge_id) < forest.edge_weight(heaviest):
+            old_a, old_b = self.__tree_edges[heaviest]
+            self.__remove_tree_edge(heaviest)
+            self.__add_non_tree_edge(heaviest, old_a, old_b)
+            self.__add_tree_edge(edge_id, node_a, node_b)
+        else:
+            self.__add_non_tree_edge(edge_id, node_a, node_b)
+
+    def __find_replacement(self, node_a, node_b, limit):
+        """Finds the cheapest non-tree edge joining the now separate trees of node_a and node_b.
+        Only edges lighter than ''limit'' (if given) are considered. Returns the edge id, or None."""
+        side = self.__smaller_tree(node_a, node_b)
+
+        # Every non-tree edge lies within a single tree of the old forest, so an edge leaving the smaller side
+        # must lead to the other one
+        best_edge = None
+        best_weight = limit
+        for n in side:
+            for edge_id in self.__non_tree_incidence.get(n, ()):
+                x, y = self.__non_tree_edges[edge_id]
+                if x in side and y in side:
+                    continue
+                weight = self.__weight(edge_id)
+                if best_weight is None or weight < best_weight:
+                    best_edge = edge_id
+                    best_weight = weight
+        return best_edge
+
+    def __smaller_tree(self, node_a, node_b):
+        """Returns the set of nodes in the smaller of the trees containing node_a and node_b.
+        Searches both trees in lockstep, so the cost is proportional to the smaller tree."""
+        tree_edges = self.__tree_edges
+        tree_incidence = self.__tree_incidence
+        searches = [({node_a}, deque([node_a])), ({node_b}, deque([node_b]))]
+        while True:
+            for visited, to_explore in searches:
+                if len(to_explore) == 0:
+                    return visited
+                n = to_explore.popleft()
+                for edge_id in tree_incidence.get(n, ()):
+                    x, y = tree_edges[edge_id]
+                    m = y if x == n else x
+                    if m not in visited:
+                        visited.add(m)
+                        to_explore.append(m)
+
+    def __promote(self, edge_id):
+        """Moves a non-tree edge into the forest."""
+        node_a, node_b = self.__remove_non_tree_edge(edge_id)
+        self.__add_tree_edge(edge_id, node_a, node_b)
+
+    def __add_tree_edge(self, edge_id, node_a, node_b):
+        """Links an edge into the forest."""
+        self.__tree_edges[edge_id] = (node_a, node_b)
+        self.__tree_incidence[node_a].add(edge_id)
+        self.__tree_incidence[node_b].add(edge_id)
+        self.__total_cost += self.graph.get_edge(edge_id)['cost']
+        self.__forest.link(node_a, node_b, edge_id, self.__weight(edge_id))
+
+    def __remove_tree_edge(self, edge_id):
+        """Cuts an edge out of the forest."""
+        node_a, node_b = self.__tree_edges.pop(edge_id)
+        self.__discard_incidence(self.__tree_incidence, edge_id, node_a, node_b)
+        self.__total_cost -= self.__forest.edge_weight(edge_id)[0]
+        self.__forest.cut(edge_id)
+
+    def __add_non_tree_edge(self, edge_id, node_a, node_b):
+        """Records an edge that is not in the forest."""
+        self.__non_tree_edges[edge_id] = (node_a, node_b)
+        self.__non_tree_incidence[node_a].add(edge_id)
+        self.__non_tree_incidence[node_b].add(edge_id)
+
+    def __remove_non_tree_edge(self, edge_id):
+        """Forgets an edge that is not in the forest. Returns its endpoints."""
+        node_a, node_b = self.__non_tree_edges.pop(edge_id)
+        self.__discard_incidence(self.__non_tree_incidence, edge_id, node_a, node_b)
+        return node_a, node_b
+
+    def __discard_incidence(self, incidence, edge_id, node_a, node_b):
+        """Removes an edge from the incidence sets of its endpoints, dropping sets that become empty."""
+        for n in (node_a, node_b):
+            edges = incidence[n]
+            edges.discard(edge_id)
+            if not edges:
+                del incidence[n]
+
+    def __weight(self, edge_id):
+        """Returns the weight used to order an edge: its cost, with ties broken by edge id."""
+        return self.graph.get_edge(edge_id)['cost'], edge_id
@@ -1 +1 @@
-from .functions import is_planar
+from .functions import is_planar, find_planar_embedding, find_embedding_faces
@@ -1,22 +1,97 @@
 """Implements functions for planarity testing."""
 
 
-from ..connected_components import get_connected_components_as_subgraphs
-from ..biconnected_components import find_biconnected_components_as_subgraphs
+from ...classes import DirectedGraph
+from ...helpers import (get_vertices_from_edge_list, parallel_map, pack_subgraph, unpack_subgraph, batch_by_size,
+                        convert_graph_directed_to_undirected)
+from ..biconnected_components import find_biconnected_components
 from .kocay_algorithm import kocay_planarity_test
+from .lr_algorithm import lr_planarity_test, lr_planar_embedding
 
 
-def is_planar(graph):
-    """Determines whether a graph is planar or not."""
-    # Determine connected components as subgraphs; their planarity is independent of each other
-    connected_components = get_connected_components_as_subgraphs(graph)
-    for component in connected_components:
-        # Biconnected components likewise have independent planarity
-        biconnected_components = find_biconnected_components_as_subgraphs(component)
-        for bi_component in biconnected_components:
-            planarity = __is_subgraph_planar(bi_component)
-            if not planarity:
-                return False
+PLANARITY_METHODS = ('kocay', 'lr')
+
+
+def is_planar(graph, method='kocay', executor=None, workers=None):
+    """Determines whether a graph is planar or not.
+    ''method'' picks the planarity engine: 'kocay' (the default) or 'lr' (the left-right planarity test).
+    With the 'kocay' engine, the biconnected components can be tested in parallel with ''executor'' or ''workers''
+    (see ''parallel_map'').
+    The 'lr' engine runs in linear time on the whole graph and ignores them.
+    """
+    if method not in PLANARITY_METHODS:
+        raise ValueError('Unknown planarity method: {}'.format(method))
+    if method == 'lr':
+        return lr_planarity_test(graph)
+
+    if executor is not None or (workers is not None and workers > 1):
+        return __is_planar_parallel(graph, executor, workers)
+
+    # The biconnected components have independent planarity, as do the connected components they make up
+    # --They're rebuilt just as they are for the workers, since the Kocay test depends on the order of the graph
+    for edge_list in find_biconnected_components(graph):
+        bi_component = unpack_subgraph(pack_subgraph(graph, __get_simple_edge_list(graph, edge_list)))
+        planarity = __is_subgraph_planar(bi_component)
+        if not planarity:
+            return False
+    return True
+
+
+def __is_planar_parallel(graph, executor, workers):
+    """Internal function to test the biconnected components of a graph for planarity across worker processes."""
+    # --The cheap checks are made up front, so that only the components that need the full test are shipped out
+    packed_subgraphs = []
+    sizes = []
+    for edge_list in find_biconnected_components(graph, executor, workers):
+        edge_list = __get_simple_edge_list(graph, edge_list)
+        num_nodes = len(get_vertices_from_edge_list(graph, edge_list))
+        if num_nodes < 5:
+            continue
+        if len(edge_list) > 3*(num_nodes - 2):
+            return False
+        if len(edge_list) > 2*(num_nodes - 2) and __is_triangle_free(graph, edge_list):
+            return False
+        packed_subgraphs.append(pack_subgraph(graph, edge_list))
+        sizes.append(len(edge_list))
+
+    batches = batch_by_size(packed_subgraphs, sizes)
+    return all(parallel_map(_planarity_task, batches, executor=executor, workers=workers))
+
+
+def _planarity_task(packed_subgraphs):
+    """Worker task: determines whether every packed biconnected component in a batch is planar."""
+    for packed_subgraph in packed_subgraphs:
+        if not __is_subgraph_planar(unpack_subgraph(packed_subgraph)):
+            return False
+    return True
+
+
+def __get_simple_edge_list(graph, edge_list):
+    """Internal function to pick out the edges of the underlying simple graph of an edge list.
+    Parallel edges and self-loops don't affect planarity, but would throw off the edge count bound.
+    Of each set of parallel edges, the one with the lowest id is kept."""
+    edge_lookup = {}
+    for edge_id in edge_list:
+        node_a, node_b = graph.get_edge(edge_id)['vertices']
+        if node_a == node_b:
+            continue
+        pair = frozenset((node_a, node_b))
+        if pair not in edge_lookup or edge_id < edge_lookup[pair]:
+            edge_lookup[pair] = edge_id
+    return list(edge_lookup.values())
+
+
+def __is_triangle_free(graph, edge_list):
+    """Internal function to determine if the simple graph formed by an edge list has no triangles."""
+    neighbors = {}
+    for edge_id in edge_list:
+        node_a, node_b = graph.get_edge(edge_id)['vertices']
+        neighbors.setdefault(node_a, set()).add(node_b)
+        neighbors.setdefault(node_b, set()).add(node_a)
+    for edge_id in edge_list:
+        node_a, node_b = graph.get_edge(edge_id)['vertices']
+        if not neighbors[node_a].isdisjoint(neighbors[node_b]):
+            return False
     return True
 
 
@@ -35,7 +110,51 @@ def __is_subgraph_planar(graph):
     if num_edges > 3*(num_nodes - 2):
         return False
 
+    # --Every face of a planar graph without triangles has at least 4 sides, which tightens the bound to 2(n - 2)
+    if num_edges > 2*(num_nodes - 2) and __is_triangle_free(graph, graph.get_all_edge_ids()):
+        return False
+
     # --At this point, we have no choice but to run the calculation the hard way
+    # --The Kocay test follows the edges out of each node, so a directed graph is tested as undirected
+    if type(graph) is DirectedGraph:
+        graph = convert_graph_directed_to_undirected(graph)
     return kocay_planarity_test(graph)
 
 
+def find_planar_embedding(graph):
+    """Finds a planar embedding of a graph, as a rotation system.
+    Returns a dict mapping each node to the list of the edges around it, in clockwise order;
+    a self-loop is listed twice around its node. Returns None if the graph is not planar.
+    """
+    return lr_planar_embedding(graph)
+
+
+def find_embedding_faces(graph, embedding):
+    """Finds the faces of a planar embedding, as produced by ''find_planar_embedding''.
+    Returns a list of faces, each being the list of edges along its boundary.
+    """
+    # --Each edge shows up twice in the embedding, once for each of its ends
+    edge_positions = {}
+    for node_id, rotation in embedding.items():
+        for index, edge_id in enumerate(rotation):
+            edge_positions.setdefault(edge_id, []).append((node_id, index))
+
+    faces = []
+    visited = set()
+    for node_id, rotation in embedding.items():
+        for index in range(len(rotation)):
+            if (node_id, index) in visited:
+                continue
+            # Trace the face by crossing each edge and taking the next edge clockwise around the far end
+            face = []
+            position = (node_id, index)
+            while position not in visited:
+                visited.add(position)
+                current_node, current_index = position
+                edge_id = embedding[current_node][current_index]
+                face.append(edge_id)
+                end_a, end_b = edge_positions[edge_id]
+                other_node, other_index = end_b if end_a == position else end_a
+                position = (other_node, (other_index + 1) % len(embedding[other_node]))
+            faces.append(face)
+    return faces
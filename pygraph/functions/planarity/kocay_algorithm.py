@@ -3,8 +3,6 @@ Implementing planarity testing as per "The Hopcroft-Tarjan Planarity Algorithm"
 Location: http://www.combinatorialmath.ca/G&G/articles/planarity.pdf
 """
 
-from collections import deque
-
 from ..searching.depth_first_search import depth_first_search_with_parent_data
 
 
@@ -26,11 +24,12 @@ def kocay_planarity_test(graph):
     # We first have to calculate the DFS-tree of the graph, so we can calculate the edge weights to determine
     # the order of embedding of the branches
     adj = __calculate_adjacency_lists(graph)
-    dfs_data = __setup_dfs_data(graph, adj)
+    edge_table = __calculate_edge_table(graph)
+    dfs_data = __setup_dfs_data(graph, adj, edge_table)
 
     # Now that we have enough information to sort the edges, we should do so and then recalculate the DFS tree
     adj = __sort_adjacency_lists(dfs_data)
-    dfs_data = __setup_dfs_data(graph, adj)
+    dfs_data = __setup_dfs_data(graph, adj, edge_table)
 
     # We now have the information we need to calculate the branch points
     __branch_point_dfs(dfs_data)
@@ -42,27 +41,33 @@ def kocay_planarity_test(graph):
 
     return is_planar
 
-def __setup_dfs_data(graph, adj):
+def __setup_dfs_data(graph, adj, edge_table):
     """Sets up the dfs_data object, for consistency."""
     dfs_data = __get_dfs_data(graph, adj)
 
     dfs_data['graph'] = graph
     dfs_data['adj'] = adj
+    dfs_data['edge_table'] = edge_table
 
-    L1, L2 = __low_point_dfs(dfs_data)
-    dfs_data['lowpoint_1_lookup'] = L1
-    dfs_data['lowpoint_2_lookup'] = L2
+    L1, L2, subtree_size = __low_point_dfs(dfs_data)
+    dfs_data['lowpoint_1'] = L1
+    dfs_data['lowpoint_2'] = L2
+    dfs_data['subtree_size'] = subtree_size
 
     edge_weights = __calculate_edge_weights(dfs_data)
     dfs_data['edge_weights'] = edge_weights
 
+    weight_table, frond_table = __calculate_weight_and_frond_tables(dfs_data)
+    dfs_data['weight_table'] = weight_table
+    dfs_data['frond_table'] = frond_table
+
     return dfs_data
 
 
 def __low_point_dfs(dfs_data):
-    """Calculates the L1 and L2 for each vertex."""
-    L1, L2 = __get_all_lowpoints(dfs_data)
-    return (L1, L2)
+    """Calculates the L1 and L2 for each vertex, along with the size of its subtree."""
+    L1, L2, subtree_size = __get_all_lowpoints(dfs_data)
+    return (L1, L2, subtree_size)
 
 
 def __calculate_edge_weights(dfs_data):
@@ -84,12 +89,13 @@ def __sort_adjacency_lists(dfs_data):
     adjacency_lists = dfs_data['adj']
     edge_weights = dfs_data['edge_weights']
     edge_lookup = dfs_data['edge_lookup']
+    edge_table = dfs_data['edge_table']
 
     for node_id, adj_list in list(adjacency_lists.items()):
         node_weight_lookup = {}
         frond_lookup = {}
         for node_b in adj_list:
-            edge_id = dfs_data['graph'].get_first_edge_id_by_node_ids(node_id, node_b)
+            edge_id = edge_table[(node_id, node_b)]
             node_weight_lookup[node_b] = edge_weights[edge_id]
             frond_lookup[node_b] = 1 if edge_lookup[edge_id] == 'backedge' else 2
 
@@ -106,7 +112,8 @@ def __sort_adjacency_lists(dfs_data):
 
 
 def __branch_point_dfs(dfs_data):
-    """DFS that calculates the b(u) and N(u) lookups, and also reorders the adjacency lists."""
+    """DFS that calculates the b(u) and N(u) lookups, and also reorders the adjacency lists.
+    This is the BranchPtDFS function, as defined on page 14 of the paper."""
     u = dfs_data['ordering'][0]
     large_n = {}
     large_n[u] = 0
@@ -114,14 +121,44 @@ def __branch_point_dfs(dfs_data):
     stem[u] = u
     b = {}
     b[u] = 1
-    __branch_point_dfs_recursive(u, large_n, b, stem, dfs_data)
+
+    # We're simulating the recursive DFS with an explicit stack, since Python has a really small function stack;
+    # --each frame holds a node and the position of the next node to visit in its adjacency list
+    __reorder_branch_points(u, large_n, b, stem, dfs_data)
+    node_stack = [u]
+    position_stack = [0]
+    while len(node_stack) > 0:
+        u = node_stack[-1]
+        position = position_stack[-1]
+        if position == len(dfs_data['adj'][u]):
+            node_stack.pop()
+            position_stack.pop()
+            continue
+        position_stack[-1] = position + 1
+
+        v = dfs_data['adj'][u][position]
+        if a(v, dfs_data) == u:
+            b[v] = u
+            if position == 0:
+                b[v] = b[u]
+            elif wt(u, v, dfs_data) % 2 == 0:
+                large_n[v] = 0
+            else:
+                large_n[v] = 1
+            stem[u] = v
+            # --Simulate the recursive call on v
+            __reorder_branch_points(v, large_n, b, stem, dfs_data)
+            node_stack.append(v)
+            position_stack.append(0)
+
     dfs_data['N_u_lookup'] = large_n
     dfs_data['b_u_lookup'] = b
     return
 
 
-def __branch_point_dfs_recursive(u, large_n, b, stem, dfs_data):
-    """A recursive implementation of the BranchPtDFS function, as defined on page 14 of the paper."""
+def __reorder_branch_points(u, large_n, b, stem, dfs_data):
+    """Calculates N(v) for the branches at u, and moves the branch to be embedded first to the head of Adj[u].
+    This is the part of the BranchPtDFS function that runs when it is called on u, before it visits any child of u."""
     first_vertex = dfs_data['adj'][u][0]
     large_w = wt(u, first_vertex, dfs_data)
     if large_w % 2 == 0:
@@ -143,13 +180,10 @@ def __branch_point_dfs_recursive(u, large_n, b, stem, dfs_data):
                 if l2_v < b_u:
                     large_n[v] = 1
                 elif b_u != 1:
-                    #print stem
-                    #print dfs_data['lowpoint_2_lookup']
-                    #print b
                     xnode = stem[l2_v]
                     if large_n[xnode] != 0:
                         large_n[v] = large_n[xnode] + 1
-                    elif dfs_data['graph'].adjacent(u, L1(v, dfs_data)):
+                    elif (u, L1(v, dfs_data)) in dfs_data['edge_table']:
                         large_n[v] = 2
                     else:
                         large_n[v] = large_n[u]
@@ -164,19 +198,6 @@ def __branch_point_dfs_recursive(u, large_n, b, stem, dfs_data):
         # Move v_I to head of Adj[u]
         dfs_data['adj'][u].remove(v_I)
         dfs_data['adj'][u].insert(0, v_I)
-    first_time = True
-    for v in dfs_data['adj'][u]:
-        if a(v, dfs_data) == u:
-            b[v] = u
-            if first_time:
-                b[v] = b[u]
-            elif wt(u, v, dfs_data) % 2 == 0:
-                large_n[v] = 0
-            else:
-                large_n[v] = 1
-            stem[u] = v
-            __branch_point_dfs_recursive(v, large_n, b, stem, dfs_data)
-        first_time = False
     return
 
 
@@ -202,64 +223,48 @@ def __embed_branch(dfs_data):
     #for node in dfs_data['ordering']:
         #print '{}: {}'.format(node, dfs_data['adj'][node])
 
-    nonplanar = __embed_branch_recursive(u, dfs_data)
-
-    #print "Nonplanar:", nonplanar
+    nonplanar = __embed_branch_dfs(u, dfs_data)
 
     return not nonplanar
 
 
-def __embed_branch_recursive(u, dfs_data):
-    """A recursive implementation of the EmbedBranch function, as defined on pages 8 and 22 of the paper."""
-    #print "\nu: {}\nadj: {}".format(u, dfs_data['adj'][u])
-
-    #print 'Pre-inserts'
-    #print "FG: {}".format(dfs_data['FG'])
-    #print "LF: {}".format(dfs_data['LF'])
-    #print "RF: {}".format(dfs_data['RF'])
-
-    for v in dfs_data['adj'][u]:
-        #print "\nu, v: {}, {}".format(u, v)
-        #print "dfs_u, dfs_v: {}, {}".format(D(u, dfs_data), D(v, dfs_data))
-        nonplanar = True
+def __embed_branch_dfs(u, dfs_data):
+    """The EmbedBranch function, as defined on pages 8 and 22 of the paper, run from u. Returns whether the graph
+    was found to be nonplanar."""
+    # We're simulating the recursive DFS with an explicit stack, since Python has a really small function stack;
+    # --each frame holds a node and the position of the next node to visit in its adjacency list
+    node_stack = [u]
+    position_stack = [0]
+    while len(node_stack) > 0:
+        u = node_stack[-1]
+        position = position_stack[-1]
+        if position == len(dfs_data['adj'][u]):
+            node_stack.pop()
+            position_stack.pop()
+            continue
+        position_stack[-1] = position + 1
+
+        v = dfs_data['adj'][u][position]
         if a(v, dfs_data) == u:
-            #print 'Ancestor block entered:', u, v
             if b(v, dfs_data) == u:
                 successful = __insert_branch(u, v, dfs_data)
                 if not successful:
-                    #print 'InsertBranch({}, {}) Failed'.format(u, v)
-                    nonplanar = True
-                    return nonplanar
-            nonplanar = __embed_branch_recursive(v, dfs_data)
-            if nonplanar:
-                return nonplanar
+                    return True
+            # --Simulate the recursive call on v
+            node_stack.append(v)
+            position_stack.append(0)
         elif is_frond(u, v, dfs_data):
-            #print 'Frond block entered:', u, v
             successful = __embed_frond(u, v, dfs_data)
             if not successful:
-                #print 'EmbedFrond({}, {}) Failed'.format(u, v)
-                nonplanar = True
-                return nonplanar
-
-            #print 'Post EmbedFrond'
-            #print "FG: {}".format(dfs_data['FG'])
-            #print "LF: {}".format(dfs_data['LF'])
-            #print "RF: {}".format(dfs_data['RF'])
+                return True
         else:
             # This block is totally valid, and there will be multiple cases when it gets hit.
             # We only want to do things if an edge is a tree edge (parent to child along the spine of the DFS tree),
             # or if it's a frond edge (an edge moving up the tree from lower along the spine).
             # Every non-tree edge will eventually get handled by the frond edge code as we recurse up the spine.
             pass
-    #print "{}: Should be planar".format(u)
-
-    #print 'Post-inserts'
-    #print "FG: {}".format(dfs_data['FG'])
-    #print "LF: {}".format(dfs_data['LF'])
-    #print "RF: {}".format(dfs_data['RF'])
 
-    nonplanar = False
-    return nonplanar
+    return False
 
 
 def __insert_branch(u, v, dfs_data):
@@ -710,7 +715,7 @@ def __check_conflict_fronds(x, y, w, z, dfs_data):
             t = z
         # --Run the rest of the tests
         if b(x, dfs_data) == u and y < u and \
-                (x, y) in __dfsify_branch_uv(u, t, dfs_data):
+                __is_frond_in_branch_uv(x, y, u, t, dfs_data):
             return True
         return False
 
@@ -718,24 +723,26 @@ def __check_conflict_fronds(x, y, w, z, dfs_data):
     return False
 
 
-def __dfsify_branch_uv(u, v, dfs_data):
-    """Helper function to convert the output of Bu(v) from edge ids to dfs-ordered fronds."""
-    buv = B(u, v, dfs_data)
-    new_list = []
-    for edge_id in buv:
-        edge = dfs_data['graph'].get_edge(edge_id)
-        j, k = edge['vertices']
-        d_x = D(j, dfs_data)
-        d_y = D(k, dfs_data)
-        if d_x < d_y:
-            smaller = d_x
-            larger = d_y
-        else:
-            smaller = d_y
-            larger = d_x
-        frond = (smaller, larger)
-        new_list.append(frond)
-    return new_list
+def __is_frond_in_branch_uv(x, y, u, v, dfs_data):
+    """Determines if the frond xy, given by the DFS numbers of its ends with x < y, is an edge of Bu(v).
+    An edge is in Bu(v) when either of its ends is in S*(v), so this only needs to check the DFS interval of v
+    instead of building the branch."""
+    if a(v, dfs_data) != u:
+        return False
+    if x < 1 or y < x or y > len(dfs_data['ordering']):
+        return False
+
+    node_x = dfs_data['ordering'][x - 1]
+    node_y = dfs_data['ordering'][y - 1]
+    if x == y:
+        graph = dfs_data['graph']
+        if not any(graph.get_edge(edge_id)['vertices'] == (node_x, node_x)
+                   for edge_id in graph.get_node(node_x)['edges']):
+            return False
+    elif (node_x, node_y) not in dfs_data['edge_table']:
+        return False
+
+    return __is_in_subtree(x, v, dfs_data) or __is_in_subtree(y, v, dfs_data)
 
 
 # Helper functions -- these are not directly specified by the overall algorithm, they just calculate intermediate data
@@ -745,14 +752,12 @@ def __get_dfs_data(graph, adj=None):
     Returns a dictionary with the following data:
         * 'ordering':        A dfs-ordering list of nodes
         * 'ordering_lookup': A lookup dict mapping nodes to dfs-ordering
-        * 'node_lookup':     A lookup dict mapping dfs-ordering to nodes
         * 'edge_lookup':     A lookup dict mapping edges as tree-edges or back-edges
         * 'parent_lookup':   A lookup dict mapping nodes to their parent node
         * 'children_lookup': A lookup dict mapping nodes to their children
     """
     ordering, parent_lookup, children_lookup = depth_first_search_with_parent_data(graph, adjacency_lists=adj)
     ordering_lookup = dict(list(zip(ordering, list(range(1, len(ordering) + 1)))))
-    node_lookup = dict(list(zip(list(range(1, len(ordering) + 1)), ordering)))
     edge_lookup = {}
 
     for edge_id in graph.get_all_edge_ids():
@@ -768,7 +773,6 @@ def __get_dfs_data(graph, adj=None):
     dfs_data = {}
     dfs_data['ordering'] = ordering
     dfs_data['ordering_lookup'] = ordering_lookup
-    dfs_data['node_lookup'] = node_lookup
     dfs_data['edge_lookup'] = edge_lookup
     dfs_data['parent_lookup'] = parent_lookup
     dfs_data['children_lookup'] = children_lookup
@@ -776,6 +780,34 @@ def __get_dfs_data(graph, adj=None):
     return dfs_data
 
 
+def __calculate_edge_table(graph):
+    """Builds a lookup table mapping each (u, v) pair of adjacent nodes to the first edge from u to v,
+    so that edges don't have to be searched for by their ends. Self-loops are left out."""
+    edge_table = {}
+    for node_id in graph.get_all_node_ids():
+        for edge_id in graph.get_node(node_id)['edges']:
+            node_a, node_b = graph.get_edge(edge_id)['vertices']
+            other_node = node_b if node_a == node_id else node_a
+            if other_node != node_id and (node_id, other_node) not in edge_table:
+                edge_table[(node_id, other_node)] = edge_id
+    return edge_table
+
+
+def __calculate_weight_and_frond_tables(dfs_data):
+    """Builds lookup tables mapping each (u, v) pair of adjacent nodes to the weight of the edge uv,
+    and to whether uv is a frond."""
+    edge_weights = dfs_data['edge_weights']
+    edge_lookup = dfs_data['edge_lookup']
+    ordering_lookup = dfs_data['ordering_lookup']
+
+    weight_table = {}
+    frond_table = {}
+    for (u, v), edge_id in dfs_data['edge_table'].items():
+        weight_table[(u, v)] = edge_weights[edge_id]
+        frond_table[(u, v)] = edge_lookup[edge_id] == 'backedge' and ordering_lookup[v] < ordering_lookup[u]
+    return weight_table, frond_table
+
+
 def __calculate_adjacency_lists(graph):
     """Builds an adjacency list representation for the graph, since we can't guarantee that the
         internal representation of the graph is stored that way."""
@@ -787,31 +819,53 @@ def __calculate_adjacency_lists(graph):
 
 
 def __get_all_lowpoints(dfs_data):
-    """Calculates the lowpoints for each node in a graph."""
-    lowpoint_1_lookup = {}
-    lowpoint_2_lookup = {}
-
+    """Calculates the lowpoints and the subtree size of every node in a single post-order pass over the DFS tree.
+    L1(u) and L2(u) are the two lowest DFS numbers in T(u), which is made up of the nodes adjacent to u along with
+    the T(v) of each child v of u; only the two lowest values of each child are needed to find those of u.
+    Returns a tuple of three lists indexed by DFS number: the L1 and L2 lowpoints, as DFS numbers,
+    and the subtree sizes.
+    """
     ordering = dfs_data['ordering']
-
-    for node in ordering:
-        low_1, low_2 = __get_lowpoints(node, dfs_data)
-        lowpoint_1_lookup[node] = low_1
-        lowpoint_2_lookup[node] = low_2
-
-    return lowpoint_1_lookup, lowpoint_2_lookup
-
-
-def __get_lowpoints(node, dfs_data):
-    """Calculates the lowpoints for a single node in a graph."""
-
     ordering_lookup = dfs_data['ordering_lookup']
-
-    t_u = T(node, dfs_data)
-    sorted_t_u = sorted(t_u, key=lambda a: ordering_lookup[a])
-    lowpoint_1 = sorted_t_u[0]
-    lowpoint_2 = sorted_t_u[1]
-
-    return lowpoint_1, lowpoint_2
+    parent_lookup = dfs_data['parent_lookup']
+    adj = dfs_data['adj']
+
+    num_nodes = len(ordering)
+    unreached = num_nodes + 1
+    lowpoint_1 = [unreached] * (num_nodes + 1)
+    lowpoint_2 = [unreached] * (num_nodes + 1)
+    subtree_size = [1] * (num_nodes + 1)
+
+    # --The DFS ordering is a preorder, so going through it backwards finishes every child before its parent
+    for d_u in range(num_nodes, 0, -1):
+        u = ordering[d_u - 1]
+        low_1 = lowpoint_1[d_u]
+        low_2 = lowpoint_2[d_u]
+        for w in adj[u]:
+            d_w = ordering_lookup[w]
+            if d_w < low_1:
+                low_1, low_2 = d_w, low_1
+            elif low_1 < d_w < low_2:
+                low_2 = d_w
+        lowpoint_1[d_u] = low_1
+        lowpoint_2[d_u] = low_2
+
+        parent = parent_lookup[u]
+        if parent == u:
+            continue
+        d_parent = ordering_lookup[parent]
+        subtree_size[d_parent] += subtree_size[d_u]
+        parent_low_1 = lowpoint_1[d_parent]
+        parent_low_2 = lowpoint_2[d_parent]
+        for d_w in (low_1, low_2):
+            if d_w < parent_low_1:
+                parent_low_1, parent_low_2 = d_w, parent_low_1
+            elif parent_low_1 < d_w < parent_low_2:
+                parent_low_2 = d_w
+        lowpoint_1[d_parent] = parent_low_1
+        lowpoint_2[d_parent] = parent_low_2
+
+    return lowpoint_1, lowpoint_2, subtree_size
 
 
 def __edge_weight(edge_id, dfs_data):
@@ -841,21 +895,30 @@ def __calculate_bu_dfs(dfs_data):
     u = dfs_data['ordering'][0]
     b = {}
     b[u] = D(u, dfs_data)
-    __calculate_bu_dfs_recursively(u, b, dfs_data)
-    return b
 
-
-def __calculate_bu_dfs_recursively(u, b, dfs_data):
-    """Calculates the b(u) lookup table with a recursive DFS."""
-    first_time = True
-    for v in dfs_data['adj'][u]:
+    # We're simulating the recursive DFS with an explicit stack, since Python has a really small function stack;
+    # --each frame holds a node and the position of the next node to visit in its adjacency list
+    node_stack = [u]
+    position_stack = [0]
+    while len(node_stack) > 0:
+        u = node_stack[-1]
+        position = position_stack[-1]
+        if position == len(dfs_data['adj'][u]):
+            node_stack.pop()
+            position_stack.pop()
+            continue
+        position_stack[-1] = position + 1
+
+        v = dfs_data['adj'][u][position]
         if a(v, dfs_data) == u:
-            if first_time:
+            if position == 0:
                 b[v] = b[u]
             else:
                 b[v] = D(u, dfs_data)
-            __calculate_bu_dfs_recursively(v, b, dfs_data)
-        first_time = False
+            node_stack.append(v)
+            position_stack.append(0)
+
+    return b
 
 
 def is_type_I_branch(u, v, dfs_data):
@@ -883,41 +946,21 @@ def is_leaf(v, dfs_data):
 
 def is_frond(u, v, dfs_data):
     """Determines if the edge uv is a frond ("backedge")."""
-    d_u = D(u, dfs_data)
-    d_v = D(v, dfs_data)
-    edge_id = dfs_data['graph'].get_first_edge_id_by_node_ids(u, v)
-    return True if dfs_data['edge_lookup'][edge_id] == 'backedge' and d_v < d_u else False
+    return dfs_data['frond_table'][(u, v)]
 
 
 def __get_descendants(node, dfs_data):
-    """Gets the descendants of a node."""
-    list_of_descendants = []
-
-    stack = deque()
+    """Gets the descendants of a node.
+    The DFS ordering is a preorder, so they are the nodes that directly follow it, as many as its subtree holds."""
+    d_node = D(node, dfs_data)
+    return dfs_data['ordering'][d_node:d_node + dfs_data['subtree_size'][d_node] - 1]
 
-    children_lookup = dfs_data['children_lookup']
 
-    current_node = node
-    children = children_lookup[current_node]
-    dfs_current_node = D(current_node, dfs_data)
-    for n in children:
-        dfs_child = D(n, dfs_data)
-        # Validate that the child node is actually a descendant and not an ancestor
-        if dfs_child > dfs_current_node:
-            stack.append(n)
-
-    while len(stack) > 0:
-        current_node = stack.pop()
-        list_of_descendants.append(current_node)
-        children = children_lookup[current_node]
-        dfs_current_node = D(current_node, dfs_data)
-        for n in children:
-            dfs_child = D(n, dfs_data)
-            # Validate that the child node is actually a descendant and not an ancestor
-            if dfs_child > dfs_current_node:
-                stack.append(n)
-
-    return list_of_descendants
+def __is_in_subtree(d_w, v, dfs_data):
+    """Determines if the node with DFS number d_w is in S*(v).
+    The DFS ordering is a preorder, so S*(v) is the interval of DFS numbers starting at D(v), as long as its subtree."""
+    d_v = D(v, dfs_data)
+    return d_v <= d_w < d_v + dfs_data['subtree_size'][d_v]
 
 
 def __top_frond_left(dfs_data):
@@ -971,36 +1014,46 @@ def B(u, v, dfs_data):
     if a(v, dfs_data) != u:
         return None
 
-    return list(set([edge_id for w in S_star(v, dfs_data) for edge_id in dfs_data['graph'].get_node(w)['edges']]))
+    # --An edge with both ends in S*(v) is only taken from the end that comes first in the DFS ordering
+    graph = dfs_data['graph']
+    d_v = D(v, dfs_data)
+    branch = []
+    self_loops = set()
+    for w in dfs_data['ordering'][d_v - 1:d_v - 1 + dfs_data['subtree_size'][d_v]]:
+        d_w = D(w, dfs_data)
+        for edge_id in graph.get_node(w)['edges']:
+            j, k = graph.get_edge(edge_id)['vertices']
+            d_x = D(k if j == w else j, dfs_data)
+            if d_x == d_w:
+                if edge_id not in self_loops:
+                    self_loops.add(edge_id)
+                    branch.append(edge_id)
+            elif not (d_v <= d_x < d_w):
+                branch.append(edge_id)
+    return branch
 
 
 def stem(u, v, dfs_data):
     """The stem of Bu(v) is the edge uv in Bu(v)."""
-    #return dfs_data['graph'].get_first_edge_id_by_node_ids(u, v)
-    uv_edges = dfs_data['graph'].get_edge_ids_by_node_ids(u, v)
-    buv_edges = B(u, v, dfs_data)
-    for edge_id in uv_edges:
-        if edge_id in buv_edges:
-            return edge_id
-    return None # We should never, ever get here
+    # --Every edge between u and v is incident on v, so the first one is in Bu(v)
+    if a(v, dfs_data) != u:
+        return None
+    return dfs_data['edge_table'].get((u, v))
 
 
 def L1(v, dfs_data):
     """The L1 lowpoint of the node."""
-    return dfs_data['lowpoint_1_lookup'][v]
+    return dfs_data['ordering'][dfs_data['lowpoint_1'][D(v, dfs_data)] - 1]
 
 
 def L2(v, dfs_data):
     """The L2 lowpoint of the node."""
-    return dfs_data['lowpoint_2_lookup'][v]
+    return dfs_data['ordering'][dfs_data['lowpoint_2'][D(v, dfs_data)] - 1]
 
 
 def wt(u, v, dfs_data):
     """The wt_u[v] function used in the paper."""
-    # Determine the edge_id
-    edge_id = dfs_data['graph'].get_first_edge_id_by_node_ids(u, v)
-    # Pull the weight of that edge
-    return dfs_data['edge_weights'][edge_id]
+    return dfs_data['weight_table'][(u, v)]
 
 
 def _L(dfs_data):
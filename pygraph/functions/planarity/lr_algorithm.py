@@ -0,0 +1,432 @@
+"""
+Implementing planarity testing and planar embedding with the left-right planarity algorithm,
+as per "The Left-Right Planarity Test" by Ulrik Brandes
+Location: https://citeseerx.ist.psu.edu/document?repid=rep1&type=pdf&doi=0e8fd1ba3cfcb8e1ec3e3dd9fd0a1c2d4d22fb25
+"""
+
+from collections import defaultdict
+
+
+def lr_planarity_test(graph):
+    """Determines whether a graph is planar, in linear time."""
+    return _LRPlanarity(graph).test()
+
+
+def lr_planar_embedding(graph):
+    """Finds a planar embedding of a graph, in linear time.
+    Returns a rotation system: a dict mapping each node to the list of the edges around it, in clockwise order.
+    A self-loop is listed twice around its node. Returns None if the graph is not planar.
+    """
+    lr_planarity = _LRPlanarity(graph)
+    if not lr_planarity.test():
+        return None
+    return lr_planarity.embed()
+
+
+class _Interval(object):
+    """An interval of return edges on one side of a conflict pair, from its lowest to its highest return edge."""
+
+    def __init__(self, low=None, high=None):
+        self.low = low
+        self.high = high
+
+    def empty(self):
+        """Determines whether the interval contains no return edges."""
+        return self.low is None and self.high is None
+
+    def copy(self):
+        """Returns a copy of the interval."""
+        return _Interval(self.low, self.high)
+
+    def conflicting(self, edge, lowpt):
+        """Determines whether the interval holds a return edge that ends higher than the lowpoint of ''edge''."""
+        return not self.empty() and lowpt[self.high] > lowpt[edge]
+
+
+class _ConflictPair(object):
+    """A pair of intervals of return edges that must be embedded on opposite sides."""
+
+    def __init__(self, left=None, right=None):
+        self.left = left if left is not None else _Interval()
+        self.right = right if right is not None else _Interval()
+
+    def swap(self):
+        """Swaps the left and right intervals."""
+        self.left, self.right = self.right, self.left
+
+    def lowest(self, lowpt):
+        """Returns the lowest lowpoint of a return edge in the pair."""
+        if self.left.empty():
+            return lowpt[self.right.low]
+        if self.right.empty():
+            return lowpt[self.left.low]
+        return min(lowpt[self.left.low], lowpt[self.right.low])
+
+
+class _LRPlanarity(object):
+    """Runs the left-right planarity test on the simple graph underlying a graph, and embeds it if it's planar.
+    Edges are handled as (v, w) tuples, oriented in the direction the DFS traversed them.
+    Each of the three phases is an iterative DFS, so deep graphs don't run into the recursion limit.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+        # --Parallel edges and self-loops don't affect planarity, so the test runs on the underlying simple graph
+        # --Edges are added in both directions, so that directed graphs are treated as undirected
+        self.adj = dict((node_id, []) for node_id in graph.get_all_node_ids())
+        seen = set()
+        for edge in graph.get_all_edge_objects():
+            node_a, node_b = edge['vertices']
+            if node_a == node_b or (node_a, node_b) in seen:
+                continue
+            seen.add((node_a, node_b))
+            seen.add((node_b, node_a))
+            self.adj[node_a].append(node_b)
+            self.adj[node_b].append(node_a)
+        self.num_edges = len(seen) // 2
+
+        self.roots = []
+        self.height = {}
+        self.parent_edge = {}
+        self.lowpt = {}
+        self.lowpt2 = {}
+        self.nesting_depth = {}
+        self.ordered_adjs = {}
+
+        self.ref = {}
+        self.side = defaultdict(lambda: 1)
+        self.lowpt_edge = {}
+        self.stack_bottom = {}
+        self.conflict_stack = []
+
+    def test(self):
+        """Determines whether the graph is planar."""
+        num_nodes = len(self.adj)
+        # --Euler's Formula bounds the number of edges of a simple planar graph
+        if num_nodes > 2 and self.num_edges > 3*num_nodes - 6:
+            return False
+
+        self.__orient()
+        for v in self.adj:
+            self.ordered_adjs[v].sort(key=lambda w: self.nesting_depth[(v, w)])
+        return self.__test_dfs()
+
+    def embed(self):
+        """Builds a planar embedding of the graph; must be run after ''test'' has found it planar.
+        Returns a rotation system: a dict mapping each node to the list of the edges around it, in clockwise order.
+        """
+        # The final side of each edge determines where it goes in the order around its nodes
+        for v in self.adj:
+            for w in self.ordered_adjs[v]:
+                self.nesting_depth[(v, w)] *= self.__sign((v, w))
+            self.ordered_adjs[v].sort(key=lambda w: self.nesting_depth[(v, w)])
+
+        # --The rotations are kept as circular doubly-linked lists of neighbors
+        self.first_neighbor = {}
+        self.clockwise = defaultdict(dict)
+        self.counterclockwise = defaultdict(dict)
+        for v in self.adj:
+            previous = None
+            for w in self.ordered_adjs[v]:
+                self.__add_half_edge_clockwise(v, w, previous)
+                previous = w
+        self.__embedding_dfs()
+
+        return self.__expand_rotations()
+
+    def __orient(self):
+        """Orients the edges along a DFS, and calculates the heights, lowpoints and nesting depths."""
+        for root in self.adj:
+            if root in self.height:
+                continue
+            self.roots.append(root)
+            self.height[root] = 0
+            self.parent_edge[root] = None
+
+            # We're simulating a recursive DFS with an explicit stack, since Python has a really small function stack;
+            # --each frame holds a node and the position of the next neighbor to look at
+            node_stack = [root]
+            position_stack = [0]
+            while len(node_stack) > 0:
+                v = node_stack[-1]
+                position = position_stack[-1]
+                if position == len(self.adj[v]):
+                    node_stack.pop()
+                    position_stack.pop()
+                    if self.parent_edge[v] is not None:
+                        self.__finish_edge(self.parent_edge[v])
+                    continue
+                position_stack[-1] = position + 1
+
+                w = self.adj[v][position]
+                if (v, w) in self.lowpt or (w, v) in self.lowpt:
+                    # --The edge was already oriented from the other end
+                    continue
+                vw = (v, w)
+                self.ordered_adjs.setdefault(v, []).append(w)
+                self.lowpt[vw] = self.height[v]
+                self.lowpt2[vw] = self.height[v]
+                if w not in self.height:
+                    # (v,w) is a tree edge; simulate the recursive call on w
+                    self.parent_edge[w] = vw
+                    self.height[w] = self.height[v] + 1
+                    node_stack.append(w)
+                    position_stack.append(0)
+                else:
+                    # (v,w) is a back edge
+                    self.lowpt[vw] = self.height[w]
+                    self.__finish_edge(vw)
+
+        for v in self.adj:
+            self.ordered_adjs.setdefault(v, [])
+
+    def __finish_edge(self, vw):
+        """Calculates the nesting depth of an edge whose lowpoints are known, and passes them on to the parent edge."""
+        v = vw[0]
+        self.nesting_depth[vw] = 2 * self.lowpt[vw]
+        if self.lowpt2[vw] < self.height[v]:
+            # --The edge is chordal
+            self.nesting_depth[vw] += 1
+
+        e = self.parent_edge[v]
+        if e is None:
+            return
+        if self.lowpt[vw] < self.lowpt[e]:
+            self.lowpt2[e] = min(self.lowpt[e], self.lowpt2[vw])
+            self.lowpt[e] = self.lowpt[vw]
+        elif self.lowpt[vw] > self.lowpt[e]:
+            self.lowpt2[e] = min(self.lowpt2[e], self.lowpt[vw])
+        else:
+            self.lowpt2[e] = min(self.lowpt2[e], self.lowpt2[vw])
+
+    def __test_dfs(self):
+        """Runs the testing DFS, assigning the return edges to sides. Returns whether the graph is planar."""
+        for root in self.roots:
+            node_stack = [root]
+            position_stack = [0]
+            while len(node_stack) > 0:
+                v = node_stack[-1]
+                position = position_stack[-1]
+                e = self.parent_edge[v]
+                if position == len(self.ordered_adjs[v]):
+                    node_stack.pop()
+                    position_stack.pop()
+                    if e is not None:
+                        self.__remove_back_edges(e)
+                        u = e[0]
+                        if not self.__integrate_edge(e, u, self.parent_edge[u]):
+                            return False
+                    continue
+                position_stack[-1] = position + 1
+
+                w = self.ordered_adjs[v][position]
+                ei = (v, w)
+                self.stack_bottom[ei] = self.conflict_stack[-1] if len(self.conflict_stack) > 0 else None
+                if ei == self.parent_edge[w]:
+                    # --Simulate the recursive call on w; the edge is integrated once w is done
+                    node_stack.append(w)
+                    position_stack.append(0)
+                    continue
+                self.lowpt_edge[ei] = ei
+                self.conflict_stack.append(_ConflictPair(right=_Interval(ei, ei)))
+                if not self.__integrate_edge(ei, v, e):
+                    return False
+
+        return True
+
+    def __integrate_edge(self, ei, v, e):
+        """Adds the return edges of an outgoing edge ei of v to the constraints on the parent edge e of v.
+        Returns False if that makes the graph nonplanar."""
+        if self.lowpt[ei] < self.height[v]:
+            if ei[1] == self.ordered_adjs[v][0]:
+                self.lowpt_edge[e] = self.lowpt_edge[ei]
+            else:
+                return self.__add_constraints(ei, e)
+        return True
+
+    def __add_constraints(self, ei, e):
+        """Merges the conflict pairs of ei, and those of the earlier edges that conflict with it, into a single pair.
+        Returns False if the return edges can't be split between the two sides."""
+        lowpt = self.lowpt
+        stack = self.conflict_stack
+        pair = _ConflictPair()
+
+        # Merge the return edges of ei into the right side of the pair
+        while True:
+            q = stack.pop()
+            if not q.left.empty():
+                q.swap()
+            if not q.left.empty():
+                return False
+            if lowpt[q.right.low] > lowpt[e]:
+                if pair.right.empty():
+                    pair.right = q.right.copy()
+                else:
+                    self.ref[pair.right.low] = q.right.high
+                pair.right.low = q.right.low
+            else:
+                # --Align the interval with the lowpoint edge of e
+                self.ref[q.right.low] = self.lowpt_edge[e]
+            if (stack[-1] if len(stack) > 0 else None) is self.stack_bottom[ei]:
+                break
+
+        # Merge the conflicting return edges of the earlier edges into the left side of the pair
+        while len(stack) > 0 and (stack[-1].left.conflicting(ei, lowpt) or stack[-1].right.conflicting(ei, lowpt)):
+            q = stack.pop()
+            if q.right.conflicting(ei, lowpt):
+                q.swap()
+            if q.right.conflicting(ei, lowpt):
+                return False
+            self.ref[pair.right.low] = q.right.high
+            if q.right.low is not None:
+                pair.right.low = q.right.low
+            if pair.left.empty():
+                pair.left = q.left.copy()
+            else:
+                self.ref[pair.left.low] = q.left.high
+            pair.left.low = q.left.low
+
+        if not (pair.left.empty() and pair.right.empty()):
+            stack.append(pair)
+        return True
+
+    def __remove_back_edges(self, e):
+        """Trims the back edges that end at the tail of e, and determines which side e goes on."""
+        lowpt = self.lowpt
+        stack = self.conflict_stack
+        u = e[0]
+
+        # --Drop the conflict pairs that only hold back edges ending at u
+        while len(stack) > 0 and stack[-1].lowest(lowpt) == self.height[u]:
+            pair = stack.pop()
+            if pair.left.low is not None:
+                self.side[pair.left.low] = -1
+
+        if len(stack) > 0:
+            # --Trim the back edges ending at u off the intervals of the topmost remaining pair
+            pair = stack.pop()
+            while pair.left.high is not None and pair.left.high[1] == u:
+                pair.left.high = self.ref.get(pair.left.high)
+            if pair.left.high is None and pair.left.low is not None:
+                self.ref[pair.left.low] = pair.right.low
+                self.side[pair.left.low] = -1
+                pair.left.low = None
+            while pair.right.high is not None and pair.right.high[1] == u:
+                pair.right.high = self.ref.get(pair.right.high)
+            if pair.right.high is None and pair.right.low is not None:
+                self.ref[pair.right.low] = pair.left.low
+                self.side[pair.right.low] = -1
+                pair.right.low = None
+            stack.append(pair)
+
+        # --e goes on the side of its highest return edge
+        if lowpt[e] < self.height[u]:
+            high_left = stack[-1].left.high
+            high_right = stack[-1].right.high
+            if high_left is not None and (high_right is None or lowpt[high_left] > lowpt[high_right]):
+                self.ref[e] = high_left
+            else:
+                self.ref[e] = high_right
+
+    def __sign(self, e):
+        """Resolves the side of an edge relative to the edges it refers to, returning 1 or -1."""
+        chain = []
+        while self.ref.get(e) is not None:
+            chain.append(e)
+            e = self.ref[e]
+        for edge in reversed(chain):
+            self.side[edge] *= self.side[self.ref[edge]]
+            self.ref[edge] = None
+        return self.side[chain[0]] if len(chain) > 0 else self.side[e]
+
+    def __embedding_dfs(self):
+        """Adds the incoming half of every edge to the rotation around its head."""
+        left_ref = {}
+        right_ref = {}
+        for root in self.roots:
+            node_stack = [root]
+            position_stack = [0]
+            while len(node_stack) > 0:
+                v = node_stack[-1]
+                position = position_stack[-1]
+                if position == len(self.ordered_adjs[v]):
+                    node_stack.pop()
+                    position_stack.pop()
+                    continue
+                position_stack[-1] = position + 1
+
+                w = self.ordered_adjs[v][position]
+                if (v, w) == self.parent_edge[w]:
+                    # --The tree edge goes first around the child
+                    self.__add_half_edge_first(w, v)
+                    left_ref[v] = w
+                    right_ref[v] = w
+                    node_stack.append(w)
+                    position_stack.append(0)
+                elif self.side[(v, w)] == 1:
+                    # --Place v directly after right_ref[w] around w
+                    self.__add_half_edge_clockwise(w, v, right_ref[w])
+                else:
+                    # --Place v directly before left_ref[w] around w
+                    self.__add_half_edge_counterclockwise(w, v, left_ref[w])
+                    left_ref[w] = v
+
+    def __add_half_edge_clockwise(self, v, w, reference):
+        """Adds w to the rotation around v, directly after ''reference''; v must have no neighbors if it is None."""
+        if reference is None:
+            self.clockwise[v][w] = w
+            self.counterclockwise[v][w] = w
+            self.first_neighbor[v] = w
+            return
+        after = self.clockwise[v][reference]
+        self.clockwise[v][reference] = w
+        self.clockwise[v][w] = after
+        self.counterclockwise[v][after] = w
+        self.counterclockwise[v][w] = reference
+
+    def __add_half_edge_counterclockwise(self, v, w, reference):
+        """Adds w to the rotation around v, directly before ''reference''."""
+        self.__add_half_edge_clockwise(v, w, self.counterclockwise[v][reference])
+        if self.first_neighbor[v] == reference:
+            self.first_neighbor[v] = w
+
+    def __add_half_edge_first(self, v, w):
+        """Adds w to the rotation around v, as its first neighbor."""
+        if v in self.first_neighbor:
+            self.__add_half_edge_counterclockwise(v, w, self.first_neighbor[v])
+        else:
+            self.__add_half_edge_clockwise(v, w, None)
+
+    def __expand_rotations(self):
+        """Turns the rotations of neighbors into rotations of the edges of the graph.
+        Each bundle of parallel edges is kept together, in opposite orders at its two ends so that no two of them cross,
+        and self-loops are added after the other edges, with both ends of each next to each other."""
+        graph = self.graph
+        bundles = defaultdict(list)
+        self_loops = defaultdict(list)
+        for edge_id in graph.get_all_edge_ids():
+            node_a, node_b = graph.get_edge(edge_id)['vertices']
+            if node_a == node_b:
+                self_loops[node_a].append(edge_id)
+            else:
+                bundles[(min(node_a, node_b), max(node_a, node_b))].append(edge_id)
+
+        rotations = {}
+        for v in self.adj:
+            rotation = []
+            if v in self.first_neighbor:
+                w = self.first_neighbor[v]
+                while True:
+                    if v < w:
+                        rotation.extend(bundles[(v, w)])
+                    else:
+                        rotation.extend(reversed(bundles[(w, v)]))
+                    w = self.clockwise[v][w]
+                    if w == self.first_neighbor[v]:
+                        break
+            for edge_id in self_loops[v]:
+                rotation.append(edge_id)
+                rotation.append(edge_id)
+            rotations[v] = rotation
+        return rotations
@@ -0,0 +1,108 @@
+"""Implements layered neighbor sampling, for building minibatches of k-hop neighborhoods."""
+
+import random
+from array import array
+
+from ..helpers import CSRGraph, parallel_map
+
+
+class NeighborSampler(object):
+    """Samples fixed-fanout k-hop neighborhoods around batches of seed nodes.
+    The adjacency of the graph is frozen into a CSRGraph once, when the sampler is created;
+    a CSRGraph can also be passed in directly in place of a graph.
+    """
+
+    def __init__(self, graph, fanouts, seed=None):
+        """''fanouts'' gives the maximum number of neighbors sampled per node for each hop, e.g. [25, 10].
+        ''seed'' makes the sampling reproducible."""
+        if isinstance(graph, CSRGraph):
+            self.csr = graph
+        else:
+            self.csr = CSRGraph.from_graph(graph)
+        self.fanouts = list(fanouts)
+        self.seed = seed
+        self.__rng = random.Random(seed)
+
+    def sample(self, seed_nodes):
+        """Samples the k-hop blocks for a single batch of seed node ids.
+        Returns a list of blocks, one per hop (see ''sample_blocks'').
+        """
+        seed_indices = [self.csr.index_of(n) for n in seed_nodes]
+        return sample_blocks(self.csr, seed_indices, self.fanouts, self.__rng)
+
+    def sample_batches(self, batches, executor=None, workers=None):
+        """Samples the k-hop blocks for each batch of seed node ids, optionally across a pool of worker processes.
+        Each batch gets its own random seed drawn from the sampler, so the results do not depend on
+        how the batches are spread across workers.
+        Returns a list containing the list of blocks for each batch.
+        """
+        tasks = []
+        for seed_nodes in batches:
+            seed_indices = array('l', [self.csr.index_of(n) for n in seed_nodes])
+            batch_seed = self.__rng.getrandbits(64) if self.seed is not None else None
+            tasks.append((self.csr, seed_indices, self.fanouts, batch_seed))
+        return parallel_map(_sample_blocks_task, tasks, executor=executor, workers=workers)
+
+
+def sample_blocks(csr, seed_indices, fanouts, rng):
+    """Samples layered neighborhoods on a CSRGraph, starting from the dense node indices in ''seed_indices''.
+    Returns a list with one block per hop. Each block is a dict of arrays:
+        * 'dst_nodes': the dense indices of the nodes whose neighbors were sampled in this hop
+        * 'src_nodes': the dense indices of every node in the block; it starts with 'dst_nodes',
+                       and becomes the 'dst_nodes' of the next hop
+        * 'edge_dst':  for each sampled edge, the position of its endpoint in 'dst_nodes'
+        * 'edge_src':  for each sampled edge, the position of the sampled neighbor in 'src_nodes'
+        * 'edge_ids':  for each sampled edge, the id of the graph edge it was sampled from
+    Nodes with no more neighbors than the fanout keep all of them.
+    """
+    indptr = csr.indptr
+    indices = csr.indices
+    edge_ids = csr.edge_ids
+
+    blocks = []
+    dst_nodes = array('l')
+    position = {}
+    for n in seed_indices:
+        if n not in position:
+            position[n] = len(dst_nodes)
+            dst_nodes.append(n)
+
+    for fanout in fanouts:
+        src_nodes = array('l', dst_nodes)
+        edge_dst = array('l')
+        edge_src = array('l')
+        block_edge_ids = array('l')
+
+        for dst_position, n in enumerate(dst_nodes):
+            start = indptr[n]
+            end = indptr[n + 1]
+            if end - start <= fanout:
+                sampled = range(start, end)
+            else:
+                sampled = rng.sample(range(start, end), fanout)
+            for i in sampled:
+                neighbor = indices[i]
+                if neighbor not in position:
+                    position[neighbor] = len(src_nodes)
+                    src_nodes.append(neighbor)
+                edge_dst.append(dst_position)
+                edge_src.append(position[neighbor])
+                block_edge_ids.append(edge_ids[i])
+
+        blocks.append({'dst_nodes': dst_nodes,
+                       'src_nodes': src_nodes,
+                       'edge_dst': edge_dst,
+                       'edge_src': edge_src,
+                       'edge_ids': block_edge_ids
+        })
+
+        # The sampled neighbors become the targets for the next hop; their positions carry over unchanged
+        dst_nodes = src_nodes
+
+    return blocks
+
+
+def _sample_blocks_task(task):
+    """Worker entry point for NeighborSampler.sample_batches."""
+    csr, seed_indices, fanouts, batch_seed = task
+    return sample_blocks(csr, seed_indices, fanouts, random.Random(batch_seed))
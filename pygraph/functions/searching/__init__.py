@@ -1,3 +1,4 @@
 from .astar import a_star_search
 from .breadth_first_search import breadth_first_search
-from .depth_first_search import depth_first_search, depth_first_search_with_parent_data
\ No newline at end of file
+from .depth_first_search import depth_first_search, depth_first_search_with_parent_data
+from .k_hop import k_hop_neighborhood, ego_graph
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""Implements depth-limited neighborhood extraction."""
+
+from collections import deque
+
+from ...classes import SubgraphView
+
+
+def k_hop_neighborhood(graph, node, k):
+    """Finds all the nodes that can be reached from ''node'' by following at most ''k'' edges.
+    Returns a set of node ids, which always includes ''node'' itself.
+    """
+    # Verify that the node exists before we start searching
+    graph.get_node(node)
+
+    distance = {node: 0}
+    queue = deque([node])
+
+    # This is a breadth-first search that stops expanding once it reaches depth k
+    while len(queue) > 0:
+        current_node = queue.popleft()
+        current_distance = distance[current_node]
+        if current_distance >= k:
+            continue
+        for n in graph.neighbors(current_node):
+            if n not in distance:
+                distance[n] = current_distance + 1
+                queue.append(n)
+
+    return set(distance)
+
+
+def ego_graph(graph, node, k):
+    """Builds the subgraph induced by the ''k''-hop neighborhood of ''node''.
+    Returns a read-only SubgraphView onto ''graph''; no nodes or edges are copied.
+    """
+    return SubgraphView(graph, k_hop_neighborhood(graph, node, k))
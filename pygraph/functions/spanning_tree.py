@@ -1,14 +1,25 @@
 """Implements a minimum spanning tree algorithm."""
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
 from ..exceptions import DisconnectedGraphError
-from .connected_components import get_connected_components, get_connected_components_as_subgraphs
-from ..helpers import DisjointSet, PriorityQueue, get_subgraph_from_edge_list
+from .connected_components import get_connected_components, get_weakly_connected_components
+from ..helpers import (IndexedDisjointSet, IndexedPriorityQueue, get_subgraph_from_edge_list,
+                       parallel_map, share_array, attach_array)
+
+# Prim's algorithm is used by the 'auto' method once the graph has at least this fraction
+# of the edges of a complete graph; below that, sorting the edges for Kruskal's algorithm is faster
+PRIM_DENSITY_THRESHOLD = 0.5
 
 
-def find_minimum_spanning_tree(graph):
+def find_minimum_spanning_tree(graph, key=None, method='auto'):
     """Calculates a minimum spanning tree for a graph.
     Returns a list of edges that define the tree.
     Returns an empty list for an empty graph.
+    ''key'' selects the edge weights; see ''kruskal_mst''.
+    ''method'' is one of 'kruskal', 'prim' or 'auto', which picks Prim's algorithm for very dense graphs
+    and Kruskal's algorithm otherwise.
     """
     mst = []
 
@@ -21,81 +32,291 @@ def find_minimum_spanning_tree(graph):
     if len(connected_components) > 1:
         raise DisconnectedGraphError
 
-    edge_list = kruskal_mst(graph)
+    if method == 'auto':
+        num_nodes = graph.num_nodes()
+        max_edges = num_nodes * (num_nodes - 1) / 2
+        method = 'prim' if graph.num_edges() >= PRIM_DENSITY_THRESHOLD * max_edges else 'kruskal'
+    if method == 'kruskal':
+        edge_list = kruskal_mst(graph, key)
+    elif method == 'prim':
+        edge_list = prim_mst(graph, key)
+    else:
+        raise ValueError('Unknown minimum spanning tree method "{}"'.format(method))
 
     return edge_list
 
 
-def find_minimum_spanning_tree_as_subgraph(graph):
+def find_minimum_spanning_tree_as_subgraph(graph, key=None, method='auto'):
     """Calculates a minimum spanning tree and returns a graph representation."""
-    edge_list = find_minimum_spanning_tree(graph)
+    edge_list = find_minimum_spanning_tree(graph, key, method)
     subgraph = get_subgraph_from_edge_list(graph, edge_list)
 
     return subgraph
 
 
-def find_minimum_spanning_forest(graph):
+def find_minimum_spanning_forest(graph, key=None, method=None, executor=None, workers=None):
     """Calculates the minimum spanning forest of a disconnected graph.
     Returns a list of lists, each containing the edges that define that tree.
     Returns an empty list for an empty graph.
+    ''key'' selects the edge weights; see ''kruskal_mst''.
+    ''method'' is either 'kruskal' or 'boruvka'; Boruvka's algorithm can spread its work across
+    worker processes with ''executor'' or ''workers'' (see ''parallel_map''). By default, Boruvka's algorithm
+    is used when either of those is given, and Kruskal's algorithm otherwise.
     """
     msf = []
 
+    if method is None:
+        method = 'kruskal' if executor is None and workers is None else 'boruvka'
+
     if graph.num_nodes() == 0:
         return msf
     if graph.num_edges() == 0:
         return msf
 
-    connected_components = get_connected_components_as_subgraphs(graph)
-    for subgraph in connected_components:
-        edge_list = kruskal_mst(subgraph)
-        msf.append(edge_list)
+    if method == 'kruskal':
+        # A forest with k trees over V nodes has exactly V - k edges
+        num_trees = len(get_weakly_connected_components(graph))
+        accepted_edges, ds = __kruskal(graph, graph.num_nodes() - num_trees, key)
+        find_tree = ds.find
+    elif method == 'boruvka':
+        accepted_edges, ds, index_lookup = __boruvka(graph, key, executor, workers)
+        find_tree = lambda n: ds.find(index_lookup[n])
+    else:
+        raise ValueError('Unknown minimum spanning forest method "{}"'.format(method))
+
+    # Group the accepted edges by the tree they ended up in, keeping a (possibly empty) list for every tree
+    tree_lookup = {}
+    for n in graph.get_all_node_ids():
+        root = find_tree(n)
+        if root not in tree_lookup:
+            tree_lookup[root] = []
+            msf.append(tree_lookup[root])
+    for edge_id in accepted_edges:
+        node_a = graph.get_edge(edge_id)['vertices'][0]
+        tree_lookup[find_tree(node_a)].append(edge_id)
 
     return msf
 
 
-def find_minimum_spanning_forest_as_subgraphs(graph):
+def find_minimum_spanning_forest_as_subgraphs(graph, key=None, method=None, executor=None, workers=None):
     """Calculates the minimum spanning forest and returns a list of trees as subgraphs."""
-    forest = find_minimum_spanning_forest(graph)
+    forest = find_minimum_spanning_forest(graph, key, method, executor, workers)
     list_of_subgraphs = [get_subgraph_from_edge_list(graph, edge_list) for edge_list in forest]
 
     return list_of_subgraphs
 
 
-def kruskal_mst(graph):
+def kruskal_mst(graph, key=None):
     """Implements Kruskal's Algorithm for finding minimum spanning trees.
     Assumes a non-empty, connected graph.
+    By default edges are weighed by their cost; ''key'' can instead name a field of the edge data,
+    or be a function that takes an edge object and returns its weight.
+    """
+    accepted_edges, _ = __kruskal(graph, graph.num_nodes() - 1, key)
+    return accepted_edges
+
+
+def prim_mst(graph, key=None):
+    """Implements Prim's Algorithm for finding minimum spanning trees, using a heap with decrease-key.
+    Assumes a non-empty, connected graph. ''key'' works as in ''kruskal_mst''.
+    Edges are treated as undirected, as they are by Kruskal's algorithm.
     """
-    edges_accepted = 0
-    ds = DisjointSet()
-    pq = PriorityQueue()
+    weight_of = _weight_function(key)
+
+    # Build the incidence lists from the edges, so that directed edges can be followed both ways
+    incidence = dict((n, []) for n in graph.get_all_node_ids())
+    edge_lookup = {}
+    for edge in graph.get_all_edge_objects():
+        node_a, node_b = edge['vertices']
+        if node_a != node_b:
+            edge_id = edge['id']
+            edge_lookup[edge_id] = (node_a, node_b, weight_of(edge))
+            incidence[node_a].append(edge_id)
+            incidence[node_b].append(edge_id)
+
     accepted_edges = []
-    label_lookup = {}
+    in_tree = set()
+    # --Each queued node is keyed by the weight of the cheapest edge joining it to the tree
+    best_edge = {}
+    best_weight = {}
+    pq = IndexedPriorityQueue()
 
-    nodes = graph.get_all_node_ids()
-    num_vertices = len(nodes)
-    for n in nodes:
-        label = ds.add_set()
-        label_lookup[n] = label
+    n = next(iter(incidence))
+    while True:
+        in_tree.add(n)
+        for edge_id in incidence[n]:
+            node_a, node_b, weight = edge_lookup[edge_id]
+            m = node_b if node_a == n else node_a
+            if m in in_tree:
+                continue
+            if m not in best_weight or weight < best_weight[m]:
+                best_edge[m] = edge_id
+                best_weight[m] = weight
+                pq.put(m, weight)
 
-    edges = graph.get_all_edge_objects()
-    for e in edges:
-        pq.put(e['id'], e['cost'])
+        if pq.empty():
+            break
+        n = pq.get()
+        accepted_edges.append(best_edge[n])
+
+    return accepted_edges
+
+
+def boruvka_msf(graph, key=None, executor=None, workers=None):
+    """Implements Boruvka's Algorithm for finding minimum spanning forests.
+    Each round finds the cheapest edge leaving every tree and adds them all at once, so there are at most
+    O(log V) rounds. The search for the cheapest edges is split into chunks of the edge list, which
+    can run across worker processes with ''executor'' or ''workers''; the edges are placed in shared memory
+    so that the workers don't have to unpickle them every round.
+    Edge weights (see ''kruskal_mst'') must be numbers. Ties are broken by edge id.
+    Returns a list of the accepted edge ids.
+    """
+    accepted_edges, _, _ = __boruvka(graph, key, executor, workers)
+    return accepted_edges
+
+
+def __kruskal(graph, num_edges_needed, key):
+    """Runs Kruskal's Algorithm over the whole graph, stopping once ''num_edges_needed'' edges have been accepted.
+    Returns a tuple of the accepted edge ids, in order, and the disjoint set of the resulting trees.
+    """
+    weight_of = _weight_function(key)
+    ds = IndexedDisjointSet(graph.get_all_node_ids())
+    accepted_edges = []
 
-    while edges_accepted < (num_vertices - 1):
-        edge_id = pq.get()
+    if num_edges_needed <= 0:
+        return accepted_edges, ds
 
-        edge = graph.get_edge(edge_id)
+    # Sort the edges once up front; the sort is stable, so equal weights are taken in edge id order
+    edges = graph.get_all_edge_objects()
+    edges.sort(key=weight_of)
+
+    union = ds.union
+    for edge in edges:
         node_a, node_b = edge['vertices']
-        label_a = label_lookup[node_a]
-        label_b = label_lookup[node_b]
+        if union(node_a, node_b):
+            accepted_edges.append(edge['id'])
+            if len(accepted_edges) == num_edges_needed:
+                break
+
+    return accepted_edges, ds
+
+
+def _weight_function(key):
+    """Builds the function that returns the weight of an edge object for a ''key'' option."""
+    if key is None:
+        return lambda edge: edge['cost']
+    if callable(key):
+        return key
+    return lambda edge: edge['data'][key]
+
+
+def __boruvka(graph, key, executor, workers):
+    """Runs Boruvka's Algorithm over the whole graph.
+    Returns a tuple of the accepted edge ids, the disjoint set of the resulting trees over dense node indices,
+    and the lookup from node ids to dense node indices.
+    """
+    weight_of = _weight_function(key)
+    node_ids = graph.get_all_node_ids()
+    index_lookup = dict(zip(node_ids, range(len(node_ids))))
+    num_nodes = len(node_ids)
+
+    # --Edges are stored as parallel arrays; an edge's position doubles as its tie-breaker, since edges are in id order
+    edges = graph.get_all_edge_objects()
+    num_edges = len(edges)
+    sources = array('l', [index_lookup[e['vertices'][0]] for e in edges])
+    targets = array('l', [index_lookup[e['vertices'][1]] for e in edges])
+    weights = array('d', [weight_of(e) for e in edges])
+    edge_ids = [e['id'] for e in edges]
 
-        a_set = ds.find(label_a)
-        b_set = ds.find(label_b)
+    ds = IndexedDisjointSet(range(num_nodes))
+    labels = array('l', range(num_nodes))
+    accepted_edges = []
+    if num_edges == 0:
+        # --There's nothing to contract, and no work to hand out to the workers
+        return accepted_edges, ds, index_lookup
+
+    use_workers = executor is not None or (workers is not None and workers > 1)
+    own_pool = None
+    if use_workers:
+        # --Keep a single pool for all of the rounds, rather than starting a new one each round
+        if executor is None:
+            own_pool = ProcessPoolExecutor(max_workers=workers)
+            executor = own_pool
+        num_chunks = 4 * (workers if workers is not None and workers > 1 else 4)
+        chunk_size = max(1, -(-num_edges // num_chunks))
+        blocks = [share_array(values) for values in (sources, targets, weights, labels)]
+        names = tuple(block.name for block in blocks)
+        tasks = [(names, num_edges, num_nodes, start, min(start + chunk_size, num_edges))
+                 for start in range(0, num_edges, chunk_size)]
+        label_block, label_view = attach_array(names[3], 'l', num_nodes)
+
+    try:
+        while True:
+            # Find the cheapest edge leaving each tree, as (weight, position) pairs keyed by tree label
+            if use_workers:
+                chunk_results = parallel_map(_cheapest_edges_task, tasks, executor=executor)
+            else:
+                chunk_results = [_cheapest_edges(sources, targets, weights, labels, 0, num_edges)]
+            cheapest = chunk_results[0]
+            for chunk_cheapest in chunk_results[1:]:
+                for label, entry in chunk_cheapest.items():
+                    current = cheapest.get(label)
+                    if current is None or entry < current:
+                        cheapest[label] = entry
+            if len(cheapest) == 0:
+                break
+
+            # Contract along the cheapest edges; with ties broken by position, they can't form a cycle
+            for _, i in cheapest.values():
+                if ds.union(sources[i], targets[i]):
+                    accepted_edges.append(edge_ids[i])
+
+            find = ds.find
+            for n in range(num_nodes):
+                labels[n] = find(n)
+            if use_workers:
+                label_view[:] = labels
+    finally:
+        if use_workers:
+            label_view.release()
+            label_block.close()
+            for block in blocks:
+                block.close()
+                block.unlink()
+        if own_pool is not None:
+            own_pool.shutdown()
+
+    return accepted_edges, ds, index_lookup
+
+
+def _cheapest_edges(sources, targets, weights, labels, start, end):
+    """Finds the cheapest edge leaving each tree among the edges at positions ''start'' to ''end''.
+    Returns a dict mapping tree labels to (weight, position) pairs.
+    """
+    cheapest = {}
+    for i in range(start, end):
+        label_a = labels[sources[i]]
+        label_b = labels[targets[i]]
+        if label_a == label_b:
+            continue
+        entry = (weights[i], i)
+        current = cheapest.get(label_a)
+        if current is None or entry < current:
+            cheapest[label_a] = entry
+        current = cheapest.get(label_b)
+        if current is None or entry < current:
+            cheapest[label_b] = entry
+    return cheapest
 
-        if a_set != b_set:
-            edges_accepted += 1
-            accepted_edges.append(edge_id)
-            ds.union(a_set, b_set)
 
-    return accepted_edges
\ No newline at end of file
+def _cheapest_edges_task(task):
+    """Worker entry point: runs ''_cheapest_edges'' on a chunk of the edge arrays held in shared memory."""
+    names, num_edges, num_nodes, start, end = task
+    attached = [attach_array(name, typecode, length)
+                for name, typecode, length in zip(names, 'lldl', (num_edges, num_edges, num_edges, num_nodes))]
+    try:
+        return _cheapest_edges(*[view for _, view in attached], start=start, end=end)
+    finally:
+        for block, view in attached:
+            view.release()
+            block.close()
@@ -0,0 +1,220 @@
+"""Implements an index for answering path queries on spanning trees and forests."""
+
+from array import array
+from collections import deque
+
+from ..exceptions import NonexistentNodeError, NonexistentEdgeError, DisconnectedGraphError
+from .spanning_tree import _weight_function
+
+
+class TreeQueryIndex(object):
+    """Answers lowest common ancestor, bottleneck edge and distance queries on a forest of graph edges.
+    Each tree is rooted and every node stores its ancestors and the heaviest edge at each power-of-two
+    distance above it (binary lifting), so building the index takes O(n log n) time and each query
+    takes O(log n) time.
+    By default edges are weighed by their cost; ''key'' can instead name a field of the edge data,
+    or be a function that takes an edge object and returns its weight.
+    """
+
+    def __init__(self, graph, edge_list, key=None, roots=None):
+        """''edge_list'' holds the edge ids of a spanning tree or forest, such as those returned by
+        ''find_minimum_spanning_tree''; a list of trees, as returned by ''find_minimum_spanning_forest'',
+        is also accepted. Edges are treated as undirected, and are assumed to form a forest.
+        Nodes of the graph that aren't touched by any edge form single-node trees.
+        ''roots'' optionally lists the nodes to root trees at; other trees are rooted at their first node.
+        """
+        weight_of = _weight_function(key)
+        edge_list = [edge_id for item in edge_list for edge_id in (item if isinstance(item, list) else [item])]
+
+        node_ids = graph.get_all_node_ids()
+        self.__index_lookup = index_lookup = dict(zip(node_ids, range(len(node_ids))))
+        num_nodes = len(node_ids)
+
+        adjacency = [[] for _ in range(num_nodes)]
+        for edge_id in edge_list:
+            edge = graph.get_edge(edge_id)
+            a, b = edge['vertices']
+            a = index_lookup[a]
+            b = index_lookup[b]
+            adjacency[a].append((b, edge_id, weight_of(edge)))
+            adjacency[b].append((a, edge_id, weight_of(edge)))
+
+        # Root each tree and record, for every node, its parent, depth and the edge up to its parent
+        parents = array('l', [-1]) * num_nodes
+        depths = array('l', [0]) * num_nodes
+        tree_roots = array('l', [-1]) * num_nodes
+        self.__parent_edges = parent_edges = [None] * num_nodes
+        self.__parent_weights = parent_weights = [None] * num_nodes
+        self.__distances = distances = [0] * num_nodes
+        root_order = [self.__index_of(n) for n in roots] if roots is not None else []
+        for root in root_order + list(range(num_nodes)):
+            if tree_roots[root] >= 0:
+                continue
+            tree_roots[root] = root
+            parents[root] = root
+            to_explore = deque([root])
+            while len(to_explore) > 0:
+                n = to_explore.popleft()
+                for m, edge_id, weight in adjacency[n]:
+                    if tree_roots[m] >= 0:
+                        continue
+                    tree_roots[m] = root
+                    parents[m] = n
+                    depths[m] = depths[n] + 1
+                    parent_edges[m] = edge_id
+                    parent_weights[m] = weight
+                    distances[m] = distances[n] + weight
+                    to_explore.append(m)
+        self.__depths = depths
+        self.__tree_roots = tree_roots
+        self.__parents = parents
+
+        # Build the jump tables: level k holds the 2^k-th ancestor of each node, and the node (below that ancestor)
+        # whose parent edge is the heaviest on the way up; -1 marks a jump that doesn't cross any edges
+        jumps = [parents]
+        heaviest = [array('l', [-1 if parents[i] == i else i for i in range(num_nodes)])]
+        max_depth = max(depths) if num_nodes > 0 else 0
+        while (1 << len(jumps)) <= max_depth:
+            previous_jump = jumps[-1]
+            previous_heaviest = heaviest[-1]
+            jump = array('l', previous_jump)
+            best = array('l', previous_heaviest)
+            for i in range(num_nodes):
+                middle = previous_jump[i]
+                jump[i] = previous_jump[middle]
+                best[i] = self.__heavier(previous_heaviest[i], previous_heaviest[middle])
+            jumps.append(jump)
+            heaviest.append(best)
+        self.__jumps = jumps
+        self.__heaviest = heaviest
+        self.__node_ids = node_ids
+
+    @classmethod
+    def from_parent_map(cls, graph, parent_lookup, key=None):
+        """Builds an index from a parent lookup dict, such as the one returned by
+        ''depth_first_search_with_parent_data''. Roots are their own parents.
+        Where several edges join a node to its parent, the lightest one is used.
+        """
+        weight_of = _weight_function(key)
+        edge_list = []
+        roots = []
+        for child, parent in parent_lookup.items():
+            if child == parent:
+                roots.append(child)
+                continue
+            edge_ids = graph.get_edge_ids_by_node_ids(parent, child) + graph.get_edge_ids_by_node_ids(child, parent)
+            if not edge_ids:
+                raise NonexistentEdgeError((parent, child))
+            edge_list.append(min(edge_ids, key=lambda edge_id: weight_of(graph.get_edge(edge_id))))
+        return cls(graph, edge_list, key, roots)
+
+    def same_tree(self, node_a, node_b):
+        """Determines whether node_a and node_b are in the same tree."""
+        return self.__tree_roots[self.__index_of(node_a)] == self.__tree_roots[self.__index_of(node_b)]
+
+    def lca(self, node_a, node_b):
+        """Returns the lowest common ancestor of node_a and node_b in their rooted tree."""
+        a, b = self.__verify_pair(node_a, node_b)
+        return self.__node_ids[self.__climb(a, b)[0]]
+
+    def path_max_edge(self, node_a, node_b):
+        """Returns the id of the heaviest edge on the tree path between node_a and node_b.
+        Returns None if node_a and node_b are the same node.
+        """
+        a, b = self.__verify_pair(node_a, node_b)
+        best = self.__climb(a, b)[1]
+        return None if best < 0 else self.__parent_edges[best]
+
+    def tree_distance(self, node_a, node_b):
+        """Returns the total weight of the tree path between node_a and node_b."""
+        a, b = self.__verify_pair(node_a, node_b)
+        ancestor = self.__climb(a, b)[0]
+        distances = self.__distances
+        return distances[a] + distances[b] - 2 * distances[ancestor]
+
+    def is_on_path(self, node_id, node_a, node_b):
+        """Determines whether the node lies on the tree path between node_a and node_b, including its ends."""
+        a, b = self.__verify_pair(node_a, node_b)
+        n = self.__index_of(node_id)
+        if self.__tree_roots[n] != self.__tree_roots[a]:
+            return False
+        # The node is on the path iff it is below the lowest common ancestor, and above one of the ends
+        ancestor = self.__climb(a, b)[0]
+        return self.__climb(n, ancestor)[0] == ancestor and \
+            (self.__climb(n, a)[0] == n or self.__climb(n, b)[0] == n)
+
+    def path_nodes(self, node_a, node_b):
+        """Returns the list of nodes on the tree path from node_a to node_b, including both ends."""
+        a, b = self.__verify_pair(node_a, node_b)
+        ancestor = self.__climb(a, b)[0]
+        parents = self.__parents
+        up = [a]
+        while up[-1] != ancestor:
+            up.append(parents[up[-1]])
+        down = []
+        n = b
+        while n != ancestor:
+            down.append(n)
+            n = parents[n]
+        node_ids = self.__node_ids
+        return [node_ids[i] for i in up + down[::-1]]
+
+    def depth(self, node_id):
+        """Returns the number of edges between the node and the root of its tree."""
+        return self.__depths[self.__index_of(node_id)]
+
+    def __climb(self, a, b):
+        """Lifts two nodes of the same tree to their lowest common ancestor.
+        Returns a tuple of the ancestor and the node whose parent edge is the heaviest on the path (or -1)."""
+        jumps = self.__jumps
+        heaviest = self.__heaviest
+        depths = self.__depths
+        best = -1
+
+        if depths[a] < depths[b]:
+            a, b = b, a
+        difference = depths[a] - depths[b]
+        level = 0
+        while difference > 0:
+            if difference & 1:
+                best = self.__heavier(best, heaviest[level][a])
+                a = jumps[level][a]
+            difference >>= 1
+            level += 1
+
+        if a == b:
+            return a, best
+
+        for level in range(len(jumps) - 1, -1, -1):
+            if jumps[level][a] != jumps[level][b]:
+                best = self.__heavier(best, heaviest[level][a])
+                best = self.__heavier(best, heaviest[level][b])
+                a = jumps[level][a]
+                b = jumps[level][b]
+        best = self.__heavier(best, heaviest[0][a])
+        best = self.__heavier(best, heaviest[0][b])
+        return jumps[0][a], best
+
+    def __heavier(self, a, b):
+        """Returns whichever of two nodes has the heavier parent edge, treating -1 as no edge."""
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        weights = self.__parent_weights
+        return b if weights[b] > weights[a] else a
+
+    def __verify_pair(self, node_a, node_b):
+        """Returns the indices of two nodes, raising an error unless they are in the same tree."""
+        a = self.__index_of(node_a)
+        b = self.__index_of(node_b)
+        if self.__tree_roots[a] != self.__tree_roots[b]:
+            raise DisconnectedGraphError
+        return a, b
+
+    def __index_of(self, node_id):
+        """Returns the index of a node."""
+        try:
+            return self.__index_lookup[node_id]
+        except KeyError:
+            raise NonexistentNodeError(node_id)
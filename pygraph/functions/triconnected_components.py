@@ -0,0 +1,810 @@
+"""Implements functionality to find triconnected components, separation pairs and SPQR trees."""
+
+from collections import defaultdict
+
+from ..classes import UndirectedGraph
+from ..helpers import make_subgraph, IndexedDisjointSet
+from .biconnected_components import find_biconnected_components
+
+
+def find_triconnected_components(graph):
+    """Finds all the triconnected components of a graph: the bonds, polygons and triconnected graphs
+    its biconnected components split into.
+    Returns a list of lists, each containing the edges of the graph that belong to a triconnected component.
+    Virtual edges are left out, so a component can be an empty list; use ''build_spqr_trees'' to get them.
+    Returns an empty list for an empty graph.
+    """
+    list_of_components = []
+    for spqr_tree in build_spqr_trees(graph):
+        list_of_components.extend(spqr_tree.component_edges)
+    return list_of_components
+
+
+def find_separation_pairs(graph):
+    """Finds all the separation pairs of a graph: the pairs of nodes whose removal disconnects
+    the biconnected component they belong to.
+    Returns a list of (node_a, node_b) tuples, with node_a < node_b.
+    Returns an empty list for an empty graph.
+    """
+    separation_pairs = set()
+    for spqr_tree in build_spqr_trees(graph):
+        separation_pairs.update(spqr_tree.get_separation_pairs())
+    return sorted(separation_pairs)
+
+
+def build_spqr_trees(graph):
+    """Builds the SPQR tree of each biconnected component found by ''find_biconnected_components''.
+    Returns a list of SPQRTree objects.
+    """
+    return [build_spqr_tree(graph, edge_list) for edge_list in find_biconnected_components(graph)]
+
+
+def build_spqr_tree(graph, edge_list=None):
+    """Builds the SPQR tree of a biconnected component, given by the list of its edges.
+    If no edge list is given, the entire graph is used, and must be biconnected.
+    Returns an SPQRTree object.
+    """
+    if edge_list is None:
+        edge_list = graph.get_all_edge_ids()
+    components, virtual_edges = _internal_split_block(graph, edge_list)
+    return SPQRTree(graph, components, virtual_edges)
+
+
+class SPQRTree(object):
+    """The SPQR tree of a biconnected component: a tree of its triconnected components, joined by virtual edges.
+    Each component is an S node (a polygon: a simple cycle), a P node (a bond: a pair of nodes joined by
+    three or more edges) or an R node (a triconnected simple graph). Each virtual edge joins the two nodes
+    of a separation pair, and is shared by the two components that were split apart there.
+    A block with only two nodes isn't split: a single edge makes up a lone Q node, and two parallel edges a P node.
+    A block is planar exactly when the skeletons of all its R nodes are, so planarity-related queries
+    can be answered on the (usually much smaller) rigid components.
+    The tree is a snapshot and does not follow later changes to the graph.
+
+    Attributes:
+        * tree:                    the SPQR tree, as an UndirectedGraph; the data of each of its nodes holds the
+                                   'component' index, and the data of each of its edges the 'virtual_edge' index
+        * component_types:         a list of the type of each component: 'S', 'P', 'R' or 'Q'
+        * component_edges:         a list of the edges of the graph in each component
+        * component_virtual_edges: a list of the virtual edges in each component, by index
+        * virtual_edges:           a list of the (node_a, node_b) pair joined by each virtual edge
+    """
+
+    def __init__(self, graph, components, virtual_edges):
+        self.__graph = graph
+        self.component_types = [component_type for component_type, _, _ in components]
+        self.component_edges = [edge_list for _, edge_list, _ in components]
+        self.component_virtual_edges = [virtual_edge_list for _, _, virtual_edge_list in components]
+        self.virtual_edges = list(virtual_edges)
+
+        self.tree = UndirectedGraph()
+        tree_nodes = []
+        for index in range(len(components)):
+            tree_node = self.tree.new_node()
+            self.tree.get_node(tree_node)['data']['component'] = index
+            tree_nodes.append(tree_node)
+        virtual_edge_components = defaultdict(list)
+        for index, virtual_edge_list in enumerate(self.component_virtual_edges):
+            for virtual_edge in virtual_edge_list:
+                virtual_edge_components[virtual_edge].append(index)
+        for virtual_edge, (index_a, index_b) in sorted(virtual_edge_components.items()):
+            tree_edge = self.tree.new_edge(tree_nodes[index_a], tree_nodes[index_b])
+            self.tree.get_edge(tree_edge)['data']['virtual_edge'] = virtual_edge
+
+    def num_components(self):
+        """Returns the number of triconnected components."""
+        return len(self.component_types)
+
+    def get_components_of_type(self, component_type):
+        """Returns a list of the indices of the components of the given type: 'S', 'P', 'R' or 'Q'."""
+        return [index for index, t in enumerate(self.component_types) if t == component_type]
+
+    def get_vertices(self, index):
+        """Returns a list of the nodes in a component."""
+        node_set = set()
+        for edge_id in self.component_edges[index]:
+            node_set.update(self.__graph.get_edge(edge_id)['vertices'])
+        for virtual_edge in self.component_virtual_edges[index]:
+            node_set.update(self.virtual_edges[virtual_edge])
+        return sorted(node_set)
+
+    def get_skeleton(self, index):
+        """Builds the skeleton of a component as a graph, with the same node and edge ids as the original graph.
+        Each virtual edge is added as a new edge, whose data holds its 'virtual_edge' index.
+        """
+        skeleton = make_subgraph(self.__graph, self.get_vertices(index), self.component_edges[index])
+        for virtual_edge in self.component_virtual_edges[index]:
+            node_a, node_b = self.virtual_edges[virtual_edge]
+            edge_id = skeleton.new_edge(node_a, node_b)
+            skeleton.get_edge(edge_id)['data']['virtual_edge'] = virtual_edge
+        return skeleton
+
+    def get_separation_pairs(self):
+        """Returns a list of the separation pairs of the block, as (node_a, node_b) tuples with node_a < node_b."""
+        separation_pairs = set()
+
+        # Any two nodes that aren't neighbors on a polygon split it into two paths
+        for index in self.get_components_of_type('S'):
+            vertices = self.get_vertices(index)
+            cycle_pairs = set(self.__pair(*self.__graph.get_edge(edge_id)['vertices'])
+                              for edge_id in self.component_edges[index])
+            cycle_pairs.update(self.__pair(*self.virtual_edges[virtual_edge])
+                               for virtual_edge in self.component_virtual_edges[index])
+            for position, node_a in enumerate(vertices):
+                for node_b in vertices[position + 1:]:
+                    if (node_a, node_b) not in cycle_pairs:
+                        separation_pairs.add((node_a, node_b))
+
+        # The ends of a virtual edge separate the two sides of the tree, unless one side is just a bundle
+        # of parallel edges between them
+        for tree_edge in self.tree.get_all_edge_ids():
+            virtual_edge = self.tree.get_edge(tree_edge)['data']['virtual_edge']
+            is_separating = True
+            for tree_node in self.tree.get_edge(tree_edge)['vertices']:
+                index = self.tree.get_node(tree_node)['data']['component']
+                if self.component_types[index] == 'P' and len(self.component_virtual_edges[index]) == 1:
+                    is_separating = False
+            if is_separating:
+                separation_pairs.add(self.__pair(*self.virtual_edges[virtual_edge]))
+
+        return sorted(separation_pairs)
+
+    def __pair(self, node_a, node_b):
+        """Orders the nodes of a pair, so that it can be looked up regardless of direction."""
+        return (node_a, node_b) if node_a < node_b else (node_b, node_a)
+
+
+# Helper functions
+def _internal_split_block(graph, edge_list):
+    """Splits a biconnected component into its triconnected components.
+    Bundles of parallel edges are first split off as bonds; the rest of the block is then split into bonds,
+    triangles and triconnected graphs with a single path search, after which adjacent bonds and adjacent polygons
+    are merged, which makes the components unique. This takes O(V + E) time overall.
+    Self-loops are left out, as they are by ''find_biconnected_components''.
+    Returns a tuple of the list of components, each a tuple of (type, edge list, virtual edge list),
+    and the list of the pair of nodes joined by each virtual edge.
+    """
+    edge_list = [edge_id for edge_id in edge_list if len(set(graph.get_edge(edge_id)['vertices'])) == 2]
+    splitter = _TriconnectedSplitter(graph, edge_list)
+    pieces = splitter.split()
+    return __merge_pieces(pieces, edge_list, splitter.get_virtual_edge_endpoints())
+
+
+def __merge_pieces(pieces, edge_list, endpoints):
+    """Merges the bonds and polygons that share a virtual edge with one of the same type, and numbers the
+    remaining virtual edges. ''pieces'' is a list of (type, keys) tuples, where the keys below the length of
+    ''edge_list'' stand for its edges, and the rest are virtual edges joining the pair of nodes in ''endpoints''."""
+    num_real_edges = len(edge_list)
+    merged = IndexedDisjointSet(range(len(pieces)))
+    key_pieces = defaultdict(list)
+    for index, (_, keys) in enumerate(pieces):
+        for key in keys:
+            if key >= num_real_edges:
+                key_pieces[key].append(index)
+    merged_keys = set()
+    for key, (index_a, index_b) in key_pieces.items():
+        piece_type = pieces[index_a][0]
+        if piece_type != 'R' and piece_type == pieces[index_b][0]:
+            merged.union(index_a, index_b)
+            merged_keys.add(key)
+
+    component_of = {}
+    components = []
+    virtual_edge_index = {}
+    virtual_edges = []
+    for index, (piece_type, keys) in enumerate(pieces):
+        root = merged.find(index)
+        if root not in component_of:
+            component_of[root] = len(components)
+            components.append((piece_type, [], []))
+        _, component_edges, component_virtual_edges = components[component_of[root]]
+        for key in keys:
+            if key < num_real_edges:
+                component_edges.append(edge_list[key])
+            elif key not in merged_keys:
+                if key not in virtual_edge_index:
+                    virtual_edge_index[key] = len(virtual_edges)
+                    virtual_edges.append(endpoints[key])
+                component_virtual_edges.append(virtual_edge_index[key])
+    for _, component_edges, component_virtual_edges in components:
+        component_edges.sort()
+        component_virtual_edges.sort()
+
+    return components, virtual_edges
+
+
+_TREE_ARC = 1
+_FROND = 2
+
+# --Marks the bottom of each segment of the triple stack
+_END_OF_STACK = -1
+
+
+class _TriconnectedSplitter(object):
+    """Splits a biconnected multigraph into bonds, triangles and triconnected graphs, as per
+    "Dividing a Graph into Triconnected Components" by Hopcroft and Tarjan, with the corrections from
+    "A Linear Time Implementation of SPQR-Trees" by Gutwenger and Mutzel.
+    Location: https://doi.org/10.1137/0202012 and https://doi.org/10.1007/3-540-44541-2_8
+
+    Edges are referred to by keys: the first ones stand for the edges of the block, in the order given, and the
+    rest are the virtual edges added while splitting. Nodes are numbered densely from 0 internally.
+    Every DFS is run with explicit stacks, so large blocks don't run into the recursion limit.
+    """
+
+    def __init__(self, graph, edge_list):
+        node_lookup = {}
+        self.nodes = []
+        self.source = []
+        self.target = []
+        for edge_id in edge_list:
+            for node_id in graph.get_edge(edge_id)['vertices']:
+                if node_id not in node_lookup:
+                    node_lookup[node_id] = len(self.nodes)
+                    self.nodes.append(node_id)
+            node_a, node_b = graph.get_edge(edge_id)['vertices']
+            self.__new_edge(node_lookup[node_a], node_lookup[node_b])
+        self.num_real_edges = len(edge_list)
+        self.pieces = []
+
+    def get_virtual_edge_endpoints(self):
+        """Returns a list mapping each edge key to the pair of node ids it joins."""
+        nodes = self.nodes
+        return [(nodes[a], nodes[b]) for a, b in zip(self.source, self.target)]
+
+    def split(self):
+        """Splits the block, returning a list of pieces, each a tuple of (type, keys)."""
+        num_nodes = len(self.nodes)
+        keys = list(range(self.num_real_edges))
+        if num_nodes <= 2:
+            # --A single edge is the whole block, and any more edges form a bond
+            if len(keys) == 1:
+                return [('Q', keys)]
+            return [('P', keys)] if len(keys) > 0 else []
+
+        keys = self.__split_multiple_edges(keys)
+
+        self.__first_dfs(keys)
+        self.__build_acceptable_adjacency_lists(keys)
+        self.__path_finder()
+
+        self.__path_search()
+
+        # --Whatever is left on the edge stack is the last split component
+        if len(self.edge_stack) > 0:
+            self.__finish_triconnected_or_polygon(self.edge_stack, None)
+        return self.pieces
+
+    def __new_edge(self, node_a, node_b):
+        """Adds a new edge from node_a to node_b, returning its key."""
+        self.source.append(node_a)
+        self.target.append(node_b)
+        return len(self.source) - 1
+
+    def __split_multiple_edges(self, keys):
+        """Splits each bundle of parallel edges off as a bond, leaving a single virtual edge in its place.
+        Returns the keys of the remaining simple graph."""
+        bundles = defaultdict(list)
+        for key in keys:
+            node_a, node_b = self.source[key], self.target[key]
+            bundles[(node_a, node_b) if node_a < node_b else (node_b, node_a)].append(key)
+
+        simple_keys = []
+        for (node_a, node_b), bundle in bundles.items():
+            if len(bundle) == 1:
+                simple_keys.append(bundle[0])
+                continue
+            virtual_key = self.__new_edge(node_a, node_b)
+            self.pieces.append(('P', bundle + [virtual_key]))
+            simple_keys.append(virtual_key)
+        simple_keys.sort()
+        return simple_keys
+
+    def __first_dfs(self, keys):
+        """Runs the first DFS, which numbers the nodes, calculates their lowpoints and subtree sizes, and orients
+        the edges: tree arcs point away from the root, and fronds from a node to one of its ancestors."""
+        num_nodes = len(self.nodes)
+        incidence = [[] for _ in range(num_nodes)]
+        for key in keys:
+            incidence[self.source[key]].append(key)
+            incidence[self.target[key]].append(key)
+        self.degree = [len(keys_at_node) for keys_at_node in incidence]
+
+        edge_type = {}
+        number = [0] * num_nodes
+        father = [None] * num_nodes
+        tree_arc = [None] * num_nodes
+        lowpt1 = [0] * num_nodes
+        lowpt2 = [0] * num_nodes
+        descendants = [1] * num_nodes
+
+        root = 0
+        count = 1
+        number[root] = lowpt1[root] = lowpt2[root] = count
+        node_stack = [root]
+        position_stack = [0]
+        while len(node_stack) > 0:
+            v = node_stack[-1]
+            position = position_stack[-1]
+            if position == len(incidence[v]):
+                node_stack.pop()
+                position_stack.pop()
+                u = father[v]
+                if u is None:
+                    continue
+                # --Pass the lowpoints of the finished child on to its father
+                if lowpt1[v] < lowpt1[u]:
+                    lowpt2[u] = min(lowpt1[u], lowpt2[v])
+                    lowpt1[u] = lowpt1[v]
+                elif lowpt1[v] == lowpt1[u]:
+                    lowpt2[u] = min(lowpt2[u], lowpt2[v])
+                else:
+                    lowpt2[u] = min(lowpt2[u], lowpt1[v])
+                descendants[u] += descendants[v]
+                continue
+            position_stack[-1] = position + 1
+
+            key = incidence[v][position]
+            if key in edge_type:
+                continue
+            w = self.target[key] if self.source[key] == v else self.source[key]
+            if number[w] == 0:
+                edge_type[key] = _TREE_ARC
+                tree_arc[w] = key
+                father[w] = v
+                count += 1
+                number[w] = lowpt1[w] = lowpt2[w] = count
+                node_stack.append(w)
+                position_stack.append(0)
+            else:
+                edge_type[key] = _FROND
+                if number[w] < lowpt1[v]:
+                    lowpt2[v] = lowpt1[v]
+                    lowpt1[v] = number[w]
+                elif number[w] > lowpt1[v]:
+                    lowpt2[v] = min(lowpt2[v], number[w])
+
+        # Tree arcs go from father to child, and fronds from descendant to ancestor
+        for key in keys:
+            goes_up = number[self.target[key]] < number[self.source[key]]
+            if goes_up == (edge_type[key] == _TREE_ARC):
+                self.source[key], self.target[key] = self.target[key], self.source[key]
+
+        self.root = root
+        self.is_tree_arc = dict((key, edge_type[key] == _TREE_ARC) for key in keys)
+        self.number = number
+        self.father = father
+        self.tree_arc = tree_arc
+        self.lowpt1 = lowpt1
+        self.lowpt2 = lowpt2
+        self.descendants = descendants
+
+    def __build_acceptable_adjacency_lists(self, keys):
+        """Orders the outgoing edges of each node, so that the paths found by the path search come out in the
+        order the splitting needs; the lists are kept as doubly-linked lists, since edges get replaced and deleted.
+        """
+        num_nodes = len(self.nodes)
+        number = self.number
+        lowpt1 = self.lowpt1
+        lowpt2 = self.lowpt2
+        buckets = [[] for _ in range(3 * num_nodes + 3)]
+        for key in keys:
+            w = self.target[key]
+            if not self.is_tree_arc[key]:
+                phi = 3 * number[w] + 1
+            elif lowpt2[w] < number[self.source[key]]:
+                phi = 3 * lowpt1[w]
+            else:
+                phi = 3 * lowpt1[w] + 2
+            buckets[phi].append(key)
+
+        self.adjacency_head = [None] * num_nodes
+        self.adjacency_tail = [None] * num_nodes
+        self.adjacency_next = {}
+        self.adjacency_previous = {}
+        for bucket in buckets:
+            for key in bucket:
+                self.__adjacency_append(self.source[key], key)
+
+    def __path_finder(self):
+        """Runs the second DFS, along the ordered adjacency lists, which splits the tree into paths and
+        renumbers the nodes so that each path runs through decreasing numbers."""
+        num_nodes = len(self.nodes)
+        new_number = [0] * num_nodes
+        self.starts_path = set()
+        self.high_head = [None] * num_nodes
+        self.high_tail = [None] * num_nodes
+        self.high_next = {}
+        self.high_previous = {}
+        self.high_value = {}
+
+        count = num_nodes
+        new_path = True
+        root = self.root
+        new_number[root] = count - self.descendants[root] + 1
+        node_stack = [root]
+        next_stack = [self.adjacency_head[root]]
+        while len(node_stack) > 0:
+            v = node_stack[-1]
+            key = next_stack[-1]
+            if key is None:
+                node_stack.pop()
+                next_stack.pop()
+                count -= 1
+                continue
+            next_stack[-1] = self.adjacency_next[key]
+
+            w = self.target[key]
+            if new_path:
+                new_path = False
+                self.starts_path.add(key)
+            if self.is_tree_arc[key]:
+                new_number[w] = count - self.descendants[w] + 1
+                node_stack.append(w)
+                next_stack.append(self.adjacency_head[w])
+            else:
+                # --The highpoints of w are the numbers of the nodes with fronds to it, in the order they're found
+                self.__high_append(w, key, new_number[v])
+                new_path = True
+
+        old_to_new = [0] * (num_nodes + 1)
+        for v in range(num_nodes):
+            old_to_new[self.number[v]] = new_number[v]
+        self.node_at = [None] * (num_nodes + 1)
+        for v in range(num_nodes):
+            self.node_at[new_number[v]] = v
+            self.lowpt1[v] = old_to_new[self.lowpt1[v]]
+            self.lowpt2[v] = old_to_new[self.lowpt2[v]]
+        self.number = new_number
+
+    def __path_search(self):
+        """Runs the path search, which finds the separation pairs and splits off a component at each of them.
+        The triple stack holds the (h, a, b) triples of the candidate type-2 separation pairs {a, b}, h being the
+        highest node of the piece they split off; the edge stack holds the edges not yet split off."""
+        self.edge_stack = []
+        self.triple_h = [None]
+        self.triple_a = [_END_OF_STACK]
+        self.triple_b = [None]
+        self.current_edge = [None] * len(self.nodes)
+        number = self.number
+        lowpt1 = self.lowpt1
+        descendants = self.descendants
+        triple_h = self.triple_h
+        triple_a = self.triple_a
+        triple_b = self.triple_b
+
+        # --Each frame holds a node, the tree arc out of it being descended and the next edge to look at
+        root = self.root
+        frames = [[root, None, self.adjacency_head[root]]]
+        while len(frames) > 0:
+            frame = frames[-1]
+            v = frame[0]
+            if frame[1] is not None:
+                key = frame[1]
+                frame[1] = None
+                self.__finish_tree_arc(v, key, frame[2] is not None)
+                continue
+            key = frame[2]
+            if key is None:
+                frames.pop()
+                continue
+            frame[2] = self.adjacency_next[key]
+            self.current_edge[v] = key
+
+            v_number = number[v]
+            w = self.target[key]
+            w_number = number[w]
+            if self.is_tree_arc.get(key, False):
+                if key in self.starts_path:
+                    if triple_a[-1] > lowpt1[w]:
+                        y = 0
+                        while triple_a[-1] > lowpt1[w]:
+                            y = max(y, triple_h.pop())
+                            triple_a.pop()
+                            b = triple_b.pop()
+                        self.__push_triple(y, lowpt1[w], b)
+                    else:
+                        self.__push_triple(w_number + descendants[w] - 1, lowpt1[w], v_number)
+                    self.__push_triple(None, _END_OF_STACK, None)
+                # --Simulate the recursive call on w
+                frame[1] = key
+                frames.append([w, None, self.adjacency_head[w]])
+            else:
+                if key in self.starts_path:
+                    if triple_a[-1] > w_number:
+                        y = 0
+                        while triple_a[-1] > w_number:
+                            y = max(y, triple_h.pop())
+                            triple_a.pop()
+                            b = triple_b.pop()
+                        self.__push_triple(y, w_number, b)
+                    else:
+                        self.__push_triple(v_number, w_number, v_number)
+                self.edge_stack.append(key)
+
+    def __finish_tree_arc(self, v, key, has_more_edges):
+        """Checks for separation pairs once the path search returns to v along the tree arc ''key'',
+        splitting off the components found."""
+        number = self.number
+        degree = self.degree
+        edge_stack = self.edge_stack
+        triple_h = self.triple_h
+        triple_a = self.triple_a
+        triple_b = self.triple_b
+        v_number = number[v]
+        w = self.target[key]
+        w_number = number[w]
+
+        edge_stack.append(self.tree_arc[w])
+
+        # Type-2 separation pairs
+        while v_number != 1 and (triple_a[-1] == v_number or
+                                 (degree[w] == 2 and number[self.__first_child(w)] > w_number)):
+            a = triple_a[-1]
+            b = triple_b[-1]
+            if a == v_number and self.father[self.node_at[b]] == self.node_at[a]:
+                # --The pair is just a tree arc, which doesn't split anything off
+                self.__pop_triple()
+                continue
+
+            edge_ab = None
+            if degree[w] == 2 and number[self.__first_child(w)] > w_number:
+                # --w only lies on the path v -> w -> x, which is split off as a triangle
+                edge_1 = edge_stack.pop()
+                edge_2 = edge_stack.pop()
+                self.__adjacency_delete(edge_2)
+                x = self.target[edge_2]
+                virtual_key = self.__new_edge(v, x)
+                degree[x] -= 1
+                degree[v] -= 1
+                self.pieces.append(('S', [edge_1, edge_2, virtual_key]))
+
+                if len(edge_stack) > 0:
+                    top = edge_stack[-1]
+                    if self.source[top] == x and self.target[top] == v:
+                        edge_ab = edge_stack.pop()
+                        self.__adjacency_delete(edge_ab)
+                        self.__high_delete(edge_ab)
+            else:
+                h = triple_h[-1]
+                self.__pop_triple()
+                component = []
+                while len(edge_stack) > 0:
+                    top = edge_stack[-1]
+                    x = self.source[top]
+                    y = self.target[top]
+                    if not (a <= number[x] <= h and a <= number[y] <= h):
+                        break
+                    if (number[x] == a and number[y] == b) or (number[y] == a and number[x] == b):
+                        edge_ab = edge_stack.pop()
+                        self.__adjacency_delete(edge_ab)
+                        self.__high_delete(edge_ab)
+                    else:
+                        edge_stack.pop()
+                        if top != self.current_edge[v]:
+                            self.__adjacency_delete(top)
+                            self.__high_delete(top)
+                        component.append(top)
+                        degree[x] -= 1
+                        degree[y] -= 1
+                x = self.node_at[b]
+                virtual_key = self.__new_edge(self.node_at[a], x)
+                self.__finish_triconnected_or_polygon(component, virtual_key)
+
+            if edge_ab is not None:
+                # --The pair is also joined by an edge, so the virtual edge forms a bond with it
+                bond = [edge_ab, virtual_key]
+                virtual_key = self.__new_edge(v, x)
+                bond.append(virtual_key)
+                self.pieces.append(('P', bond))
+                degree[x] -= 1
+                degree[v] -= 1
+
+            # --The virtual edge takes the place of the tree arc from v
+            edge_stack.append(virtual_key)
+            self.__adjacency_replace(self.current_edge[v], virtual_key)
+            degree[x] += 1
+            degree[v] += 1
+            self.father[x] = v
+            self.tree_arc[x] = virtual_key
+            self.is_tree_arc[virtual_key] = True
+            w = x
+            w_number = number[w]
+
+        # Type-1 separation pair
+        lowpt1_w = self.lowpt1[w]
+        lowpt2_w = self.lowpt2[w]
+        descendants_w = self.descendants[w]
+        if lowpt2_w >= v_number and lowpt1_w < v_number and (self.father[v] != self.root or has_more_edges):
+            component = []
+            x_number = y_number = 0
+            while len(edge_stack) > 0:
+                top = edge_stack[-1]
+                x_number = number[self.source[top]]
+                y_number = number[self.target[top]]
+                if not (w_number <= x_number < w_number + descendants_w or
+                        w_number <= y_number < w_number + descendants_w):
+                    break
+                component.append(edge_stack.pop())
+                self.__high_delete(top)
+                degree[self.node_at[x_number]] -= 1
+                degree[self.node_at[y_number]] -= 1
+
+            lowpoint_node = self.node_at[lowpt1_w]
+            virtual_key = self.__new_edge(v, lowpoint_node)
+            self.__finish_triconnected_or_polygon(component, virtual_key)
+
+            if (x_number == v_number and y_number == lowpt1_w) or (y_number == v_number and x_number == lowpt1_w):
+                # --The pair is also joined by an edge, so the virtual edge forms a bond with it
+                edge_h = edge_stack.pop()
+                if edge_h != self.current_edge[v]:
+                    self.__adjacency_delete(edge_h)
+                bond = [edge_h, virtual_key]
+                virtual_key = self.__new_edge(v, lowpoint_node)
+                bond.append(virtual_key)
+                self.pieces.append(('P', bond))
+                self.__high_replace(edge_h, virtual_key)
+                degree[v] -= 1
+                degree[lowpoint_node] -= 1
+
+            if lowpoint_node != self.father[v]:
+                # --The virtual edge takes the place of the tree arc from v, as a frond
+                edge_stack.append(virtual_key)
+                self.__adjacency_replace(self.current_edge[v], virtual_key)
+                if virtual_key not in self.high_value and self.__high(lowpoint_node) < v_number:
+                    self.__high_push_front(lowpoint_node, virtual_key, v_number)
+                degree[v] += 1
+                degree[lowpoint_node] += 1
+            else:
+                # --The virtual edge parallels the tree arc into v, so the two form a bond with a new tree arc
+                self.__adjacency_delete(self.current_edge[v])
+                bond = [virtual_key]
+                virtual_key = self.__new_edge(lowpoint_node, v)
+                bond.append(virtual_key)
+                edge_h = self.tree_arc[v]
+                bond.append(edge_h)
+                self.pieces.append(('P', bond))
+                self.tree_arc[v] = virtual_key
+                self.is_tree_arc[virtual_key] = True
+                self.__adjacency_replace(edge_h, virtual_key)
+
+        if key in self.starts_path:
+            # --Drop the triples of the path that started here, along with its end of stack marker
+            while triple_a[-1] != _END_OF_STACK:
+                self.__pop_triple()
+            self.__pop_triple()
+
+        while triple_a[-1] != _END_OF_STACK and triple_b[-1] != v_number and self.__high(v) > triple_h[-1]:
+            self.__pop_triple()
+
+    def __finish_triconnected_or_polygon(self, component, virtual_key):
+        """Adds a split component, closed by a virtual edge if one is given; past the path that splits off
+        triangles, a split component with four or more edges is triconnected."""
+        keys = list(component)
+        if virtual_key is not None:
+            keys.append(virtual_key)
+        self.pieces.append(('R' if len(keys) >= 4 else 'S', keys))
+
+    def __first_child(self, v):
+        """Returns the node at the end of the first edge in the adjacency list of v."""
+        return self.target[self.adjacency_head[v]]
+
+    def __push_triple(self, h, a, b):
+        """Pushes a triple onto the triple stack."""
+        self.triple_h.append(h)
+        self.triple_a.append(a)
+        self.triple_b.append(b)
+
+    def __pop_triple(self):
+        """Pops the top triple off of the triple stack."""
+        self.triple_h.pop()
+        self.triple_a.pop()
+        self.triple_b.pop()
+
+    def __adjacency_append(self, v, key):
+        """Appends an edge to the adjacency list of v."""
+        tail = self.adjacency_tail[v]
+        self.adjacency_previous[key] = tail
+        self.adjacency_next[key] = None
+        if tail is None:
+            self.adjacency_head[v] = key
+        else:
+            self.adjacency_next[tail] = key
+        self.adjacency_tail[v] = key
+
+    def __adjacency_delete(self, key):
+        """Deletes an edge from the adjacency list of its source."""
+        if key not in self.adjacency_next:
+            return
+        v = self.source[key]
+        previous_key = self.adjacency_previous.pop(key)
+        next_key = self.adjacency_next.pop(key)
+        if previous_key is None:
+            self.adjacency_head[v] = next_key
+        else:
+            self.adjacency_next[previous_key] = next_key
+        if next_key is None:
+            self.adjacency_tail[v] = previous_key
+        else:
+            self.adjacency_previous[next_key] = previous_key
+
+    def __adjacency_replace(self, old_key, new_key):
+        """Puts a new edge in the place of an edge in the adjacency list of their common source."""
+        v = self.source[old_key]
+        previous_key = self.adjacency_previous.pop(old_key)
+        next_key = self.adjacency_next.pop(old_key)
+        self.adjacency_previous[new_key] = previous_key
+        self.adjacency_next[new_key] = next_key
+        if previous_key is None:
+            self.adjacency_head[v] = new_key
+        else:
+            self.adjacency_next[previous_key] = new_key
+        if next_key is None:
+            self.adjacency_tail[v] = new_key
+        else:
+            self.adjacency_previous[next_key] = new_key
+        if self.current_edge[v] == old_key:
+            self.current_edge[v] = new_key
+
+    def __high(self, v):
+        """Returns the first highpoint of v, or 0 if it has none."""
+        head = self.high_head[v]
+        return 0 if head is None else self.high_value[head]
+
+    def __high_append(self, v, key, value):
+        """Appends the highpoint given by the frond ''key'' to the highpoints of v."""
+        tail = self.high_tail[v]
+        self.high_value[key] = value
+        self.high_previous[key] = tail
+        self.high_next[key] = None
+        if tail is None:
+            self.high_head[v] = key
+        else:
+            self.high_next[tail] = key
+        self.high_tail[v] = key
+
+    def __high_push_front(self, v, key, value):
+        """Adds the highpoint given by the frond ''key'' to the front of the highpoints of v."""
+        head = self.high_head[v]
+        self.high_value[key] = value
+        self.high_previous[key] = None
+        self.high_next[key] = head
+        if head is None:
+            self.high_tail[v] = key
+        else:
+            self.high_previous[head] = key
+        self.high_head[v] = key
+
+    def __high_delete(self, key):
+        """Deletes the highpoint given by the frond ''key'', if it has one."""
+        if key not in self.high_value:
+            return
+        v = self.target[key]
+        del self.high_value[key]
+        previous_key = self.high_previous.pop(key)
+        next_key = self.high_next.pop(key)
+        if previous_key is None:
+            self.high_head[v] = next_key
+        else:
+            self.high_next[previous_key] = next_key
+        if next_key is None:
+            self.high_tail[v] = previous_key
+        else:
+            self.high_previous[next_key] = previous_key
+
+    def __high_replace(self, old_key, new_key):
+        """Hands the highpoint given by the frond ''old_key'' over to ''new_key'', which ends at the same node."""
+        if old_key not in self.high_value:
+            return
+        v = self.target[old_key]
+        self.high_value[new_key] = self.high_value.pop(old_key)
+        previous_key = self.high_previous.pop(old_key)
+        next_key = self.high_next.pop(old_key)
+        self.high_previous[new_key] = previous_key
+        self.high_next[new_key] = next_key
+        if previous_key is None:
+            self.high_head[v] = new_key
+        else:
+            self.high_next[previous_key] = new_key
+        if next_key is None:
+            self.high_tail[v] = new_key
+        else:
+            self.high_previous[next_key] = new_key
@@ -0,0 +1,91 @@
+"""Implements an optional NumPy backend for finding connected components on large graphs."""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .connected_components import get_weakly_connected_components
+
+
+def export_edge_arrays(graph):
+    """Exports the edges of a graph as a pair of NumPy arrays of dense node indices.
+    Returns a tuple of (node_ids, sources, targets), where node_ids maps dense indices back to node ids.
+    Requires NumPy.
+    """
+    node_ids = graph.get_all_node_ids()
+    index_lookup = dict(zip(node_ids, range(len(node_ids))))
+
+    edges = graph.get_all_edge_objects()
+    sources = numpy.fromiter((index_lookup[e['vertices'][0]] for e in edges), dtype=numpy.int64, count=len(edges))
+    targets = numpy.fromiter((index_lookup[e['vertices'][1]] for e in edges), dtype=numpy.int64, count=len(edges))
+
+    return node_ids, sources, targets
+
+
+def connected_component_labels(num_nodes, sources, targets):
+    """Labels the connected components of the graph given by edge arrays over the nodes 0..num_nodes-1.
+    Edges are treated as undirected. Returns an array mapping each node to the smallest node index
+    in its component.
+    Uses min-label propagation with pointer jumping: each round hooks the larger of the two root labels
+    on every edge onto the smaller one, then jumps pointers until every node points directly at a root.
+    Requires NumPy.
+    """
+    labels = numpy.arange(num_nodes, dtype=numpy.int64)
+    sources = numpy.asarray(sources, dtype=numpy.int64)
+    targets = numpy.asarray(targets, dtype=numpy.int64)
+
+    while True:
+        source_labels = labels[sources]
+        target_labels = labels[targets]
+        differing = source_labels != target_labels
+        if not differing.any():
+            break
+
+        # --Only edges that still join two different trees matter from here on
+        sources = sources[differing]
+        targets = targets[differing]
+        source_labels = source_labels[differing]
+        target_labels = target_labels[differing]
+
+        # Hook each larger root onto the smallest root it shares an edge with
+        low = numpy.minimum(source_labels, target_labels)
+        high = numpy.maximum(source_labels, target_labels)
+        numpy.minimum.at(labels, high, low)
+
+        # Pointer jumping: every node ends up pointing directly at its root
+        while True:
+            jumped = labels[labels]
+            if numpy.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+    return labels
+
+
+def get_connected_components_vectorized(graph):
+    """Finds all connected components of the graph using batched NumPy array operations.
+    Edges are treated as undirected, so on a directed graph this finds the weakly connected components.
+    Falls back to the pure-Python implementation when NumPy is not installed.
+    Returns a list of lists, each containing the nodes that form a connected component.
+    Returns an empty list for an empty graph.
+    """
+    if numpy is None:
+        return get_weakly_connected_components(graph)
+
+    node_ids, sources, targets = export_edge_arrays(graph)
+    if not node_ids:
+        return []
+
+    labels = connected_component_labels(len(node_ids), sources, targets)
+
+    # Group the nodes by label: sorting brings each component together, in order of its smallest node index
+    order = numpy.argsort(labels, kind='stable')
+    sorted_labels = labels[order]
+    boundaries = numpy.flatnonzero(sorted_labels[1:] != sorted_labels[:-1]) + 1
+
+    list_of_components = []
+    for component_indices in numpy.split(order, boundaries):
+        list_of_components.append([node_ids[i] for i in component_indices.tolist()])
+
+    return list_of_components
@@ -2,4 +2,8 @@ from .functions import (make_subgraph, merge_graphs, convert_graph_directed_to_u
                       remove_duplicate_edges_directed, remove_duplicate_edges_undirected,
                       get_vertices_from_edge_list, get_subgraph_from_edge_list, create_graph_from_adjacency_matrix)
 
-from .classes import DisjointSet, PriorityQueue
+from .classes import (DisjointSet, IndexedDisjointSet, RollbackDisjointSet, PriorityQueue, IndexedPriorityQueue,
+                      CSRGraph, EulerTourForest, LinkCutTree)
+
+from .parallel import (parallel_map, share_array, attach_array, pack_subgraph, unpack_subgraph, batch_by_size,
+                       MIN_BATCH_EDGES)
@@ -1,2 +1,7 @@
 from .disjoint_set import DisjointSet
-from .priority_queue import PriorityQueue
+from .indexed_disjoint_set import IndexedDisjointSet
+from .priority_queue import PriorityQueue, IndexedPriorityQueue
+from .csr_graph import CSRGraph
+from .euler_tour_forest import EulerTourForest
+from .link_cut_tree import LinkCutTree
+from .rollback_disjoint_set import RollbackDisjointSet
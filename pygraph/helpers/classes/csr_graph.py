@@ -0,0 +1,77 @@
+"""Implements a frozen, array-backed adjacency structure for read-heavy algorithms."""
+
+from array import array
+
+from ...exceptions import NonexistentNodeError
+
+
+class CSRGraph(object):
+    """A compressed sparse row (CSR) snapshot of the adjacency of a graph.
+    Nodes are renumbered densely as 0..n-1 in the order given by ''node_ids''; the neighbors of
+    the node with index i are indices[indptr[i]:indptr[i+1]], reached through the graph edges
+    edge_ids[indptr[i]:indptr[i+1]]. Every edge produces one entry per direction it can be followed in,
+    so parallel edges are kept. The snapshot does not track later changes to the graph.
+    """
+
+    node_ids = None
+    indptr = None
+    indices = None
+    edge_ids = None
+
+    def __init__(self, node_ids, indptr, indices, edge_ids):
+        self.node_ids = node_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_ids = edge_ids
+        self.__index_lookup = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Builds a CSR snapshot of the edges that ''graph.neighbors'' would follow."""
+        node_ids = graph.get_all_node_ids()
+        index_lookup = dict(zip(node_ids, range(len(node_ids))))
+
+        indptr = array('l', [0])
+        indices = array('l')
+        edge_ids = array('l')
+        for node_id in node_ids:
+            for edge_id in graph.get_node(node_id)['edges']:
+                a, b = graph.get_edge(edge_id)['vertices']
+                indices.append(index_lookup[b if a == node_id else a])
+                edge_ids.append(edge_id)
+            indptr.append(len(indices))
+
+        csr = cls(node_ids, indptr, indices, edge_ids)
+        csr.__index_lookup = index_lookup
+        return csr
+
+    def __getstate__(self):
+        # The index lookup can be rebuilt cheaply, so we don't ship it to worker processes
+        state = self.__dict__.copy()
+        state['_CSRGraph__index_lookup'] = None
+        return state
+
+    def num_nodes(self):
+        """Returns the number of nodes in the snapshot."""
+        return len(self.node_ids)
+
+    def num_entries(self):
+        """Returns the number of adjacency entries in the snapshot."""
+        return len(self.indices)
+
+    def degree(self, index):
+        """Returns the number of adjacency entries of the node with dense index ''index''."""
+        return self.indptr[index + 1] - self.indptr[index]
+
+    def neighbors(self, index):
+        """Returns the dense indices of the neighbors of the node with dense index ''index''."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def index_of(self, node_id):
+        """Returns the dense index of the graph node ''node_id''."""
+        if self.__index_lookup is None:
+            self.__index_lookup = dict(zip(self.node_ids, range(len(self.node_ids))))
+        try:
+            return self.__index_lookup[node_id]
+        except KeyError:
+            raise NonexistentNodeError(node_id)
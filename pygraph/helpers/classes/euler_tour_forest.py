@@ -0,0 +1,212 @@
+"""Implements a forest of Euler tour trees, used for dynamic connectivity."""
+
+import random
+
+
+class _TourNode(object):
+    """A single occurrence in an Euler tour, stored as a node of a randomized balanced search tree (treap).
+    Vertex occurrences have an ''edge_id'' of None; edge occurrences record the edge they traverse."""
+
+    __slots__ = ('left', 'right', 'parent', 'priority', 'size',
+                 'vertex', 'edge_id', 'flag', 'vertex_flags', 'edge_flags')
+
+    def __init__(self, vertex, edge_id=None):
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.priority = random.random()
+        self.size = 1
+        self.vertex = vertex
+        self.edge_id = edge_id
+        self.flag = False
+        self.vertex_flags = False
+        self.edge_flags = False
+
+
+class EulerTourForest(object):
+    """Maintains a spanning forest as a set of Euler tours, each stored in a treap.
+    Linking, cutting and connectivity queries take expected O(log n) time.
+    Vertices and tree edges can also be flagged, and a flagged vertex or edge can be found
+    in any tree in expected O(log n) time.
+    """
+
+    def __init__(self):
+        self.__vertex_nodes = {}
+        self.__edge_nodes = {}
+
+    def connected(self, node_a, node_b):
+        """Determines whether node_a and node_b are in the same tree."""
+        if node_a == node_b:
+            return True
+        return self.__root(self.__vertex_node(node_a)) is self.__root(self.__vertex_node(node_b))
+
+    def tree_size(self, node_id):
+        """Returns the number of vertices in the tree containing the node."""
+        # A tour of a tree with k vertices holds k vertex occurrences and 2(k-1) edge occurrences
+        return (self.__root(self.__vertex_node(node_id)).size + 2) // 3
+
+    def has_edge(self, edge_id):
+        """Determines whether the edge is part of the forest."""
+        return edge_id in self.__edge_nodes
+
+    def link(self, node_a, node_b, edge_id):
+        """Joins the trees containing node_a and node_b with the edge ''edge_id''.
+        Assumes node_a and node_b are in different trees."""
+        forward = _TourNode(node_a, edge_id)
+        backward = _TourNode(node_b, edge_id)
+        self.__edge_nodes[edge_id] = (forward, backward)
+
+        tour_a = self.__reroot(self.__vertex_node(node_a))
+        tour_b = self.__reroot(self.__vertex_node(node_b))
+        _merge(_merge(_merge(tour_a, forward), tour_b), backward)
+
+    def cut(self, edge_id):
+        """Removes the edge ''edge_id'' from the forest, splitting its tree in two."""
+        first, second = self.__edge_nodes.pop(edge_id)
+        root = self.__root(first)
+        i = _index(first)
+        j = _index(second)
+        if i > j:
+            i, j = j, i
+
+        # The tour is laid out as: before, first occurrence, inner tour, second occurrence, after
+        before, rest = _split(root, i)
+        _, rest = _split(rest, 1)
+        _, rest = _split(rest, j - i - 1)
+        _, after = _split(rest, 1)
+        _merge(before, after)
+
+    def remove_vertex(self, node_id):
+        """Forgets an isolated vertex."""
+        self.__vertex_nodes.pop(node_id, None)
+
+    def set_vertex_flag(self, node_id, flag):
+        """Flags or unflags a vertex."""
+        _set_flag(self.__vertex_node(node_id), flag)
+
+    def set_edge_flag(self, edge_id, flag):
+        """Flags or unflags a tree edge."""
+        _set_flag(self.__edge_nodes[edge_id][0], flag)
+
+    def find_flagged_vertex(self, node_id):
+        """Returns a flagged vertex in the tree containing the node, or None if there are none."""
+        node = _find_flagged(self.__root(self.__vertex_node(node_id)), 'vertex_flags')
+        return None if node is None else node.vertex
+
+    def find_flagged_edge(self, node_id):
+        """Returns a flagged edge id in the tree containing the node, or None if there are none."""
+        node = _find_flagged(self.__root(self.__vertex_node(node_id)), 'edge_flags')
+        return None if node is None else node.edge_id
+
+    def __vertex_node(self, node_id):
+        """Returns the vertex occurrence of a node, creating a single-vertex tree for nodes we haven't seen yet."""
+        try:
+            return self.__vertex_nodes[node_id]
+        except KeyError:
+            node = _TourNode(node_id)
+            self.__vertex_nodes[node_id] = node
+            return node
+
+    def __root(self, node):
+        """Returns the treap root of the tour containing the occurrence."""
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def __reroot(self, vertex_node):
+        """Rotates the tour containing the occurrence so that it starts at it. Returns the new treap root."""
+        root = self.__root(vertex_node)
+        before, after = _split(root, _index(vertex_node))
+        return _merge(after, before)
+
+
+# Treap helpers
+
+def _update(node):
+    """Recalculates the size and flag summaries of a treap node from its children."""
+    size = 1
+    vertex_flags = node.flag and node.edge_id is None
+    edge_flags = node.flag and node.edge_id is not None
+    for child in (node.left, node.right):
+        if child is not None:
+            size += child.size
+            vertex_flags = vertex_flags or child.vertex_flags
+            edge_flags = edge_flags or child.edge_flags
+    node.size = size
+    node.vertex_flags = vertex_flags
+    node.edge_flags = edge_flags
+
+
+def _merge(a, b):
+    """Concatenates two tours. Returns the new treap root."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        a.right.parent = a
+        a.parent = None
+        _update(a)
+        return a
+    else:
+        b.left = _merge(a, b.left)
+        b.left.parent = b
+        b.parent = None
+        _update(b)
+        return b
+
+
+def _split(node, k):
+    """Splits a tour into its first k occurrences and the rest. Returns the two treap roots."""
+    if node is None:
+        return None, None
+    node.parent = None
+    left_size = node.left.size if node.left is not None else 0
+    if k <= left_size:
+        left, right = _split(node.left, k)
+        node.left = right
+        if right is not None:
+            right.parent = node
+        _update(node)
+        return left, node
+    else:
+        left, right = _split(node.right, k - left_size - 1)
+        node.right = left
+        if left is not None:
+            left.parent = node
+        _update(node)
+        return node, right
+
+
+def _index(node):
+    """Returns the position of an occurrence within its tour."""
+    index = node.left.size if node.left is not None else 0
+    while node.parent is not None:
+        parent = node.parent
+        if node is parent.right:
+            index += 1 + (parent.left.size if parent.left is not None else 0)
+        node = parent
+    return index
+
+
+def _set_flag(node, flag):
+    """Sets the flag of an occurrence and refreshes the summaries of its ancestors."""
+    node.flag = flag
+    while node is not None:
+        _update(node)
+        node = node.parent
+
+
+def _find_flagged(node, summary):
+    """Descends from a treap root to a flagged occurrence, following the named flag summary."""
+    if not getattr(node, summary):
+        return None
+    while True:
+        left = node.left
+        if left is not None and getattr(left, summary):
+            node = left
+        elif node.flag and (node.edge_id is None) == (summary == 'vertex_flags'):
+            return node
+        else:
+            node = node.right
@@ -0,0 +1,98 @@
+"""Implements a Union/Find Disjoint Set class over non-negative integers, such as graph node ids."""
+
+from array import array
+
+
+class IndexedDisjointSet(object):
+    """Implements a disjoint set collection whose elements are non-negative integers.
+    Unlike ''DisjointSet'', elements are named by the caller rather than assigned labels, so graph
+    node ids can be used directly. The forest is stored in flat integer arrays indexed by element,
+    with union by size and path halving.
+    """
+
+    def __init__(self, elements=()):
+        # --Parent pointers; -1 marks an index that isn't an element
+        self.__parents = array('l')
+        self.__sizes = array('l')
+        self.__set_counter = 0
+        for element in elements:
+            self.add(element)
+
+    def __len__(self):
+        return self.__set_counter
+
+    def __contains__(self, element):
+        return 0 <= element < len(self.__parents) and self.__parents[element] >= 0
+
+    def __str__(self):
+        return str(dict((i, p) for i, p in enumerate(self.__parents) if p >= 0))
+
+    def add(self, element):
+        """Adds a new single-element set containing ''element''.
+        Adding an element that is already present does nothing.
+        """
+        parents = self.__parents
+        if element < 0:
+            raise ValueError('Elements must be non-negative integers')
+        if element < len(parents):
+            if parents[element] >= 0:
+                return
+        else:
+            growth = element + 1 - len(parents)
+            parents.extend(array('l', [-1]) * growth)
+            self.__sizes.extend(array('l', [0]) * growth)
+        parents[element] = element
+        self.__sizes[element] = 1
+        self.__set_counter += 1
+
+    def find(self, element):
+        """Finds the set containing the element.
+        Returns the representative element of the set.
+        """
+        parents = self.__parents
+        if not 0 <= element < len(parents) or parents[element] < 0:
+            raise KeyError(element)
+        # Path halving: point every other node on the path at its grandparent
+        parent = parents[element]
+        while parent != element:
+            grandparent = parents[parent]
+            parents[element] = grandparent
+            element = grandparent
+            parent = parents[element]
+        return element
+
+    def union(self, element_a, element_b):
+        """Joins the sets containing element_a and element_b.
+        Returns True if the sets were distinct and have been merged, False if they were already the same set.
+        """
+        root_a = self.find(element_a)
+        root_b = self.find(element_b)
+        if root_a == root_b:
+            return False
+
+        # Merge the trees, smaller to larger
+        sizes = self.__sizes
+        if sizes[root_a] < sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self.__parents[root_b] = root_a
+        sizes[root_a] += sizes[root_b]
+        self.__set_counter -= 1
+        return True
+
+    def set_size(self, element):
+        """Returns the number of elements in the set containing the element."""
+        return self.__sizes[self.find(element)]
+
+    def find_many(self, elements):
+        """Finds the sets containing each of the elements.
+        Returns a list of representative elements, in the same order.
+        """
+        find = self.find
+        return [find(element) for element in elements]
+
+    def union_many(self, pairs):
+        """Joins the sets of each (element_a, element_b) pair, in order.
+        Returns a list recording, for each pair, whether it merged two distinct sets.
+        """
+        union = self.union
+        return [union(element_a, element_b) for element_a, element_b in pairs]
@@ -0,0 +1,214 @@
+"""Implements a link/cut tree forest with weighted edges, used for dynamic minimum spanning trees."""
+
+
+class _SplayNode(object):
+    """A vertex or edge of the represented forest, stored as a node of a splay tree over a preferred path.
+    Edge nodes carry the weight of their edge as ''value''; vertex nodes have a ''value'' of None."""
+
+    __slots__ = ('left', 'right', 'parent', 'flipped', 'key', 'value', 'max_node')
+
+    def __init__(self, key, value=None):
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.flipped = False
+        self.key = key
+        self.value = value
+        self.max_node = self if value is not None else None
+
+
+class LinkCutTree(object):
+    """Maintains a forest of unrooted trees with weighted edges, as Sleator and Tarjan's link/cut trees.
+    Linking, cutting, connectivity queries and finding the heaviest edge on the path between two vertices
+    all take O(log n) amortized time.
+    Each edge is stored as its own node between its two endpoints, so that its weight can be aggregated along paths.
+    Weights can be any mutually comparable values.
+    """
+
+    def __init__(self):
+        self.__vertex_nodes = {}
+        self.__edge_nodes = {}
+
+    def connected(self, node_a, node_b):
+        """Determines whether node_a and node_b are in the same tree."""
+        if node_a == node_b:
+            return True
+        return _find_root(self.__vertex_node(node_a)) is _find_root(self.__vertex_node(node_b))
+
+    def has_edge(self, edge_id):
+        """Determines whether the edge is part of the forest."""
+        return edge_id in self.__edge_nodes
+
+    def link(self, node_a, node_b, edge_id, weight):
+        """Joins the trees containing node_a and node_b with the edge ''edge_id'' of the given weight.
+        Assumes node_a and node_b are in different trees."""
+        edge_node = _SplayNode(edge_id, weight)
+        self.__edge_nodes[edge_id] = (edge_node, node_a, node_b)
+        _link(edge_node, self.__vertex_node(node_a))
+        _link(edge_node, self.__vertex_node(node_b))
+
+    def cut(self, edge_id):
+        """Removes the edge ''edge_id'' from the forest, splitting its tree in two."""
+        edge_node, node_a, node_b = self.__edge_nodes.pop(edge_id)
+        _cut(edge_node, self.__vertex_nodes[node_a])
+        _cut(edge_node, self.__vertex_nodes[node_b])
+
+    def edge_weight(self, edge_id):
+        """Returns the weight of a tree edge."""
+        return self.__edge_nodes[edge_id][0].value
+
+    def set_edge_weight(self, edge_id, weight):
+        """Changes the weight of a tree edge."""
+        edge_node = self.__edge_nodes[edge_id][0]
+        # --Bring the node to the root of its splay tree, so that no other summaries depend on it
+        _access(edge_node)
+        edge_node.value = weight
+        _pull(edge_node)
+
+    def path_max(self, node_a, node_b):
+        """Finds the heaviest edge on the tree path between node_a and node_b.
+        Returns the edge id, or None if the path has no edges.
+        Assumes node_a and node_b are in the same tree."""
+        a = self.__vertex_node(node_a)
+        b = self.__vertex_node(node_b)
+        _make_root(a)
+        _access(b)
+        max_node = b.max_node
+        return None if max_node is None else max_node.key
+
+    def remove_vertex(self, node_id):
+        """Forgets an isolated vertex."""
+        self.__vertex_nodes.pop(node_id, None)
+
+    def __vertex_node(self, node_id):
+        """Returns the splay node of a vertex, creating a single-vertex tree for vertices we haven't seen yet."""
+        try:
+            return self.__vertex_nodes[node_id]
+        except KeyError:
+            node = _SplayNode(node_id)
+            self.__vertex_nodes[node_id] = node
+            return node
+
+
+# Splay tree helpers
+
+def _is_splay_root(node):
+    """Determines whether the node is the root of its splay tree (its parent pointer, if any, is a path-parent)."""
+    parent = node.parent
+    return parent is None or (parent.left is not node and parent.right is not node)
+
+
+def _push(node):
+    """Pushes a pending path reversal down to the children of the node."""
+    if node.flipped:
+        node.left, node.right = node.right, node.left
+        for child in (node.left, node.right):
+            if child is not None:
+                child.flipped = not child.flipped
+        node.flipped = False
+
+
+def _pull(node):
+    """Recalculates the heaviest edge in the subtree of the node from its children."""
+    max_node = node if node.value is not None else None
+    for child in (node.left, node.right):
+        if child is not None and child.max_node is not None:
+            if max_node is None or child.max_node.value > max_node.value:
+                max_node = child.max_node
+    node.max_node = max_node
+
+
+def _rotate(node):
+    """Rotates the node above its parent."""
+    parent = node.parent
+    grandparent = parent.parent
+    if not _is_splay_root(parent):
+        if grandparent.left is parent:
+            grandparent.left = node
+        else:
+            grandparent.right = node
+    node.parent = grandparent
+
+    if parent.left is node:
+        parent.left = node.right
+        if node.right is not None:
+            node.right.parent = parent
+        node.right = parent
+    else:
+        parent.right = node.left
+        if node.left is not None:
+            node.left.parent = parent
+        node.left = parent
+    parent.parent = node
+
+    _pull(parent)
+    _pull(node)
+
+
+def _splay(node):
+    """Moves the node to the root of its splay tree."""
+    # Push pending reversals down from the root of the splay tree first
+    path = [node]
+    current = node
+    while not _is_splay_root(current):
+        current = current.parent
+        path.append(current)
+    for n in reversed(path):
+        _push(n)
+
+    while not _is_splay_root(node):
+        parent = node.parent
+        if not _is_splay_root(parent):
+            grandparent = parent.parent
+            if (grandparent.left is parent) == (parent.left is node):
+                _rotate(parent)
+            else:
+                _rotate(node)
+        _rotate(node)
+
+
+def _access(node):
+    """Makes the path from the root of the represented tree to the node preferred, and splays the node."""
+    last = None
+    current = node
+    while current is not None:
+        _splay(current)
+        current.right = last
+        _pull(current)
+        last = current
+        current = current.parent
+    _splay(node)
+
+
+def _make_root(node):
+    """Makes the node the root of its represented tree."""
+    _access(node)
+    node.flipped = not node.flipped
+
+
+def _find_root(node):
+    """Returns the root of the represented tree containing the node."""
+    _access(node)
+    while True:
+        _push(node)
+        if node.left is None:
+            break
+        node = node.left
+    _splay(node)
+    return node
+
+
+def _link(node_a, node_b):
+    """Adds a tree edge between two nodes in different trees."""
+    _make_root(node_a)
+    node_a.parent = node_b
+
+
+def _cut(node_a, node_b):
+    """Removes the tree edge between two adjacent nodes."""
+    _make_root(node_a)
+    _access(node_b)
+    # --node_a is now the only node on the preferred path above node_b
+    node_b.left = None
+    node_a.parent = None
+    _pull(node_b)
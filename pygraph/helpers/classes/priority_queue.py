@@ -20,4 +20,105 @@ class PriorityQueue:
         heapq.heappush(self.elements, (priority, item))
 
     def get(self):
-        return heapq.heappop(self.elements)[1]
\ No newline at end of file
+        return heapq.heappop(self.elements)[1]
+
+
+class IndexedPriorityQueue(object):
+    """Implements a binary heap of distinct items that supports changing the priority of a queued item.
+    Each item's position in the heap is tracked, so ''put'' on an item that is already queued updates it in place
+    in O(log n) time instead of adding a duplicate entry.
+    """
+
+    def __init__(self):
+        self.__items = []
+        self.__priorities = []
+        self.__positions = {}
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __contains__(self, item):
+        return item in self.__positions
+
+    def empty(self):
+        return len(self.__items) == 0
+
+    def priority(self, item):
+        """Returns the current priority of a queued item."""
+        return self.__priorities[self.__positions[item]]
+
+    def put(self, item, priority):
+        """Adds an item to the queue, or changes its priority if it is already queued."""
+        position = self.__positions.get(item)
+        if position is None:
+            position = len(self.__items)
+            self.__items.append(item)
+            self.__priorities.append(priority)
+            self.__positions[item] = position
+            self.__sift_up(position)
+        else:
+            old_priority = self.__priorities[position]
+            self.__priorities[position] = priority
+            if priority < old_priority:
+                self.__sift_up(position)
+            else:
+                self.__sift_down(position)
+
+    def get(self):
+        """Removes and returns the item with the lowest priority."""
+        items = self.__items
+        priorities = self.__priorities
+        item = items[0]
+        del self.__positions[item]
+
+        last_item = items.pop()
+        last_priority = priorities.pop()
+        if len(items) > 0:
+            items[0] = last_item
+            priorities[0] = last_priority
+            self.__positions[last_item] = 0
+            self.__sift_down(0)
+        return item
+
+    def __sift_up(self, position):
+        """Moves the entry at ''position'' towards the root until the heap order is restored."""
+        items = self.__items
+        priorities = self.__priorities
+        positions = self.__positions
+        item = items[position]
+        priority = priorities[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if not priority < priorities[parent]:
+                break
+            items[position] = items[parent]
+            priorities[position] = priorities[parent]
+            positions[items[position]] = position
+            position = parent
+        items[position] = item
+        priorities[position] = priority
+        positions[item] = position
+
+    def __sift_down(self, position):
+        """Moves the entry at ''position'' towards the leaves until the heap order is restored."""
+        items = self.__items
+        priorities = self.__priorities
+        positions = self.__positions
+        size = len(items)
+        item = items[position]
+        priority = priorities[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if not priorities[child] < priority:
+                break
+            items[position] = items[child]
+            priorities[position] = priorities[child]
+            positions[items[position]] = position
+            position = child
+        items[position] = item
+        priorities[position] = priority
+        positions[item] = position
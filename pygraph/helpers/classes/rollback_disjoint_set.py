@@ -0,0 +1,79 @@
+"""Implements a Union/Find Disjoint Set class whose unions can be undone, used in offline algorithms."""
+
+
+class RollbackDisjointSet(object):
+    """Implements a disjoint set collection that can undo its most recent unions.
+    It uses union by rank without path compression, so ''find'' takes O(log n) time
+    and ''rollback'' takes O(1) time.
+    """
+
+    def __init__(self):
+        # We are using the implicit parent-pointer structure to store the trees;
+        # roots store their negated rank, offset by one
+        self.__forest = {}
+        self.__history = []
+        self.__label_counter = 0
+        self.__set_counter = 0
+
+    def __len__(self):
+        return self.__set_counter
+
+    def __str__(self):
+        return str(self.__forest)
+
+    def add_set(self):
+        """Adds a new set to the forest.
+        Returns a label by which the new set can be referenced
+        """
+        self.__label_counter += 1
+        new_label = self.__label_counter
+        self.__forest[new_label] = -1  # All new sets have their parent set to themselves
+        self.__set_counter += 1
+        return new_label
+
+    def find(self, node_label):
+        """Finds the set containing the node_label.
+        Returns the set label.
+        """
+        forest = self.__forest
+        current_node = node_label
+        while forest[current_node] >= 0:
+            current_node = forest[current_node]
+        return current_node
+
+    def union(self, label_a, label_b):
+        """Joins two sets into a single new set.
+        label_a, label_b can be any nodes within the sets.
+        Every call, including one that joins a set to itself, can be undone with ''rollback''.
+        """
+        root_a = self.find(label_a)
+        root_b = self.find(label_b)
+
+        if root_a == root_b:
+            self.__history.append(None)
+            return
+
+        # Merge the trees, smaller to larger
+        rank_a = self.__forest[root_a]
+        rank_b = self.__forest[root_b]
+        if rank_a < rank_b:
+            larger, smaller = root_a, root_b
+        else:
+            larger, smaller = root_b, root_a
+
+        # --Record what we're about to change, so that it can be restored
+        self.__history.append((smaller, self.__forest[smaller], larger, self.__forest[larger]))
+        self.__forest[smaller] = larger
+        if rank_a == rank_b:
+            self.__forest[larger] -= 1
+        self.__set_counter -= 1
+
+    def rollback(self):
+        """Undoes the most recent union that hasn't already been undone."""
+        record = self.__history.pop()
+        if record is None:
+            return
+        smaller, smaller_value, larger, larger_value = record
+        self.__forest[smaller] = smaller_value
+        self.__forest[larger] = larger_value
+        self.__set_counter += 1
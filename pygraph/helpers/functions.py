@@ -4,24 +4,46 @@ but end users won't care about."""
 import copy
 
 from ..classes import UndirectedGraph, DirectedGraph
+from ..exceptions import NonexistentNodeError, NonexistentEdgeError
 
 
 # Graph Conversions
 
 def make_subgraph(graph, vertices, edges):
-    """Converts a subgraph given by a list of vertices and edges into a graph object."""
-    # Copy the entire graph
-    local_graph = copy.deepcopy(graph)
+    """Converts a subgraph given by a list of vertices and edges into a graph object.
+    Node and edge ids are preserved, and only the listed nodes and edges are copied.
+    Edges with an endpoint outside of the vertex list are left out, as are ids that don't exist in the graph.
+    The nodes and edges of the subgraph are kept in the order they are listed in.
+    """
+    vertex_set = set(vertices)
 
-    # Remove all the edges that aren't in the list
-    edges_to_delete = [x for x in local_graph.get_all_edge_ids() if x not in edges]
-    for e in edges_to_delete:
-        local_graph.delete_edge_by_id(e)
+    local_graph = graph.__class__()
+    local_graph.next_node_id = graph.next_node_id
+    local_graph.next_edge_id = graph.next_edge_id
 
-    # Remove all the vertices that aren't in the list
-    nodes_to_delete = [x for x in local_graph.get_all_node_ids() if x not in vertices]
-    for n in nodes_to_delete:
-        local_graph.delete_node(n)
+    # Copy the edges whose endpoints are both in the subgraph
+    for edge_id in edges:
+        try:
+            edge = graph.get_edge(edge_id)
+        except NonexistentEdgeError:
+            continue
+        a, b = edge['vertices']
+        if a in vertex_set and b in vertex_set:
+            local_graph.edges[edge_id] = copy.deepcopy(edge)
+
+    # Copy the nodes, keeping only the edges that made it into the subgraph
+    for node_id in vertices:
+        try:
+            node = graph.get_node(node_id)
+        except NonexistentNodeError:
+            continue
+        local_graph.nodes[node_id] = {'id': node_id,
+                                      'edges': [e for e in node['edges'] if e in local_graph.edges],
+                                      'data': copy.deepcopy(node['data'])
+        }
+
+    local_graph._num_nodes = len(local_graph.nodes)
+    local_graph._num_edges = len(local_graph.edges)
 
     return local_graph
 
@@ -38,6 +60,8 @@ def convert_graph_directed_to_undirected(dg):
     udg.edges = copy.deepcopy(dg.edges)
     udg.next_node_id = dg.next_node_id
     udg.next_edge_id = dg.next_edge_id
+    udg._num_nodes = dg.num_nodes()
+    udg._num_edges = dg.num_edges()
 
     # Convert the directed edges into undirected edges
     for edge_id in udg.get_all_edge_ids():
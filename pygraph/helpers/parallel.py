@@ -0,0 +1,112 @@
+"""Helpers for spreading independent pieces of work across a pool of worker processes."""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+
+# The number of edges below which pieces of a graph are batched together into a single task,
+# so that graphs made of many small components aren't dominated by the per-task overhead
+MIN_BATCH_EDGES = 1000
+
+
+def parallel_map(function, items, executor=None, workers=None):
+    """Applies ''function'' to each of ''items'', returning the results in the same order.
+    If ''executor'' is given (any concurrent.futures.Executor), the work is submitted to it.
+    Otherwise, if ''workers'' is greater than 1, a process pool of that size is created for the call.
+    Otherwise the work is done serially in the current process.
+    When a process pool is used, ''function'' and ''items'' must be picklable.
+    """
+    items = list(items)
+    if executor is None and (workers is None or workers <= 1 or len(items) <= 1):
+        return [function(item) for item in items]
+
+    if executor is not None:
+        return list(executor.map(function, items, chunksize=__chunksize(len(items), 4)))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, items, chunksize=__chunksize(len(items), workers)))
+
+
+def __chunksize(num_items, num_workers):
+    """Hands each worker a few chunks, so that large arguments are pickled once per chunk rather than per item."""
+    return max(1, num_items // (num_workers * 4))
+
+
+def share_array(values):
+    """Copies an array.array into a new block of shared memory, so that worker processes can read it without pickling.
+    Returns the SharedMemory object; the caller is responsible for closing and unlinking it.
+    """
+    num_bytes = len(values) * values.itemsize
+    block = SharedMemory(create=True, size=max(1, num_bytes))
+    block.buf[:num_bytes] = memoryview(values).cast('B')
+    return block
+
+
+def attach_array(name, typecode, length):
+    """Attaches to a block of shared memory created by ''share_array''.
+    Returns a tuple of the SharedMemory object and a memoryview of its contents as ''length'' items of ''typecode''.
+    The view must be released before the block is closed.
+    """
+    block = SharedMemory(name=name)
+    view = block.buf[:length * array(typecode).itemsize].cast(typecode)
+    return block, view
+
+
+def pack_subgraph(graph, edge_list):
+    """Serializes the structure of the subgraph made of the edges in ''edge_list'' into a compact, cheaply pickled form:
+    a tuple of arrays holding the node ids, the edge ids, and the endpoints of each edge in turn
+    as positions in the node array, along with the class of the graph. Costs and data are not kept.
+    """
+    edge_ids = array('l', sorted(edge_list))
+    node_ids = array('l', sorted(set(node_id for edge_id in edge_ids
+                                     for node_id in graph.get_edge(edge_id)['vertices'])))
+    node_positions = dict((node_id, position) for position, node_id in enumerate(node_ids))
+    endpoints = array('l')
+    for edge_id in edge_ids:
+        node_a, node_b = graph.get_edge(edge_id)['vertices']
+        endpoints.append(node_positions[node_a])
+        endpoints.append(node_positions[node_b])
+    return node_ids, edge_ids, endpoints, type(graph)
+
+
+def unpack_subgraph(packed_subgraph):
+    """Rebuilds a subgraph serialized by ''pack_subgraph'', as a graph of the same class as the original.
+    Node and edge ids are preserved, and are kept in increasing order, which is the ordering of the original graph.
+    """
+    node_ids, edge_ids, endpoints, graph_class = packed_subgraph
+    graph = graph_class()
+    for node_id in node_ids:
+        graph.nodes[node_id] = {'id': node_id, 'edges': [], 'data': {}}
+    for position, edge_id in enumerate(edge_ids):
+        node_a = node_ids[endpoints[2 * position]]
+        node_b = node_ids[endpoints[2 * position + 1]]
+        graph.edges[edge_id] = {'id': edge_id, 'vertices': (node_a, node_b), 'cost': 1, 'data': {}}
+        graph._attach_edge(edge_id, node_a, node_b)
+
+    graph.next_node_id = max(node_ids) + 1 if len(node_ids) > 0 else 1
+    graph.next_edge_id = max(edge_ids) + 1 if len(edge_ids) > 0 else 1
+    graph._num_nodes = len(graph.nodes)
+    graph._num_edges = len(graph.edges)
+
+    return graph
+
+
+def batch_by_size(items, sizes, min_batch_size=MIN_BATCH_EDGES):
+    """Groups consecutive items into batches, closing each batch once the sizes of its items
+    add up to ''min_batch_size''.
+    Returns a list of lists of items, in their original order.
+    """
+    batches = []
+    batch = []
+    batch_size = 0
+    for item, size in zip(items, sizes):
+        batch.append(item)
+        batch_size += size
+        if batch_size >= min_batch_size:
+            batches.append(batch)
+            batch = []
+            batch_size = 0
+    if len(batch) > 0:
+        batches.append(batch)
+    return batches
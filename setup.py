@@ -13,6 +13,9 @@ setup(
     author="Joe Ciskey",
     author_email="forms@sleeplesshacker.com",
     packages=find_packages(exclude=EXCLUDE_FROM_PACKAGES),
+    extras_require={
+        'numpy': ['numpy'],
+    },
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
         "Intended Audience :: Developers",
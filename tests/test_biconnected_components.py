@@ -2,7 +2,8 @@
 
 import unittest
 
-from ..pygraph import (UndirectedGraph, find_biconnected_components, find_articulation_vertices, merge_graphs,
+from ..pygraph import (UndirectedGraph, DirectedGraph, find_biconnected_components, find_articulation_vertices,
+                     merge_graphs, find_biconnected_structure,
                      build_triangle_graph, build_square_graph, build_diamond_graph,
                      build_tetrahedral_graph, build_5_cycle_graph, build_gem_graph)
 
@@ -175,6 +176,100 @@ class BiconnectedComponentsTest(unittest.TestCase):
         self.assertEqual(4, len(calculated_components))
 
 
+    def test_lone_edge_component(self):
+        """Does the ''find_biconnected_components'' function keep a 2-node component, but not a bridge elsewhere?"""
+        graph = build_triangle_graph()
+        bridge = graph.new_edge(3, graph.new_node())
+        node_a = graph.new_node()
+        node_b = graph.new_node()
+        lone_edge = graph.new_edge(node_a, node_b)
+
+        calculated = sorted(sorted(c) for c in find_biconnected_components(graph))
+
+        self.assertEqual([[1, 2, 3], [lone_edge]], calculated)
+        self.assertNotIn([bridge], calculated)
+
+    def test_directed_lone_edge_component(self):
+        """Does the ''find_biconnected_components'' function keep a single directed edge as a component?"""
+        graph = DirectedGraph()
+        node_a = graph.new_node()
+        node_b = graph.new_node()
+        edge = graph.new_edge(node_a, node_b)
+
+        self.assertEqual([[edge]], find_biconnected_components(graph))
+
+    def test_directed_path_graph(self):
+        """Does the ''find_biconnected_components'' function drop the bridges of a directed path?"""
+        graph = DirectedGraph()
+        node_a = graph.new_node()
+        node_b = graph.new_node()
+        node_c = graph.new_node()
+        graph.new_edge(node_a, node_b)
+        graph.new_edge(node_b, node_c)
+
+        self.assertEqual([], find_biconnected_components(graph))
+        self.assertEqual([node_b], find_articulation_vertices(graph))
+
+    def test_parallel_edges(self):
+        """Does the ''find_biconnected_components'' function keep parallel edges in their component?"""
+        graph = build_triangle_graph()
+        extra_edge = graph.new_edge(1, 2)
+        graph.new_edge(2, 2)
+
+        calculated = find_biconnected_components(graph)
+
+        self.assertEqual([[1, 2, 3, extra_edge]], [sorted(c) for c in calculated])
+
+    def test_long_path_graph(self):
+        """Does the ''find_biconnected_components'' function handle graphs far deeper than the recursion limit?"""
+        graph = UndirectedGraph()
+        first = previous = graph.new_node()
+        for _ in range(5000):
+            node = graph.new_node()
+            graph.new_edge(previous, node)
+            previous = node
+        graph.new_edge(previous, first)
+
+        calculated = find_biconnected_components(graph)
+
+        self.assertEqual(1, len(calculated))
+        self.assertEqual(5001, len(calculated[0]))
+
+
+    def test_parallel_components(self):
+        """Does the ''find_biconnected_components'' function find the same components across workers?"""
+        graph = UndirectedGraph()
+        for _ in range(5):
+            merge_graphs(graph, utility_functions.build_biconnected_test_graph())
+        expected = sorted(sorted(c) for c in find_biconnected_components(graph))
+
+        with utility_functions.RecordingExecutor() as executor:
+            calculated = find_biconnected_components(graph, executor=executor)
+        self.assertGreater(executor.num_maps, 0)
+        self.assertEqual(expected, sorted(sorted(c) for c in calculated))
+        calculated = find_biconnected_components(graph, workers=2)
+        self.assertEqual(expected, sorted(sorted(c) for c in calculated))
+
+    def test_parallel_components_directed_graph(self):
+        """Does the ''find_biconnected_components'' function find the right components across workers
+        on a directed graph?"""
+        graph = DirectedGraph()
+        for _ in range(5):
+            merge_graphs(graph, utility_functions.build_biconnected_test_graph(directed=True))
+        # --Each copy of the test graph has 18 edges, 2 of which are bridges
+        expected = sorted(sorted(offset + edge_id for edge_id in component)
+                          for offset in range(0, 90, 18)
+                          for component in ([1, 2, 3], [4, 5, 6, 7, 8], [9, 10, 11, 12, 13, 14, 15, 16]))
+
+        self.assertEqual(expected, sorted(sorted(c) for c in find_biconnected_components(graph)))
+        with utility_functions.RecordingExecutor() as executor:
+            calculated = find_biconnected_components(graph, executor=executor)
+        self.assertGreater(executor.num_maps, 0)
+        self.assertEqual(expected, sorted(sorted(c) for c in calculated))
+        calculated = find_biconnected_components(graph, workers=2)
+        self.assertEqual(expected, sorted(sorted(c) for c in calculated))
+
+
 class ArticulationVerticesTest(unittest.TestCase):
     def test_articulation_vertices_empty_graph(self):
         """Does the ''find_articulation_vertices'' function return an empty list when run on an empty graph?"""
@@ -237,3 +332,71 @@ class ArticulationVerticesTest(unittest.TestCase):
 
         self.assertEqual(expected, calculated)
 
+    def test_articulation_vertices_parallel_edges(self):
+        """Does the ''find_articulation_vertices'' function report each cut vertex once, despite parallel edges?"""
+        graph = utility_functions.build_3_node_line_graph()
+        graph.new_edge(1, 2)
+        graph.new_edge(2, 3)
+
+        self.assertEqual([2], find_articulation_vertices(graph))
+
+        graph.new_edge(3, 1)
+        self.assertEqual([], find_articulation_vertices(graph))
+
+
+    def test_articulation_vertices_parallel_components(self):
+        """Does the ''find_articulation_vertices'' function find the same vertices across workers?"""
+        graph = UndirectedGraph()
+        for _ in range(5):
+            merge_graphs(graph, utility_functions.build_biconnected_test_graph())
+        expected = sorted(find_articulation_vertices(graph))
+
+        self.assertEqual(20, len(expected))
+        with utility_functions.RecordingExecutor() as executor:
+            self.assertEqual(expected, sorted(find_articulation_vertices(graph, executor=executor)))
+        self.assertGreater(executor.num_maps, 0)
+        self.assertEqual(expected, sorted(find_articulation_vertices(graph, workers=2)))
+
+    def test_articulation_vertices_parallel_components_directed_graph(self):
+        """Does the ''find_articulation_vertices'' function find the right vertices across workers
+        on a directed graph?"""
+        graph = DirectedGraph()
+        for _ in range(5):
+            merge_graphs(graph, utility_functions.build_biconnected_test_graph(directed=True))
+        # --Each copy of the test graph has 12 nodes, 4 of which are articulation vertices
+        expected = sorted(offset + node_id for offset in range(0, 60, 12) for node_id in [2, 5, 7, 8])
+
+        self.assertEqual(expected, sorted(find_articulation_vertices(graph)))
+        with utility_functions.RecordingExecutor() as executor:
+            self.assertEqual(expected, sorted(find_articulation_vertices(graph, executor=executor)))
+        self.assertGreater(executor.num_maps, 0)
+        self.assertEqual(expected, sorted(find_articulation_vertices(graph, workers=2)))
+
+
+class BiconnectedStructureTest(unittest.TestCase):
+    def test_empty_graph(self):
+        """Does the ''find_biconnected_structure'' function return empty results for an empty graph?"""
+        graph = UndirectedGraph()
+
+        self.assertEqual(([], [], None), find_biconnected_structure(graph))
+
+    def test_matches_separate_functions(self):
+        """Does the ''find_biconnected_structure'' function agree with the individual functions?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        articulation_vertices, components, block_cut_tree = find_biconnected_structure(graph)
+
+        self.assertEqual(sorted(find_articulation_vertices(graph)), sorted(articulation_vertices))
+        self.assertEqual(sorted(sorted(c) for c in find_biconnected_components(graph)),
+                         sorted(sorted(c) for c in components))
+        self.assertIsNone(block_cut_tree)
+
+    def test_block_cut_tree(self):
+        """Does the ''find_biconnected_structure'' function build the block-cut tree when asked to?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        articulation_vertices, _, block_cut_tree = find_biconnected_structure(graph, include_block_cut_tree=True)
+
+        self.assertEqual(5, block_cut_tree.num_blocks())
+        self.assertEqual(sorted(articulation_vertices), sorted(block_cut_tree.get_articulation_vertices()))
+        self.assertTrue(block_cut_tree.separates(7, 4, 9))
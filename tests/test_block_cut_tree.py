@@ -0,0 +1,66 @@
+"""Provides unit tests to verify that the block-cut tree is functioning correctly."""
+
+import unittest
+
+from ..pygraph import (UndirectedGraph, build_block_cut_tree, build_triangle_graph,
+                       DisconnectedGraphError, NonexistentNodeError)
+from . import utility_functions
+
+
+class BlockCutTreeTest(unittest.TestCase):
+    def test_empty_graph(self):
+        """Does the ''build_block_cut_tree'' function return an empty tree for an empty graph?"""
+        bct = build_block_cut_tree(UndirectedGraph())
+
+        self.assertEqual(0, bct.num_blocks())
+        self.assertEqual(0, bct.tree.num_nodes())
+
+    def test_blocks_and_articulation_vertices(self):
+        """Does the block-cut tree hold every block, bridges included, and the articulation vertices between them?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        bct = build_block_cut_tree(graph)
+
+        self.assertEqual(5, bct.num_blocks())
+        self.assertEqual([2, 5, 7, 8], sorted(bct.get_articulation_vertices()))
+        self.assertEqual([[1, 2, 3], [4, 5, 6, 7, 8], [9, 10, 11, 12, 13, 14, 15, 16], [17], [18]],
+                         sorted(sorted(block) for block in bct.blocks))
+        self.assertEqual(2, len(bct.articulation_blocks[5]))
+        self.assertEqual(1, len(bct.blocks_of(1)))
+
+        # A block-cut forest has one fewer edge than nodes per tree
+        self.assertEqual(9, bct.tree.num_nodes())
+        self.assertEqual(8, bct.tree.num_edges())
+
+    def test_separates(self):
+        """Does ''separates'' report whether removing a vertex disconnects two others?"""
+        graph = utility_functions.build_biconnected_test_graph()
+        bct = build_block_cut_tree(graph)
+
+        self.assertTrue(bct.separates(2, 1, 12))
+        self.assertTrue(bct.separates(7, 4, 9))
+        self.assertFalse(bct.separates(7, 4, 6))
+        self.assertFalse(bct.separates(3, 1, 12))
+        self.assertFalse(bct.separates(2, 2, 12))
+
+    def test_blocks_on_path(self):
+        """Does ''blocks_on_path'' list the blocks between two nodes, in order?"""
+        graph = utility_functions.build_biconnected_test_graph()
+        bct = build_block_cut_tree(graph)
+
+        blocks = [sorted(bct.blocks[index]) for index in bct.blocks_on_path(1, 12)]
+
+        self.assertEqual([[1, 2, 3], [17], [4, 5, 6, 7, 8], [18], [9, 10, 11, 12, 13, 14, 15, 16]], blocks)
+        self.assertEqual([2, 5, 7, 8], bct.articulation_vertices_on_path(1, 12))
+        self.assertEqual(1, len(bct.blocks_on_path(4, 6)))
+
+    def test_disconnected_graph(self):
+        """Does the block-cut tree keep separate components apart?"""
+        graph = build_triangle_graph()
+        isolated_node = graph.new_node()
+        bct = build_block_cut_tree(graph)
+
+        self.assertEqual(2, bct.num_blocks())
+        self.assertFalse(bct.separates(1, 2, isolated_node))
+        self.assertRaises(DisconnectedGraphError, bct.blocks_on_path, 1, isolated_node)
+        self.assertRaises(NonexistentNodeError, bct.blocks_of, 100)
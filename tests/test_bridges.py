@@ -0,0 +1,72 @@
+"""Provides unit tests to verify that the bridge-finding algorithms are functioning correctly."""
+
+import unittest
+
+from ..pygraph import UndirectedGraph, find_bridges, find_2_edge_connected_components, build_triangle_graph
+from . import utility_functions
+
+
+class BridgesTest(unittest.TestCase):
+    def test_empty_graph(self):
+        """Does the ''find_bridges'' function return an empty list for an empty graph?"""
+        graph = UndirectedGraph()
+
+        self.assertEqual([], find_bridges(graph))
+        self.assertEqual([], find_2_edge_connected_components(graph))
+
+    def test_biconnected_test_graph(self):
+        """Does the ''find_bridges'' function find the edges that join the biconnected components?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        self.assertEqual([17, 18], sorted(find_bridges(graph)))
+
+    def test_cycle_has_no_bridges(self):
+        """Does the ''find_bridges'' function return no bridges for a cycle?"""
+        graph = build_triangle_graph()
+
+        self.assertEqual([], find_bridges(graph))
+
+    def test_parallel_edges_are_not_bridges(self):
+        """Does the ''find_bridges'' function treat a pair of parallel edges as a cycle?"""
+        graph = utility_functions.build_2_node_graph()
+        self.assertEqual([1], find_bridges(graph))
+
+        graph.new_edge(2, 1)
+        self.assertEqual([], find_bridges(graph))
+
+    def test_self_loops_are_not_bridges(self):
+        """Does the ''find_bridges'' function ignore self-loops?"""
+        graph = utility_functions.build_2_node_graph()
+        graph.new_edge(1, 1)
+
+        self.assertEqual([1], find_bridges(graph))
+
+    def test_directed_graph(self):
+        """Does the ''find_bridges'' function treat the edges of a directed graph as undirected?"""
+        graph = utility_functions.build_biconnected_test_graph(directed=True)
+
+        self.assertEqual([17, 18], sorted(find_bridges(graph)))
+        self.assertEqual([[1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11, 12]],
+                         sorted(sorted(c) for c in find_2_edge_connected_components(graph)))
+
+    def test_2_edge_connected_components(self):
+        """Does the ''find_2_edge_connected_components'' function split the graph at its bridges?"""
+        graph = utility_functions.build_biconnected_test_graph()
+        isolated_node = graph.new_node()
+
+        calculated = sorted(sorted(c) for c in find_2_edge_connected_components(graph))
+
+        self.assertEqual([[1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11, 12], [isolated_node]], calculated)
+
+    def test_2_edge_connected_components_share_articulation_vertex(self):
+        """Are two cycles joined at a single vertex one 2-edge-connected component?"""
+        graph = build_triangle_graph()
+        node_a = graph.new_node()
+        node_b = graph.new_node()
+        graph.new_edge(1, node_a)
+        graph.new_edge(node_a, node_b)
+        graph.new_edge(node_b, 1)
+
+        calculated = find_2_edge_connected_components(graph)
+
+        self.assertEqual([[1, 2, 3, node_a, node_b]], [sorted(c) for c in calculated])
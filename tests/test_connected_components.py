@@ -2,7 +2,14 @@
 
 import unittest
 
-from ..pygraph import UndirectedGraph, get_connected_components, get_connected_components_as_subgraphs, make_subgraph
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..pygraph import (UndirectedGraph, DirectedGraph, get_connected_components, get_connected_components_as_subgraphs,
+                       make_subgraph, get_strongly_connected_components, get_condensation_graph,
+                       get_weakly_connected_components, ComponentIndex, NonexistentNodeError)
 from . import utility_functions
 
 
@@ -138,3 +145,173 @@ class ConnectedComponentsTest(unittest.TestCase):
         # --errors, but it's a simple sanity check test
         self.assertEqual(3, found_components_count)
 
+
+class StronglyConnectedComponentsTest(unittest.TestCase):
+    def build_two_cycle_test_graph(self):
+        """Builds a directed graph with two 3-cycles joined by a single edge, plus a dangling node."""
+        graph = DirectedGraph()
+        for _ in range(7):
+            graph.new_node()
+
+        graph.new_edge(1, 2)
+        graph.new_edge(2, 3)
+        graph.new_edge(3, 1)
+        graph.new_edge(4, 5)
+        graph.new_edge(5, 6)
+        graph.new_edge(6, 4)
+        graph.new_edge(3, 4)
+        graph.new_edge(2, 4)
+        graph.new_edge(6, 7)
+
+        return graph
+
+    def test_empty_strongly_connected_components(self):
+        """Does the ''get_strongly_connected_components'' function return an empty list for an empty graph?"""
+        graph = DirectedGraph()
+
+        expected = []
+        calculated = get_strongly_connected_components(graph)
+
+        self.assertEqual(expected, calculated)
+
+    def test_correct_strongly_connected_components(self):
+        """Does the ''get_strongly_connected_components'' function find the cycles of a directed graph?"""
+        graph = self.build_two_cycle_test_graph()
+
+        expected = [[1, 2, 3], [4, 5, 6], [7]]
+        calculated = sorted(sorted(c) for c in get_strongly_connected_components(graph))
+
+        self.assertEqual(expected, calculated)
+
+    def test_strongly_connected_components_reverse_topological_order(self):
+        """Does the ''get_strongly_connected_components'' function list sink components first?"""
+        graph = self.build_two_cycle_test_graph()
+
+        calculated = [sorted(c) for c in get_strongly_connected_components(graph)]
+
+        self.assertEqual([[7], [4, 5, 6], [1, 2, 3]], calculated)
+
+    def test_strongly_connected_components_line_graph(self):
+        """Does the ''get_strongly_connected_components'' function return singleton components for a directed path?"""
+        graph = utility_functions.build_3_node_line_graph(directed=True)
+
+        expected = [[1], [2], [3]]
+        calculated = sorted(get_strongly_connected_components(graph))
+
+        self.assertEqual(expected, calculated)
+
+    def test_strongly_connected_components_long_cycle(self):
+        """Does the ''get_strongly_connected_components'' function handle cycles longer than the recursion limit?"""
+        graph = DirectedGraph()
+        num_nodes = 5000
+        for _ in range(num_nodes):
+            graph.new_node()
+        for n in range(1, num_nodes):
+            graph.new_edge(n, n + 1)
+        graph.new_edge(num_nodes, 1)
+
+        calculated = get_strongly_connected_components(graph)
+
+        self.assertEqual(1, len(calculated))
+        self.assertEqual(num_nodes, len(calculated[0]))
+
+    def test_condensation_graph(self):
+        """Does the ''get_condensation_graph'' function build a single node per component and deduplicate edges?"""
+        graph = self.build_two_cycle_test_graph()
+
+        condensation, component_lookup = get_condensation_graph(graph)
+
+        self.assertEqual(3, condensation.num_nodes())
+        self.assertEqual(2, condensation.num_edges())
+        self.assertEqual(component_lookup[1], component_lookup[3])
+        first = component_lookup[1]
+        second = component_lookup[4]
+        third = component_lookup[7]
+        self.assertEqual([second], condensation.neighbors(first))
+        self.assertEqual([third], condensation.neighbors(second))
+        self.assertEqual([4, 5, 6], sorted(condensation.get_node(second)['data']['nodes']))
+
+    def test_weakly_connected_components(self):
+        """Does the ''get_weakly_connected_components'' function ignore edge direction?"""
+        graph = utility_functions.build_simple_test_graph(directed=True)
+
+        expected = [[1, 2, 4, 5], [3], [6, 7]]
+        calculated = sorted(sorted(c) for c in get_weakly_connected_components(graph))
+
+        self.assertEqual(expected, calculated)
+
+    def test_weakly_connected_components_reverse_edges(self):
+        """Does the ''get_weakly_connected_components'' function join nodes that are only reachable backwards?"""
+        graph = DirectedGraph()
+        for _ in range(3):
+            graph.new_node()
+        graph.new_edge(1, 2)
+        graph.new_edge(3, 2)
+
+        calculated = get_weakly_connected_components(graph)
+
+        self.assertEqual([[1, 2, 3]], [sorted(c) for c in calculated])
+
+
+class ComponentIndexTest(unittest.TestCase):
+    def test_empty_graph(self):
+        """Does the ''ComponentIndex'' class handle an empty graph?"""
+        index = ComponentIndex(UndirectedGraph())
+
+        self.assertEqual(0, index.num_components())
+        self.assertEqual([], list(index.component_sizes()))
+        self.assertEqual([], index.largest_component())
+
+    def test_component_numbers(self):
+        """Does the ''ComponentIndex'' class number the components densely?"""
+        graph = utility_functions.build_simple_test_graph()
+
+        index = ComponentIndex(graph)
+
+        self.assertEqual(3, index.num_components())
+        labels = set(index.component_of(n) for n in graph.get_all_node_ids())
+        self.assertEqual({0, 1, 2}, labels)
+        self.assertEqual([1, 2, 4, 5], sorted(index.component_nodes(index.component_of(5))))
+
+    def test_same_component(self):
+        """Does the ''same_component'' method answer a batch of pairs in order?"""
+        graph = utility_functions.build_simple_test_graph()
+
+        index = ComponentIndex(graph)
+
+        pairs = [(1, 5), (1, 3), (6, 7), (7, 4), (3, 3)]
+        expected = [True, False, True, False, True]
+        self.assertEqual(expected, index.same_component(pairs))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_same_component_large_batch(self):
+        """Does the ''same_component'' method agree with ''component_of'' over a large batch of pairs?"""
+        graph = utility_functions.build_simple_test_graph()
+        node_ids = graph.get_all_node_ids()
+
+        index = ComponentIndex(graph)
+
+        pairs = [(a, b) for a in node_ids for b in node_ids] * 50
+        expected = [index.component_of(a) == index.component_of(b) for a, b in pairs]
+        self.assertEqual(expected, index.same_component(pairs))
+        self.assertEqual([], index.same_component([]))
+
+    def test_component_sizes(self):
+        """Do the ''component_sizes'' and ''largest_component'' methods report the component sizes?"""
+        graph = utility_functions.build_simple_test_graph()
+
+        index = ComponentIndex(graph)
+
+        self.assertEqual([1, 2, 4], sorted(index.component_sizes()))
+        self.assertEqual([1, 2, 4, 5], sorted(index.largest_component()))
+
+    def test_nonexistent_node(self):
+        """Does the ''ComponentIndex'' class raise an error for nodes that do not exist?"""
+        graph = utility_functions.build_simple_test_graph()
+        graph.delete_node(3)
+
+        index = ComponentIndex(graph)
+
+        self.assertRaises(NonexistentNodeError, index.component_of, 3)
+        self.assertRaises(NonexistentNodeError, index.component_of, 100)
+        self.assertRaises(NonexistentNodeError, index.same_component, [(1, 2), (1, 100)])
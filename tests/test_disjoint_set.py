@@ -0,0 +1,94 @@
+"""Provides unit tests to verify that the disjoint set classes are functioning correctly."""
+
+import unittest
+
+from ..pygraph import IndexedDisjointSet, RollbackDisjointSet
+
+
+class RollbackDisjointSetTest(unittest.TestCase):
+    def test_union_and_find(self):
+        """Does the ''RollbackDisjointSet'' class join sets correctly?"""
+        ds = RollbackDisjointSet()
+        a, b, c = ds.add_set(), ds.add_set(), ds.add_set()
+
+        ds.union(a, b)
+
+        self.assertEqual(2, len(ds))
+        self.assertEqual(ds.find(a), ds.find(b))
+        self.assertNotEqual(ds.find(a), ds.find(c))
+
+    def test_rollback_restores_sets(self):
+        """Does ''rollback'' undo the most recent unions in reverse order?"""
+        ds = RollbackDisjointSet()
+        a, b, c, d = ds.add_set(), ds.add_set(), ds.add_set(), ds.add_set()
+
+        ds.union(a, b)
+        ds.union(c, d)
+        ds.union(a, d)
+        self.assertEqual(1, len(ds))
+
+        ds.rollback()
+        self.assertEqual(2, len(ds))
+        self.assertEqual(ds.find(a), ds.find(b))
+        self.assertEqual(ds.find(c), ds.find(d))
+        self.assertNotEqual(ds.find(a), ds.find(c))
+
+        ds.rollback()
+        ds.rollback()
+        self.assertEqual(4, len(ds))
+        self.assertEqual(4, len(set(ds.find(x) for x in (a, b, c, d))))
+
+    def test_rollback_of_redundant_union(self):
+        """Does ''rollback'' treat a union within a single set as its own step?"""
+        ds = RollbackDisjointSet()
+        a, b = ds.add_set(), ds.add_set()
+
+        ds.union(a, b)
+        ds.union(b, a)
+        ds.rollback()
+
+        self.assertEqual(ds.find(a), ds.find(b))
+        ds.rollback()
+        self.assertNotEqual(ds.find(a), ds.find(b))
+
+
+class IndexedDisjointSetTest(unittest.TestCase):
+    def test_union_and_find(self):
+        """Does the ''IndexedDisjointSet'' class join sets of caller-chosen elements correctly?"""
+        ds = IndexedDisjointSet([1, 2, 5, 9])
+
+        self.assertTrue(ds.union(1, 9))
+        self.assertFalse(ds.union(9, 1))
+
+        self.assertEqual(3, len(ds))
+        self.assertEqual(ds.find(1), ds.find(9))
+        self.assertNotEqual(ds.find(1), ds.find(2))
+        self.assertEqual(2, ds.set_size(9))
+        self.assertEqual(1, ds.set_size(5))
+
+    def test_membership(self):
+        """Does the ''IndexedDisjointSet'' class only contain the elements that were added?"""
+        ds = IndexedDisjointSet()
+        ds.add(3)
+        ds.add(3)
+
+        self.assertEqual(1, len(ds))
+        self.assertIn(3, ds)
+        self.assertNotIn(0, ds)
+        self.assertNotIn(4, ds)
+        self.assertRaises(KeyError, ds.find, 0)
+        self.assertRaises(KeyError, ds.find, 10)
+        self.assertRaises(ValueError, ds.add, -1)
+
+    def test_batch_operations(self):
+        """Do ''union_many'' and ''find_many'' agree with the single-element operations?"""
+        ds = IndexedDisjointSet(range(8))
+
+        merged = ds.union_many([(0, 1), (2, 3), (1, 0), (3, 1), (6, 7)])
+        self.assertEqual([True, True, False, True, True], merged)
+        self.assertEqual(4, len(ds))
+
+        roots = ds.find_many([0, 1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(1, len(set(roots[:4])))
+        self.assertEqual(4, len(set(roots)))
+        self.assertEqual(roots[6], roots[7])
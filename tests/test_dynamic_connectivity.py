@@ -0,0 +1,260 @@
+"""Provides unit tests to verify that the dynamic connectivity structures are functioning correctly."""
+
+import random
+import unittest
+
+from ..pygraph import (UndirectedGraph, GraphObserver, IncrementalConnectivity, DynamicConnectivity,
+                       offline_dynamic_connectivity, get_connected_components, build_cycle_graph,
+                       NonexistentNodeError, NonexistentEdgeError)
+from . import utility_functions
+
+
+class RecordingObserver(GraphObserver):
+    """Records every notification it receives, for testing."""
+    def __init__(self):
+        self.events = []
+
+    def on_new_node(self, node_id):
+        self.events.append(('new_node', node_id))
+
+    def on_new_edge(self, edge_id, node_a, node_b):
+        self.events.append(('new_edge', edge_id, node_a, node_b))
+
+    def on_delete_edge(self, edge_id, node_a, node_b):
+        self.events.append(('delete_edge', edge_id, node_a, node_b))
+
+    def on_delete_node(self, node_id):
+        self.events.append(('delete_node', node_id))
+
+
+class GraphObserverTest(unittest.TestCase):
+    def test_observer_notifications(self):
+        """Does the graph notify its observers of each structural change?"""
+        graph = UndirectedGraph()
+        observer = RecordingObserver()
+        graph.add_observer(observer)
+
+        graph.new_node()
+        graph.new_node()
+        graph.new_edge(1, 2)
+        graph.delete_edge_by_id(1)
+        graph.delete_node(2)
+
+        expected = [('new_node', 1), ('new_node', 2), ('new_edge', 1, 1, 2),
+                    ('delete_edge', 1, 1, 2), ('delete_node', 2)]
+        self.assertEqual(expected, observer.events)
+
+    def test_removed_observer(self):
+        """Does the graph stop notifying an observer once it has been removed?"""
+        graph = UndirectedGraph()
+        observer = RecordingObserver()
+        graph.add_observer(observer)
+        graph.new_node()
+        graph.remove_observer(observer)
+        graph.new_node()
+
+        self.assertEqual([('new_node', 1)], observer.events)
+
+
+class IncrementalConnectivityTest(unittest.TestCase):
+    def test_existing_graph(self):
+        """Does the ''IncrementalConnectivity'' tracker pick up the components of an existing graph?"""
+        graph = utility_functions.build_simple_test_graph()
+
+        tracker = IncrementalConnectivity(graph)
+
+        self.assertEqual(3, tracker.num_components())
+        self.assertTrue(tracker.connected(1, 5))
+        self.assertFalse(tracker.connected(1, 3))
+        self.assertEqual(tracker.component_of(6), tracker.component_of(7))
+
+    def test_edge_insertions(self):
+        """Does the ''IncrementalConnectivity'' tracker follow new nodes and edges?"""
+        graph = utility_functions.build_simple_test_graph()
+        tracker = IncrementalConnectivity(graph)
+
+        graph.new_edge(3, 6)
+        self.assertEqual(2, tracker.num_components())
+        self.assertTrue(tracker.connected(3, 7))
+
+        node_id = graph.new_node()
+        self.assertEqual(3, tracker.num_components())
+        graph.new_edge(node_id, 1)
+        self.assertEqual(2, tracker.num_components())
+        self.assertTrue(tracker.connected(node_id, 5))
+
+    def test_edge_deletion(self):
+        """Does the ''IncrementalConnectivity'' tracker stay correct after an edge deletion?"""
+        graph = utility_functions.build_simple_test_graph()
+        tracker = IncrementalConnectivity(graph)
+
+        graph.delete_edge_by_id(1)
+
+        self.assertEqual(len(get_connected_components(graph)), tracker.num_components())
+        self.assertFalse(tracker.connected(1, 2))
+        self.assertTrue(tracker.connected(2, 5))
+
+    def test_directed_graph(self):
+        """Does the ''IncrementalConnectivity'' tracker treat directed edges as undirected?"""
+        graph = utility_functions.build_3_node_line_graph(directed=True)
+
+        tracker = IncrementalConnectivity(graph)
+
+        self.assertEqual(1, tracker.num_components())
+        self.assertTrue(tracker.connected(3, 1))
+
+    def test_detached_tracker(self):
+        """Does a detached ''IncrementalConnectivity'' tracker stop following the graph?"""
+        graph = utility_functions.build_simple_test_graph()
+        tracker = IncrementalConnectivity(graph)
+        tracker.detach()
+
+        graph.new_edge(3, 6)
+
+        self.assertFalse(tracker.connected(3, 6))
+
+    def test_nonexistent_node(self):
+        """Does the ''IncrementalConnectivity'' tracker raise an error for a node that does not exist?"""
+        graph = utility_functions.build_simple_test_graph()
+        tracker = IncrementalConnectivity(graph)
+
+        self.assertRaises(NonexistentNodeError, tracker.component_of, 100)
+
+
+class DynamicConnectivityTest(unittest.TestCase):
+    def test_existing_graph(self):
+        """Does the ''DynamicConnectivity'' structure pick up the components of an existing graph?"""
+        graph = utility_functions.build_simple_test_graph()
+
+        connectivity = DynamicConnectivity(graph)
+
+        self.assertEqual(3, connectivity.num_components())
+        self.assertTrue(connectivity.connected(1, 5))
+        self.assertFalse(connectivity.connected(1, 3))
+        self.assertEqual(4, connectivity.component_size(2))
+
+    def test_cycle_edge_deletion(self):
+        """Does deleting a single edge from a cycle leave the ''DynamicConnectivity'' structure connected?"""
+        graph = build_cycle_graph(8)
+        connectivity = DynamicConnectivity(graph)
+
+        graph.delete_edge_by_id(1)
+        self.assertEqual(1, connectivity.num_components())
+        self.assertTrue(connectivity.connected(1, 2))
+
+        graph.delete_edge_by_id(5)
+        self.assertEqual(2, connectivity.num_components())
+        self.assertFalse(connectivity.connected(1, 2))
+        self.assertTrue(connectivity.connected(2, 5))
+        self.assertFalse(connectivity.connected(5, 6))
+
+    def test_bridge_deletion(self):
+        """Does deleting a bridge split the ''DynamicConnectivity'' components?"""
+        graph = utility_functions.build_biconnected_test_graph()
+        connectivity = DynamicConnectivity(graph)
+
+        # --Edge 18 connects nodes 7 and 8
+        graph.delete_edge_by_id(18)
+
+        self.assertEqual(2, connectivity.num_components())
+        self.assertFalse(connectivity.connected(1, 12))
+        self.assertEqual(5, connectivity.component_size(12))
+
+    def test_node_deletion(self):
+        """Does deleting a node update the ''DynamicConnectivity'' structure?"""
+        graph = utility_functions.build_3_node_line_graph()
+        connectivity = DynamicConnectivity(graph)
+
+        graph.delete_node(2)
+
+        self.assertEqual(2, connectivity.num_components())
+        self.assertFalse(connectivity.connected(1, 3))
+        self.assertRaises(NonexistentNodeError, connectivity.connected, 1, 2)
+
+    def test_random_updates_match_connected_components(self):
+        """Does the ''DynamicConnectivity'' structure agree with ''get_connected_components'' under random updates?"""
+        rng = random.Random(1)
+        graph = UndirectedGraph()
+        for _ in range(15):
+            graph.new_node()
+        connectivity = DynamicConnectivity(graph)
+
+        for _ in range(400):
+            edge_ids = graph.get_all_edge_ids()
+            if rng.random() < 0.55 or not edge_ids:
+                graph.new_edge(rng.randint(1, 15), rng.randint(1, 15))
+            else:
+                graph.delete_edge_by_id(rng.choice(edge_ids))
+
+            components = get_connected_components(graph)
+            self.assertEqual(len(components), connectivity.num_components())
+            component_lookup = dict((n, i) for i, c in enumerate(components) for n in c)
+            node_a = rng.randint(1, 15)
+            node_b = rng.randint(1, 15)
+            expected = component_lookup[node_a] == component_lookup[node_b]
+            self.assertEqual(expected, connectivity.connected(node_a, node_b))
+
+
+class OfflineDynamicConnectivityTest(unittest.TestCase):
+    def test_no_queries(self):
+        """Does the ''offline_dynamic_connectivity'' function return no answers when there are no queries?"""
+        events = [('add', 1, 2), ('remove', 1, 2)]
+
+        self.assertEqual([], offline_dynamic_connectivity(events))
+
+    def test_simple_timeline(self):
+        """Does the ''offline_dynamic_connectivity'' function answer queries as of their point in the timeline?"""
+        events = [
+            ('query', 'a', 'b'),
+            ('add', 'a', 'b'),
+            ('add', 'b', 'c'),
+            ('query', 'a', 'c'),
+            ('remove', 'b', 'a'),
+            ('query', 'a', 'c'),
+            ('query', 'b', 'c'),
+            ('query', 'd', 'd'),
+        ]
+
+        expected = [False, True, False, True, True]
+        self.assertEqual(expected, offline_dynamic_connectivity(events))
+
+    def test_parallel_edges(self):
+        """Does removing one of two parallel edges keep the nodes connected?"""
+        events = [('add', 1, 2), ('add', 2, 1), ('remove', 1, 2), ('query', 1, 2), ('remove', 1, 2), ('query', 1, 2)]
+
+        self.assertEqual([True, False], offline_dynamic_connectivity(events))
+
+    def test_removing_missing_edge(self):
+        """Does the ''offline_dynamic_connectivity'' function raise an error when removing an edge that isn't there?"""
+        events = [('add', 1, 2), ('remove', 1, 3)]
+
+        self.assertRaises(NonexistentEdgeError, offline_dynamic_connectivity, events)
+
+    def test_random_timeline_matches_connected_components(self):
+        """Does the ''offline_dynamic_connectivity'' function agree with ''get_connected_components''?"""
+        rng = random.Random(5)
+        graph = UndirectedGraph()
+        for _ in range(10):
+            graph.new_node()
+
+        events = []
+        expected = []
+        for _ in range(300):
+            edge_ids = graph.get_all_edge_ids()
+            roll = rng.random()
+            if roll < 0.35:
+                node_a, node_b = rng.randint(1, 10), rng.randint(1, 10)
+                graph.new_edge(node_a, node_b)
+                events.append(('add', node_a, node_b))
+            elif roll < 0.6 and edge_ids:
+                edge_id = rng.choice(edge_ids)
+                node_a, node_b = graph.get_edge(edge_id)['vertices']
+                graph.delete_edge_by_id(edge_id)
+                events.append(('remove', node_a, node_b))
+            else:
+                node_a, node_b = rng.randint(1, 10), rng.randint(1, 10)
+                events.append(('query', node_a, node_b))
+                component_lookup = dict((n, i) for i, c in enumerate(get_connected_components(graph)) for n in c)
+                expected.append(component_lookup[node_a] == component_lookup[node_b])
+
+        self.assertEqual(expected, offline_dynamic_connectivity(events))
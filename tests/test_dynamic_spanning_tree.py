@@ -0,0 +1,130 @@
+"""Provides unit tests to verify that the dynamic minimum spanning tree structures are functioning correctly."""
+
+import random
+import unittest
+
+from ..pygraph import (UndirectedGraph, DirectedGraph, MSTMaintainer, find_minimum_spanning_forest,
+                       NonexistentEdgeError)
+from ..pygraph.helpers import LinkCutTree
+from . import utility_functions
+
+
+def msf_cost(graph):
+    """Calculates the cost of a minimum spanning forest of the graph from scratch."""
+    if graph.num_edges() == 0:
+        return 0
+    return sum(graph.get_edge(e)['cost'] for tree in find_minimum_spanning_forest(graph) for e in tree)
+
+
+class LinkCutTreeTest(unittest.TestCase):
+    def test_link_and_cut(self):
+        """Does the ''LinkCutTree'' class track connectivity through links and cuts?"""
+        forest = LinkCutTree()
+        forest.link(1, 2, 'a', 5)
+        forest.link(2, 3, 'b', 1)
+        forest.link(4, 5, 'c', 2)
+
+        self.assertTrue(forest.connected(1, 3))
+        self.assertFalse(forest.connected(1, 4))
+
+        forest.cut('a')
+        self.assertFalse(forest.connected(1, 3))
+        self.assertTrue(forest.connected(2, 3))
+        self.assertFalse(forest.has_edge('a'))
+
+    def test_path_max(self):
+        """Does ''path_max'' find the heaviest edge on the path between two vertices?"""
+        forest = LinkCutTree()
+        forest.link(1, 2, 'a', 5)
+        forest.link(2, 3, 'b', 1)
+        forest.link(3, 4, 'c', 3)
+        forest.link(2, 5, 'd', 9)
+
+        self.assertEqual('a', forest.path_max(1, 4))
+        self.assertEqual('c', forest.path_max(4, 2))
+        self.assertEqual('d', forest.path_max(5, 3))
+        self.assertIsNone(forest.path_max(3, 3))
+
+        forest.set_edge_weight('c', 10)
+        self.assertEqual('c', forest.path_max(1, 4))
+
+
+class MSTMaintainerTest(unittest.TestCase):
+    def test_initial_forest(self):
+        """Does the ''MSTMaintainer'' class start with a minimum spanning forest of the graph?"""
+        graph = utility_functions.build_complicated_test_graph_with_one_mst()
+
+        maintainer = MSTMaintainer(graph)
+
+        self.assertEqual([1, 3, 6, 10, 11, 12], sorted(maintainer.get_forest_edges()))
+
+    def test_new_edge_replaces_heaviest_cycle_edge(self):
+        """Does a cheap new edge replace the most expensive edge on the cycle it closes?"""
+        graph = utility_functions.build_triangle_graph_with_costs()
+        graph.new_node()
+        graph.new_edge(3, 4, 4)
+        maintainer = MSTMaintainer(graph)
+
+        new_edge = graph.new_edge(1, 3, 1)
+
+        self.assertTrue(maintainer.is_forest_edge(new_edge))
+        self.assertFalse(maintainer.is_forest_edge(2))
+        self.assertEqual(6, maintainer.total_cost())
+
+    def test_update_cost(self):
+        """Does ''update_cost'' swap forest edges in and out as their costs change?"""
+        graph = utility_functions.build_triangle_graph_with_costs()
+        maintainer = MSTMaintainer(graph)
+        self.assertEqual([1, 2], sorted(maintainer.get_forest_edges()))
+
+        maintainer.update_cost(1, 20)
+        self.assertEqual(20, graph.get_edge(1)['cost'])
+        self.assertEqual([2, 3], sorted(maintainer.get_forest_edges()))
+
+        maintainer.update_cost(1, 0)
+        self.assertEqual([1, 2], sorted(maintainer.get_forest_edges()))
+        self.assertEqual(2, maintainer.total_cost())
+
+        self.assertRaises(NonexistentEdgeError, maintainer.update_cost, 99, 1)
+
+    def test_delete_forest_edge(self):
+        """Does deleting a forest edge bring in the cheapest replacement edge?"""
+        graph = utility_functions.build_square_test_graph_with_costs()
+        maintainer = MSTMaintainer(graph)
+        forest_edge = maintainer.get_forest_edges()[0]
+
+        graph.delete_edge_by_id(forest_edge)
+
+        self.assertEqual(msf_cost(graph), maintainer.total_cost())
+        self.assertEqual(3, len(maintainer.get_forest_edges()))
+
+    def test_random_updates(self):
+        """Does the ''MSTMaintainer'' class stay minimal through a random mix of changes?"""
+        rng = random.Random(39)
+        for trial in range(20):
+            graph = UndirectedGraph() if trial % 2 else DirectedGraph()
+            nodes = [graph.new_node() for _ in range(12)]
+            for _ in range(15):
+                graph.new_edge(rng.choice(nodes), rng.choice(nodes), rng.randint(1, 6))
+            maintainer = MSTMaintainer(graph)
+
+            for _ in range(40):
+                edge_ids = graph.get_all_edge_ids()
+                choice = rng.random()
+                if choice < 0.4 or not edge_ids:
+                    graph.new_edge(rng.choice(nodes), rng.choice(nodes), rng.randint(1, 6))
+                elif choice < 0.6:
+                    graph.delete_edge_by_id(rng.choice(edge_ids))
+                else:
+                    maintainer.update_cost(rng.choice(edge_ids), rng.randint(1, 6))
+                self.assertEqual(msf_cost(graph), maintainer.total_cost())
+
+    def test_detach(self):
+        """Does the ''MSTMaintainer'' class stop following the graph once detached?"""
+        graph = utility_functions.build_triangle_graph_with_costs()
+        maintainer = MSTMaintainer(graph)
+        maintainer.detach()
+
+        graph.new_edge(1, 3, 0)
+
+        self.assertEqual(3, maintainer.total_cost())
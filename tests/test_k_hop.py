@@ -0,0 +1,84 @@
+"""Provides unit tests to verify that the k-hop neighborhood functions are functioning correctly."""
+
+import unittest
+
+from ..pygraph import (UndirectedGraph, k_hop_neighborhood, ego_graph, build_cycle_graph,
+                       NonexistentNodeError)
+from . import utility_functions
+
+
+class KHopNeighborhoodTest(unittest.TestCase):
+    def test_zero_hops(self):
+        """Does the ''k_hop_neighborhood'' function return only the start node when k is 0?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        expected = {1}
+        calculated = k_hop_neighborhood(graph, 1, 0)
+
+        self.assertEqual(expected, calculated)
+
+    def test_stops_at_depth_k(self):
+        """Does the ''k_hop_neighborhood'' function stop the search at depth k?"""
+        graph = build_cycle_graph(10)
+
+        expected = {9, 10, 1, 2, 3}
+        calculated = k_hop_neighborhood(graph, 1, 2)
+
+        self.assertEqual(expected, calculated)
+
+    def test_disconnected_graph(self):
+        """Does the ''k_hop_neighborhood'' function stay within the start node's connected component?"""
+        graph = utility_functions.build_simple_test_graph()
+
+        expected = {1, 2, 4, 5}
+        calculated = k_hop_neighborhood(graph, 1, 10)
+
+        self.assertEqual(expected, calculated)
+
+    def test_directed_graph(self):
+        """Does the ''k_hop_neighborhood'' function only follow edges in their forward direction?"""
+        graph = utility_functions.build_3_node_line_graph(directed=True)
+
+        self.assertEqual({1, 2, 3}, k_hop_neighborhood(graph, 1, 2))
+        self.assertEqual({3}, k_hop_neighborhood(graph, 3, 2))
+
+    def test_nonexistent_node(self):
+        """Does the ''k_hop_neighborhood'' function raise an error for a node that does not exist?"""
+        graph = UndirectedGraph()
+
+        self.assertRaises(NonexistentNodeError, k_hop_neighborhood, graph, 1, 1)
+
+
+class EgoGraphTest(unittest.TestCase):
+    def test_ego_graph_contents(self):
+        """Does the ''ego_graph'' function return the subgraph induced by the k-hop neighborhood?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        view = ego_graph(graph, 1, 1)
+
+        self.assertEqual(3, view.num_nodes())
+        self.assertEqual([1, 2, 3], sorted(view.get_all_node_ids()))
+        self.assertEqual([1, 2, 3], sorted(view.get_all_edge_ids()))
+        self.assertEqual([2, 3], sorted(view.neighbors(1)))
+        self.assertEqual([1, 3], sorted(view.neighbors(2)))
+        self.assertEqual([1, 3], sorted(view.get_node(2)['edges']))
+
+    def test_ego_graph_does_not_copy(self):
+        """Does the ''ego_graph'' function share node data with the original graph?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        view = ego_graph(graph, 1, 1)
+        graph.get_node(1)['data']['label'] = 'root'
+
+        self.assertEqual('root', view.get_node(1)['data']['label'])
+        self.assertIs(graph.get_edge(1), view.get_edge(1))
+
+    def test_ego_graph_hides_outside_nodes(self):
+        """Does the ''ego_graph'' view reject nodes outside of the neighborhood?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        view = ego_graph(graph, 1, 1)
+
+        self.assertRaises(NonexistentNodeError, view.get_node, 5)
+        self.assertFalse(view.adjacent(2, 5))
+        self.assertEqual(float('inf'), view.edge_cost(2, 5))
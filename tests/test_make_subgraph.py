@@ -88,4 +88,37 @@ class MakeSubgraphTest(unittest.TestCase):
 
         for edge_id, tpl in edge_check_pairs:
             edge = subgraph.get_edge(edge_id)
-            self.assertEqual(tpl, edge['vertices'])
\ No newline at end of file
+            self.assertEqual(tpl, edge['vertices'])
+
+    def test_subgraph_drops_edges_to_missing_nodes(self):
+        """Does the ''make_subgraph'' function leave out edges that lead to nodes outside the subgraph?"""
+        graph = utility_functions.build_simple_test_graph()
+
+        subgraph = make_subgraph(graph, [1, 2], [1, 2, 3])
+
+        self.assertEqual([1], subgraph.get_all_edge_ids())
+        self.assertEqual([1], subgraph.get_node(1)['edges'])
+        self.assertEqual(2, subgraph.num_nodes())
+        self.assertEqual(1, subgraph.num_edges())
+
+    def test_subgraph_copies_data(self):
+        """Does the ''make_subgraph'' function copy node and edge data rather than sharing it?"""
+        graph = utility_functions.build_simple_test_graph()
+        graph.get_node(1)['data']['label'] = 'a'
+        graph.get_edge(1)['data']['label'] = 'b'
+
+        subgraph = make_subgraph(graph, [1, 2], [1])
+        subgraph.get_node(1)['data']['label'] = 'changed'
+        subgraph.get_edge(1)['data']['label'] = 'changed'
+
+        self.assertEqual('a', graph.get_node(1)['data']['label'])
+        self.assertEqual('b', graph.get_edge(1)['data']['label'])
+
+    def test_subgraph_keeps_given_order(self):
+        """Does the ''make_subgraph'' function keep the nodes and edges in the order they are given?"""
+        graph = utility_functions.build_triangle_graph()
+
+        subgraph = make_subgraph(graph, [3, 1, 2], [2, 3, 1])
+
+        self.assertEqual([3, 1, 2], subgraph.get_all_node_ids())
+        self.assertEqual([2, 3, 1], subgraph.get_all_edge_ids())
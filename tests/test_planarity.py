@@ -2,7 +2,10 @@
 
 import unittest
 
-from ..pygraph import UndirectedGraph, is_planar, build_cycle_graph, build_k5_graph, build_k33_graph, build_groetzch_graph, build_franklin_graph, build_chvatal_graph
+from ..pygraph import (UndirectedGraph, is_planar, find_planar_embedding, find_embedding_faces,
+                       build_cycle_graph, build_gem_graph, build_tetrahedral_graph, build_k5_graph, build_k33_graph,
+                       build_groetzch_graph, build_franklin_graph, build_chvatal_graph, merge_graphs,
+                       get_weakly_connected_components)
 from . import utility_functions
 
 
@@ -92,19 +95,22 @@ class IsPlanarTest(unittest.TestCase):
 
     def test_really_large_cycle_graph_is_planar(self):
         """Does the ''is_planar'' function correctly classify a really large cycle graph as planar?"""
-        try:
-            graph = build_cycle_graph(1000)
+        graph = build_cycle_graph(1000)
 
-            expected = True
-            planarity = is_planar(graph)
+        expected = True
+        planarity = is_planar(graph)
+
+        self.assertEqual(expected, planarity)
+
+    def test_deep_theta_graph_is_planar(self):
+        """Does the ''is_planar'' function handle a graph whose DFS tree is far deeper than the recursion limit?"""
+        graph = build_cycle_graph(3000)
+        graph.new_edge(1, 1500)
 
-            self.assertEqual(expected, planarity)
-        except RuntimeError as e:
-            if e.args[0] == 'maximum recursion depth exceeded':
-                #Large graphs cause recursion errors. Exception caught, as expected.
-                pass
-            else:
-                raise e
+        expected = True
+        planarity = is_planar(graph)
+
+        self.assertEqual(expected, planarity)
 
 
     def test_k5_graph_not_planar(self):
@@ -188,3 +194,189 @@ class IsPlanarTest(unittest.TestCase):
 
         self.assertEqual(expected, planarity)
 
+    def test_small_planar_graph(self):
+        """Does the ''is_planar'' function classify a small planar undirected graph as planar?"""
+        graph = UndirectedGraph()
+        for _ in range(5):
+            graph.new_node()
+        for node_a, node_b in [(3, 1), (4, 5), (3, 2), (4, 1), (2, 5), (3, 4), (4, 2)]:
+            graph.new_edge(node_a, node_b)
+
+        self.assertEqual(True, is_planar(graph))
+
+    def test_planar_multigraph(self):
+        """Does the ''is_planar'' function ignore parallel edges when classifying a planar graph?"""
+        graph = UndirectedGraph()
+        for _ in range(5):
+            graph.new_node()
+        for node_a, node_b in [(3, 1), (1, 3), (4, 1), (5, 1), (4, 5), (1, 2), (2, 3), (1, 2), (4, 3), (1, 4),
+                               (4, 1), (3, 4), (2, 4)]:
+            graph.new_edge(node_a, node_b)
+
+        self.assertEqual(True, is_planar(graph))
+
+    def test_parallel_planar_components(self):
+        """Does the ''is_planar'' function classify a graph of many planar components as planar across workers?"""
+        graph = UndirectedGraph()
+        for _ in range(20):
+            merge_graphs(graph, build_cycle_graph(6))
+
+        self.assertEqual(True, is_planar(graph))
+        with utility_functions.RecordingExecutor() as executor:
+            self.assertEqual(True, is_planar(graph, executor=executor))
+        self.assertGreater(executor.num_maps, 0)
+        self.assertEqual(True, is_planar(graph, workers=2))
+
+    def test_parallel_non_planar_component(self):
+        """Does the ''is_planar'' function find a non-planar component among planar ones across workers?"""
+        graph = UndirectedGraph()
+        for _ in range(20):
+            merge_graphs(graph, build_cycle_graph(6))
+        # --The Petersen graph gets past the edge count bounds, so it has to be tested by a worker
+        merge_graphs(graph, utility_functions.build_petersons_graph())
+
+        self.assertEqual(False, is_planar(graph))
+        with utility_functions.RecordingExecutor() as executor:
+            self.assertEqual(False, is_planar(graph, executor=executor))
+        self.assertGreater(executor.num_maps, 0)
+        self.assertEqual(False, is_planar(graph, workers=2))
+
+    def test_parallel_directed_graph(self):
+        """Does the ''is_planar'' function classify a directed graph the same way across workers?"""
+        graph = UndirectedGraph()
+        for _ in range(20):
+            merge_graphs(graph, build_cycle_graph(6))
+        graph = utility_functions.build_directed_copy(graph)
+        expected = is_planar(graph)
+
+        self.assertEqual(True, expected)
+        with utility_functions.RecordingExecutor() as executor:
+            self.assertEqual(expected, is_planar(graph, executor=executor))
+        self.assertGreater(executor.num_maps, 0)
+        self.assertEqual(expected, is_planar(graph, workers=2))
+
+
+class LRPlanarityTest(unittest.TestCase):
+    # The ladder graph is only tested with the 'lr' method: the default 'kocay' engine wrongly
+    # classifies ladders with 6 or more rungs as non-planar, which is a long-standing bug in that engine
+    def test_planar_graphs(self):
+        """Does the 'lr' method classify planar graphs as planar?"""
+        graphs = [UndirectedGraph(), utility_functions.build_single_node_graph(), build_cycle_graph(10),
+                  build_gem_graph(), utility_functions.build_ladder_graph(10),
+                  utility_functions.build_biconnected_test_graph()]
+
+        for graph in graphs:
+            self.assertEqual(True, is_planar(graph, method='lr'))
+
+    def test_non_planar_graphs(self):
+        """Does the 'lr' method classify non-planar graphs as non-planar?"""
+        graphs = [build_k5_graph(), build_k33_graph(), utility_functions.build_petersons_graph(),
+                  utility_functions.build_non_planar_test_graph_with_k5_subgraph(),
+                  utility_functions.build_non_planar_test_graph_with_k33_subgraph(),
+                  utility_functions.build_non_planar_disconnected_test_graph_with_k5_subgraph(),
+                  build_groetzch_graph(), build_franklin_graph(), build_chvatal_graph()]
+
+        for graph in graphs:
+            self.assertEqual(False, is_planar(graph, method='lr'))
+
+    def test_parallel_edges_and_self_loops(self):
+        """Does the 'lr' method ignore parallel edges and self-loops?"""
+        graph = build_k33_graph()
+        graph.new_edge(1, 1)
+        graph.new_edge(1, 4)
+        self.assertEqual(False, is_planar(graph, method='lr'))
+
+        graph = build_tetrahedral_graph()
+        graph.new_edge(1, 1)
+        graph.new_edge(1, 2)
+        graph.new_edge(2, 1)
+        self.assertEqual(True, is_planar(graph, method='lr'))
+
+    def test_directed_graphs(self):
+        """Does the 'lr' method treat the arcs of a directed graph as undirected edges?"""
+        self.assertEqual(False, is_planar(utility_functions.build_directed_copy(build_k5_graph()), method='lr'))
+        self.assertEqual(False, is_planar(utility_functions.build_directed_copy(build_k33_graph()), method='lr'))
+        ladder_graph = utility_functions.build_ladder_graph(10)
+        self.assertEqual(True, is_planar(utility_functions.build_directed_copy(ladder_graph), method='lr'))
+
+    def test_deep_cycle_graph(self):
+        """Does the 'lr' method handle graphs deeper than the recursion limit?"""
+        graph = build_cycle_graph(5000)
+
+        self.assertEqual(True, is_planar(graph, method='lr'))
+
+    def test_unknown_method(self):
+        """Does the ''is_planar'' function raise a ValueError for an unknown method?"""
+        graph = build_cycle_graph(5)
+
+        self.assertRaises(ValueError, is_planar, graph, method='unknown')
+
+
+class PlanarEmbeddingTest(unittest.TestCase):
+    def assert_valid_embedding(self, graph, embedding):
+        """Checks that an embedding lists every edge at both ends, and that its faces satisfy Euler's Formula."""
+        incident_edges = dict((node_id, []) for node_id in graph.get_all_node_ids())
+        for edge in graph.get_all_edge_objects():
+            node_a, node_b = edge['vertices']
+            incident_edges[node_a].append(edge['id'])
+            incident_edges[node_b].append(edge['id'])
+        self.assertEqual(sorted(incident_edges.keys()), sorted(embedding.keys()))
+        for node_id, edge_ids in incident_edges.items():
+            self.assertEqual(sorted(edge_ids), sorted(embedding[node_id]))
+
+        # --Each connected component with an edge adds a face beyond V - E + F = 2
+        non_isolated_nodes = [node_id for node_id in embedding if len(embedding[node_id]) > 0]
+        num_components = len([c for c in get_weakly_connected_components(graph) if len(embedding[c[0]]) > 0])
+
+        faces = find_embedding_faces(graph, embedding)
+        self.assertEqual(graph.num_edges() - len(non_isolated_nodes) + 2 * num_components, len(faces))
+        self.assertEqual(2 * graph.num_edges(), sum(len(face) for face in faces))
+
+    def test_empty_graph(self):
+        """Does the ''find_planar_embedding'' function return an empty embedding for an empty graph?"""
+        graph = UndirectedGraph()
+
+        self.assertEqual({}, find_planar_embedding(graph))
+
+    def test_triangle_graph(self):
+        """Does a triangle graph embed with two faces?"""
+        graph = utility_functions.build_triangle_graph()
+        embedding = find_planar_embedding(graph)
+
+        self.assert_valid_embedding(graph, embedding)
+        self.assertEqual(2, len(find_embedding_faces(graph, embedding)))
+
+    def test_planar_graphs(self):
+        """Does the ''find_planar_embedding'' function produce valid embeddings of planar graphs?"""
+        graphs = [build_gem_graph(), utility_functions.build_ladder_graph(10),
+                  utility_functions.build_biconnected_test_graph(), utility_functions.build_disconnected_test_graph()]
+
+        for graph in graphs:
+            self.assert_valid_embedding(graph, find_planar_embedding(graph))
+
+    def test_parallel_edges_and_self_loops(self):
+        """Are parallel edges and self-loops embedded without crossings?"""
+        graph = build_tetrahedral_graph()
+        graph.new_edge(1, 2)
+        graph.new_edge(2, 1)
+        graph.new_edge(3, 3)
+        graph.new_edge(3, 3)
+
+        embedding = find_planar_embedding(graph)
+
+        self.assert_valid_embedding(graph, embedding)
+
+    def test_directed_graphs(self):
+        """Does the ''find_planar_embedding'' function embed the arcs of a directed graph at both of their ends?"""
+        graph = utility_functions.build_directed_copy(build_gem_graph())
+        graph.new_edge(2, 1)
+        graph.new_edge(3, 3)
+
+        self.assert_valid_embedding(graph, find_planar_embedding(graph))
+        self.assertIsNone(find_planar_embedding(utility_functions.build_directed_copy(build_k5_graph())))
+
+    def test_non_planar_graph(self):
+        """Does the ''find_planar_embedding'' function return None for a non-planar graph?"""
+        graph = utility_functions.build_petersons_graph()
+
+        self.assertIsNone(find_planar_embedding(graph))
@@ -0,0 +1,37 @@
+"""Provides unit tests to verify that the priority queue classes are functioning correctly."""
+
+import random
+import unittest
+
+from ..pygraph.helpers import IndexedPriorityQueue
+
+
+class IndexedPriorityQueueTest(unittest.TestCase):
+    def test_items_come_out_in_priority_order(self):
+        """Does the ''IndexedPriorityQueue'' class return items in order of priority?"""
+        rng = random.Random(37)
+        priorities = dict((item, rng.random()) for item in range(100))
+        pq = IndexedPriorityQueue()
+        for item, priority in priorities.items():
+            pq.put(item, priority)
+
+        results = []
+        while not pq.empty():
+            results.append(pq.get())
+
+        self.assertEqual(sorted(priorities, key=priorities.get), results)
+
+    def test_put_updates_priority(self):
+        """Does ''put'' change the priority of an item that is already queued, rather than adding it twice?"""
+        pq = IndexedPriorityQueue()
+        pq.put('a', 5)
+        pq.put('b', 3)
+        pq.put('c', 4)
+
+        pq.put('a', 1)
+        pq.put('b', 10)
+
+        self.assertEqual(3, len(pq))
+        self.assertEqual(10, pq.priority('b'))
+        self.assertEqual(['a', 'c', 'b'], [pq.get(), pq.get(), pq.get()])
+        self.assertNotIn('a', pq)
@@ -0,0 +1,103 @@
+"""Provides unit tests to verify that the neighbor sampling functionality is working correctly."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from ..pygraph import NeighborSampler, CSRGraph, build_cycle_graph, NonexistentNodeError
+from . import utility_functions
+
+
+class CSRGraphTest(unittest.TestCase):
+    def test_csr_undirected_graph(self):
+        """Does ''CSRGraph.from_graph'' record both directions of each undirected edge?"""
+        graph = utility_functions.build_3_node_line_graph()
+
+        csr = CSRGraph.from_graph(graph)
+
+        self.assertEqual(3, csr.num_nodes())
+        self.assertEqual(4, csr.num_entries())
+        middle = csr.index_of(2)
+        neighbors = sorted(csr.node_ids[i] for i in csr.neighbors(middle))
+        self.assertEqual([1, 3], neighbors)
+
+    def test_csr_directed_graph(self):
+        """Does ''CSRGraph.from_graph'' only record the forward direction of directed edges?"""
+        graph = utility_functions.build_3_node_line_graph(directed=True)
+
+        csr = CSRGraph.from_graph(graph)
+
+        self.assertEqual(2, csr.num_entries())
+        self.assertEqual(0, csr.degree(csr.index_of(3)))
+
+    def test_csr_nonexistent_node(self):
+        """Does ''CSRGraph.index_of'' raise an error for a node that does not exist?"""
+        graph = utility_functions.build_3_node_line_graph()
+
+        csr = CSRGraph.from_graph(graph)
+
+        self.assertRaises(NonexistentNodeError, csr.index_of, 10)
+
+
+class NeighborSamplerTest(unittest.TestCase):
+    def test_fanout_limits_sample(self):
+        """Does the sampler keep at most ''fanout'' neighbors for each node in each hop?"""
+        graph = utility_functions.build_fully_biconnected_test_graph()
+
+        sampler = NeighborSampler(graph, [2, 1], seed=7)
+        blocks = sampler.sample([8, 10])
+
+        self.assertEqual(2, len(blocks))
+        for block, fanout in zip(blocks, [2, 1]):
+            counts = [0] * len(block['dst_nodes'])
+            for position in block['edge_dst']:
+                counts[position] += 1
+            self.assertTrue(all(c <= fanout for c in counts))
+
+    def test_sampled_edges_exist(self):
+        """Does every sampled edge connect its destination node to its sampled source node?"""
+        graph = utility_functions.build_fully_biconnected_test_graph()
+
+        sampler = NeighborSampler(graph, [3, 3], seed=1)
+        blocks = sampler.sample([1])
+        node_ids = sampler.csr.node_ids
+
+        for block in blocks:
+            # The destination nodes always lead the source nodes
+            self.assertEqual(list(block['dst_nodes']), list(block['src_nodes'][:len(block['dst_nodes'])]))
+            for dst, src, edge_id in zip(block['edge_dst'], block['edge_src'], block['edge_ids']):
+                a = node_ids[block['dst_nodes'][dst]]
+                b = node_ids[block['src_nodes'][src]]
+                self.assertEqual({a, b}, set(graph.get_edge(edge_id)['vertices']))
+        self.assertEqual(list(blocks[0]['src_nodes']), list(blocks[1]['dst_nodes']))
+
+    def test_small_degree_keeps_all_neighbors(self):
+        """Does the sampler keep every neighbor of a node whose degree is within the fanout?"""
+        graph = build_cycle_graph(6)
+
+        sampler = NeighborSampler(graph, [5])
+        block = sampler.sample([1])[0]
+
+        sampled = sorted(sampler.csr.node_ids[block['src_nodes'][i]] for i in block['edge_src'])
+        self.assertEqual([2, 6], sampled)
+
+    def test_seeded_sampler_is_reproducible(self):
+        """Do two samplers created with the same seed produce the same blocks?"""
+        graph = utility_functions.build_fully_biconnected_test_graph()
+
+        blocks_a = NeighborSampler(graph, [2, 2], seed=42).sample_batches([[1, 2], [8]])
+        blocks_b = NeighborSampler(graph, [2, 2], seed=42).sample_batches([[1, 2], [8]])
+
+        self.assertEqual(blocks_a, blocks_b)
+
+    def test_batches_independent_of_executor(self):
+        """Does running the batches on an executor produce the same blocks as running them serially?"""
+        graph = utility_functions.build_fully_biconnected_test_graph()
+        batches = [[1], [4, 5], [9, 10, 11]]
+
+        serial = NeighborSampler(graph, [2, 2], seed=3).sample_batches(batches)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pooled = NeighborSampler(graph, [2, 2], seed=3).sample_batches(batches, executor=executor)
+        multiprocess = NeighborSampler(graph, [2, 2], seed=3).sample_batches(batches, workers=2)
+
+        self.assertEqual(serial, pooled)
+        self.assertEqual(serial, multiprocess)
@@ -1,8 +1,11 @@
 """Provides unit tests to verify that the spanning tree algorithms are functioning correctly."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
-from ..pygraph import UndirectedGraph, find_minimum_spanning_tree, find_minimum_spanning_forest, DisconnectedGraphError
+from ..pygraph import (UndirectedGraph, find_minimum_spanning_tree, find_minimum_spanning_forest,
+                       DisconnectedGraphError, build_k5_graph)
+from ..pygraph.functions.spanning_tree import boruvka_msf
 from . import utility_functions
 
 
@@ -82,4 +85,136 @@ class MSTTest(unittest.TestCase):
         expected_length = 3
         mst = find_minimum_spanning_forest(graph)
 
-        self.assertEqual(expected_length, len(mst))
\ No newline at end of file
+        self.assertEqual(expected_length, len(mst))
+
+    def test_msf_groups_edges_by_tree(self):
+        """Does the ''find_minimum_spanning_forest'' function return a spanning tree for each component?"""
+        graph = utility_functions.build_disconnected_test_graph()
+        isolated_node = graph.new_node()
+
+        msf = find_minimum_spanning_forest(graph)
+
+        self.assertEqual(4, len(msf))
+        self.assertIn([], msf)
+        trees = [edge_list for edge_list in msf if edge_list]
+        for edge_list in trees:
+            self.assertEqual(2, len(edge_list))
+            nodes = set()
+            for edge_id in edge_list:
+                nodes.update(graph.get_edge(edge_id)['vertices'])
+            self.assertEqual(3, len(nodes))
+            self.assertNotIn(isolated_node, nodes)
+
+    def test_msf_matches_mst_for_connected_graph(self):
+        """Does the ''find_minimum_spanning_forest'' function return the mst for a connected graph?"""
+        graph = utility_functions.build_complicated_test_graph_with_one_mst()
+
+        msf = find_minimum_spanning_forest(graph)
+
+        self.assertEqual(1, len(msf))
+        self.assertEqual([1, 3, 6, 10, 11, 12], sorted(msf[0]))
+
+    def test_mst_with_data_field_key(self):
+        """Does the ''find_minimum_spanning_tree'' function weigh edges by a named edge data field?"""
+        graph = utility_functions.build_triangle_graph_with_costs()
+        for edge_id, weight in ((1, 10), (2, 2), (3, 1)):
+            graph.get_edge(edge_id)['data']['weight'] = weight
+
+        self.assertEqual([2, 3], sorted(find_minimum_spanning_tree(graph, key='weight')))
+
+    def test_mst_with_callable_key(self):
+        """Does the ''find_minimum_spanning_tree'' function weigh edges with a key function?"""
+        graph = utility_functions.build_triangle_graph_with_costs()
+
+        mst = find_minimum_spanning_tree(graph, key=lambda edge: -edge['cost'])
+
+        self.assertEqual([2, 3], sorted(mst))
+
+    def test_prim_with_unique_mst(self):
+        """Does the ''find_minimum_spanning_tree'' function return the unique mst when using Prim's algorithm?"""
+        graph = utility_functions.build_complicated_test_graph_with_one_mst()
+
+        mst = find_minimum_spanning_tree(graph, method='prim')
+
+        self.assertEqual([1, 3, 6, 10, 11, 12], sorted(mst))
+
+    def test_prim_with_directed_graph(self):
+        """Does Prim's algorithm follow directed edges in both directions, as Kruskal's algorithm does?"""
+        graph = utility_functions.build_square_test_graph_with_costs(directed=True)
+
+        kruskal = find_minimum_spanning_tree(graph, method='kruskal')
+        prim = find_minimum_spanning_tree(graph, method='prim')
+
+        self.assertEqual(sorted(kruskal), sorted(prim))
+
+    def test_auto_method_with_dense_graph(self):
+        """Does the ''find_minimum_spanning_tree'' function return a spanning tree for a complete graph?"""
+        graph = build_k5_graph()
+
+        for method in ('auto', 'kruskal', 'prim'):
+            mst = find_minimum_spanning_tree(graph, method=method)
+            self.assertEqual(4, len(mst))
+
+    def test_unknown_method(self):
+        """Does the ''find_minimum_spanning_tree'' function reject an unknown method?"""
+        graph = utility_functions.build_triangle_graph_with_costs()
+
+        self.assertRaises(ValueError, find_minimum_spanning_tree, graph, method='boruvka-ish')
+
+    def test_boruvka_msf_matches_kruskal(self):
+        """Does Boruvka's algorithm find a forest of the same shape and weight as Kruskal's algorithm?"""
+        graph = utility_functions.build_disconnected_test_graph()
+        graph.new_node()
+        for edge in graph.get_all_edge_objects():
+            edge['cost'] = edge['id'] % 3
+
+        kruskal = find_minimum_spanning_forest(graph)
+        boruvka = find_minimum_spanning_forest(graph, method='boruvka')
+
+        def tree_weights(forest):
+            return sorted((len(tree), sum(graph.get_edge(e)['cost'] for e in tree)) for tree in forest)
+        self.assertEqual(tree_weights(kruskal), tree_weights(boruvka))
+
+    def test_boruvka_with_unique_mst(self):
+        """Does Boruvka's algorithm return the unique mst, both serially and across workers?"""
+        graph = utility_functions.build_complicated_test_graph_with_one_mst()
+        expected = [1, 3, 6, 10, 11, 12]
+
+        self.assertEqual([expected], [sorted(t) for t in find_minimum_spanning_forest(graph, method='boruvka')])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            msf = find_minimum_spanning_forest(graph, method='boruvka', executor=executor)
+        self.assertEqual([expected], [sorted(t) for t in msf])
+        msf = find_minimum_spanning_forest(graph, method='boruvka', workers=2)
+        self.assertEqual([expected], [sorted(t) for t in msf])
+
+    def test_forest_uses_executor_by_default(self):
+        """Does the ''find_minimum_spanning_forest'' function switch to Boruvka's algorithm
+        when given an executor without a method?"""
+        class CountingExecutor(ThreadPoolExecutor):
+            num_maps = 0
+
+            def map(self, *args, **kwargs):
+                self.num_maps += 1
+                return super(CountingExecutor, self).map(*args, **kwargs)
+
+        graph = utility_functions.build_complicated_test_graph_with_one_mst()
+        expected = [1, 3, 6, 10, 11, 12]
+
+        with CountingExecutor(max_workers=2) as executor:
+            msf = find_minimum_spanning_forest(graph, executor=executor)
+        self.assertEqual([expected], [sorted(t) for t in msf])
+        self.assertGreater(executor.num_maps, 0)
+
+    def test_boruvka_edgeless_graph(self):
+        """Does Boruvka's algorithm accept no edges from a graph without edges, both serially and across workers?"""
+        for graph in [UndirectedGraph(), utility_functions.build_single_node_graph()]:
+            self.assertEqual([], boruvka_msf(graph))
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                self.assertEqual([], boruvka_msf(graph, executor=executor))
+            self.assertEqual([], boruvka_msf(graph, workers=2))
+
+    def test_unknown_forest_method(self):
+        """Does the ''find_minimum_spanning_forest'' function reject an unknown method?"""
+        graph = utility_functions.build_triangle_graph_with_costs()
+
+        self.assertRaises(ValueError, find_minimum_spanning_forest, graph, method='prim')
@@ -0,0 +1,104 @@
+"""Provides unit tests to verify that the tree query index is functioning correctly."""
+
+import unittest
+
+from ..pygraph import (UndirectedGraph, TreeQueryIndex, find_minimum_spanning_tree, find_minimum_spanning_forest,
+                       depth_first_search_with_parent_data, DisconnectedGraphError, NonexistentNodeError)
+from . import utility_functions
+
+
+def build_weighted_tree():
+    """Builds a small tree with costs:
+            1
+          /   \\
+        2(3)   3(1)
+        |     /    \\
+       4(7) 5(2)   6(5)
+                    |
+                   7(4)
+    """
+    graph = UndirectedGraph()
+    for _ in range(7):
+        graph.new_node()
+    graph.new_edge(1, 2, 3)
+    graph.new_edge(1, 3, 1)
+    graph.new_edge(2, 4, 7)
+    graph.new_edge(3, 5, 2)
+    graph.new_edge(3, 6, 5)
+    graph.new_edge(6, 7, 4)
+    return graph
+
+
+class TreeQueryIndexTest(unittest.TestCase):
+    def test_lca(self):
+        """Does the ''lca'' method find the lowest common ancestor of two nodes?"""
+        graph = build_weighted_tree()
+        index = TreeQueryIndex(graph, graph.get_all_edge_ids())
+
+        self.assertEqual(3, index.lca(5, 7))
+        self.assertEqual(1, index.lca(4, 7))
+        self.assertEqual(6, index.lca(6, 7))
+        self.assertEqual(2, index.lca(2, 2))
+        self.assertEqual(3, index.depth(7))
+
+    def test_path_max_edge(self):
+        """Does the ''path_max_edge'' method find the heaviest edge on the path between two nodes?"""
+        graph = build_weighted_tree()
+        index = TreeQueryIndex(graph, graph.get_all_edge_ids())
+
+        self.assertEqual(3, index.path_max_edge(4, 7))
+        self.assertEqual(5, index.path_max_edge(5, 7))
+        self.assertEqual(4, index.path_max_edge(5, 3))
+        self.assertIsNone(index.path_max_edge(6, 6))
+
+    def test_tree_distance(self):
+        """Does the ''tree_distance'' method add up the weights along the path between two nodes?"""
+        graph = build_weighted_tree()
+        index = TreeQueryIndex(graph, graph.get_all_edge_ids())
+
+        self.assertEqual(20, index.tree_distance(4, 7))
+        self.assertEqual(11, index.tree_distance(5, 7))
+        self.assertEqual(0, index.tree_distance(5, 5))
+
+        hops = TreeQueryIndex(graph, graph.get_all_edge_ids(), key=lambda edge: 1)
+        self.assertEqual(5, hops.tree_distance(4, 7))
+
+    def test_from_minimum_spanning_tree(self):
+        """Does the index answer bottleneck queries on the output of ''find_minimum_spanning_tree''?"""
+        graph = utility_functions.build_triangle_graph_with_costs()
+        index = TreeQueryIndex(graph, find_minimum_spanning_tree(graph))
+
+        self.assertEqual(2, index.path_max_edge(1, 3))
+        self.assertEqual(3, index.tree_distance(1, 3))
+
+    def test_from_parent_map(self):
+        """Does ''from_parent_map'' build the same tree as the parent lookup of a depth-first search?"""
+        graph = build_weighted_tree()
+        _, parent_lookup, _ = depth_first_search_with_parent_data(graph, 7)
+        index = TreeQueryIndex.from_parent_map(graph, parent_lookup)
+
+        self.assertEqual(3, index.lca(4, 5))
+        self.assertEqual(0, index.depth(7))
+        self.assertEqual(3, index.path_max_edge(4, 7))
+
+    def test_forest(self):
+        """Does the index keep separate trees apart?"""
+        graph = utility_functions.build_disconnected_test_graph()
+        index = TreeQueryIndex(graph, find_minimum_spanning_forest(graph))
+
+        self.assertRaises(DisconnectedGraphError, index.lca, 1, 4)
+        self.assertRaises(DisconnectedGraphError, index.tree_distance, 1, 9)
+        self.assertRaises(NonexistentNodeError, index.lca, 1, 100)
+        self.assertEqual(1, index.tree_distance(4, 5))
+
+    def test_path_nodes(self):
+        """Do ''path_nodes'' and ''is_on_path'' follow the tree path between two nodes?"""
+        graph = build_weighted_tree()
+        index = TreeQueryIndex(graph, graph.get_all_edge_ids())
+
+        self.assertEqual([4, 2, 1, 3, 6, 7], index.path_nodes(4, 7))
+        self.assertEqual([5], index.path_nodes(5, 5))
+        self.assertTrue(index.is_on_path(1, 4, 7))
+        self.assertTrue(index.is_on_path(7, 4, 7))
+        self.assertFalse(index.is_on_path(5, 4, 7))
+        self.assertTrue(index.same_tree(4, 7))
@@ -0,0 +1,144 @@
+"""Provides unit tests to verify that the triconnected components and SPQR tree algorithms are functioning correctly."""
+
+import unittest
+
+from ..pygraph import (UndirectedGraph, find_triconnected_components, find_separation_pairs, build_spqr_tree,
+                       build_spqr_trees, build_triangle_graph, build_square_graph, build_diamond_graph,
+                       build_tetrahedral_graph, build_gem_graph, build_cycle_graph, is_planar)
+from . import utility_functions
+
+
+class TriconnectedComponentsTest(unittest.TestCase):
+    def test_empty_graph(self):
+        """Does the ''find_triconnected_components'' function return an empty list for an empty graph?"""
+        graph = UndirectedGraph()
+
+        self.assertEqual([], find_triconnected_components(graph))
+        self.assertEqual([], find_separation_pairs(graph))
+
+    def test_triangle_graph(self):
+        """Is a triangle graph a single polygon, without any separation pairs?"""
+        graph = build_triangle_graph()
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['S'], spqr_tree.component_types)
+        self.assertEqual([[1, 2, 3]], spqr_tree.component_edges)
+        self.assertEqual([], find_separation_pairs(graph))
+
+    def test_square_graph(self):
+        """Are the opposite corners of a square graph separation pairs?"""
+        graph = build_square_graph()
+
+        self.assertEqual([(1, 3), (2, 4)], find_separation_pairs(graph))
+
+    def test_tetrahedral_graph(self):
+        """Is a tetrahedral graph a single triconnected component?"""
+        graph = build_tetrahedral_graph()
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['R'], spqr_tree.component_types)
+        self.assertEqual(0, spqr_tree.tree.num_edges())
+        self.assertEqual([], find_separation_pairs(graph))
+
+    def test_diamond_graph(self):
+        """Does a diamond graph split into two polygons and a bond at its central edge?"""
+        graph = build_diamond_graph()
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['P', 'S', 'S'], sorted(spqr_tree.component_types))
+        self.assertEqual(2, spqr_tree.tree.num_edges())
+        self.assertEqual([(2, 4), (2, 4)], spqr_tree.virtual_edges)
+        self.assertEqual([(2, 4)], find_separation_pairs(graph))
+
+    def test_gem_graph(self):
+        """Do adjacent polygons of a gem graph stay apart, separated by the bonds at its chords?"""
+        graph = build_gem_graph()
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['P', 'P', 'S', 'S', 'S'], sorted(spqr_tree.component_types))
+        self.assertEqual([(1, 3), (1, 4)], find_separation_pairs(graph))
+
+    def test_parallel_edges(self):
+        """Is a pair of nodes joined by several edges a single bond?"""
+        graph = utility_functions.build_2_node_graph()
+        graph.new_edge(1, 2)
+        graph.new_edge(2, 1)
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['P'], spqr_tree.component_types)
+        self.assertEqual([[1, 2, 3]], spqr_tree.component_edges)
+        self.assertEqual([], find_separation_pairs(graph))
+
+    def test_single_edge(self):
+        """Is a block made of a single edge a lone Q node?"""
+        graph = utility_functions.build_2_node_graph()
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['Q'], spqr_tree.component_types)
+        self.assertEqual(0, spqr_tree.tree.num_edges())
+        self.assertEqual([], find_separation_pairs(graph))
+
+    def test_parallel_edge_on_polygon(self):
+        """Does a parallel edge on a polygon form a bond without making its ends a separation pair?"""
+        graph = build_square_graph()
+        extra_edge = graph.new_edge(1, 2)
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['P', 'S'], sorted(spqr_tree.component_types))
+        bond = spqr_tree.get_components_of_type('P')[0]
+        self.assertEqual([1, extra_edge], sorted(spqr_tree.component_edges[bond]))
+        self.assertEqual([(1, 3), (2, 4)], find_separation_pairs(graph))
+
+    def test_merged_polygons(self):
+        """Are the pieces of a long cycle split apart during the search merged back into a single polygon?"""
+        graph = build_cycle_graph(50)
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['S'], spqr_tree.component_types)
+        self.assertEqual(50 * 47 // 2, len(find_separation_pairs(graph)))
+
+    def test_large_prism_graph(self):
+        """Is a large prism graph, deeper than the recursion limit, a single triconnected component?"""
+        graph = UndirectedGraph()
+        outer_nodes = [graph.new_node() for _ in range(2000)]
+        inner_nodes = [graph.new_node() for _ in range(2000)]
+        for index in range(2000):
+            graph.new_edge(outer_nodes[index], outer_nodes[(index + 1) % 2000])
+            graph.new_edge(inner_nodes[index], inner_nodes[(index + 1) % 2000])
+            graph.new_edge(outer_nodes[index], inner_nodes[index])
+        spqr_tree = build_spqr_tree(graph)
+
+        self.assertEqual(['R'], spqr_tree.component_types)
+        self.assertEqual([], find_separation_pairs(graph))
+
+    def test_skeleton(self):
+        """Does the skeleton of a component hold its edges along with its virtual edges?"""
+        graph = build_diamond_graph()
+        spqr_tree = build_spqr_tree(graph)
+        bond = spqr_tree.get_components_of_type('P')[0]
+
+        skeleton = spqr_tree.get_skeleton(bond)
+
+        self.assertEqual([2, 4], sorted(skeleton.get_all_node_ids()))
+        self.assertEqual(3, skeleton.num_edges())
+        virtual_edges = [edge_id for edge_id in skeleton.get_all_edge_ids()
+                         if 'virtual_edge' in skeleton.get_edge(edge_id)['data']]
+        self.assertEqual(2, len(virtual_edges))
+
+    def test_rigid_skeletons_decide_planarity(self):
+        """Is a block non-planar exactly when the skeleton of one of its rigid components is?"""
+        graph = utility_functions.build_non_planar_test_graph_with_k33_subgraph()
+
+        skeletons = [spqr_tree.get_skeleton(index) for spqr_tree in build_spqr_trees(graph)
+                     for index in spqr_tree.get_components_of_type('R')]
+        self.assertEqual(1, len(skeletons))
+        self.assertFalse(is_planar(skeletons[0]))
+
+    def test_multiple_blocks(self):
+        """Does the ''build_spqr_trees'' function build a tree for each biconnected component?"""
+        graph = utility_functions.build_biconnected_test_graph()
+
+        spqr_trees = build_spqr_trees(graph)
+
+        self.assertEqual(3, len(spqr_trees))
+        self.assertEqual(16, sum(len(edge_list) for edge_list in find_triconnected_components(graph)))
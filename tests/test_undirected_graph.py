@@ -176,3 +176,20 @@ class UDGTest(unittest.TestCase):
         for node_a, node_b in nodes_without_edges:
             cost = graph.edge_cost(node_a, node_b)
             self.assertEqual(float('inf'), cost)
+
+    def test_delete_node_removes_all_edges(self):
+        """Does the ''delete_node'' method remove every edge attached to the node?"""
+        graph = UndirectedGraph()
+        for _ in range(4):
+            graph.new_node()
+        graph.new_edge(1, 2)
+        graph.new_edge(1, 3)
+        graph.new_edge(4, 1)
+        graph.new_edge(1, 1)
+
+        graph.delete_node(1)
+
+        self.assertEqual(0, graph.num_edges())
+        self.assertEqual({}, graph.edges)
+        for node_id in [2, 3, 4]:
+            self.assertEqual([], graph.get_node(node_id)['edges'])
@@ -0,0 +1,68 @@
+"""Provides unit tests to verify that the vectorized connected components backend is functioning correctly."""
+
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..pygraph import (UndirectedGraph, DirectedGraph, get_connected_components,
+                       get_connected_components_vectorized)
+from ..pygraph.functions.vectorized_connected_components import connected_component_labels
+from . import utility_functions
+
+
+def as_sets(components):
+    return sorted((sorted(c) for c in components))
+
+
+class VectorizedConnectedComponentsTest(unittest.TestCase):
+    def test_empty_graph(self):
+        """Does the ''get_connected_components_vectorized'' function return an empty list for an empty graph?"""
+        graph = UndirectedGraph()
+
+        self.assertEqual([], get_connected_components_vectorized(graph))
+
+    def test_matches_connected_components(self):
+        """Does the ''get_connected_components_vectorized'' function find the same components
+        as ''get_connected_components''?"""
+        graph = utility_functions.build_simple_test_graph()
+
+        self.assertEqual(as_sets(get_connected_components(graph)),
+                         as_sets(get_connected_components_vectorized(graph)))
+
+    def test_random_graphs(self):
+        """Does the ''get_connected_components_vectorized'' function agree with ''get_connected_components''
+        on random graphs?"""
+        rng = random.Random(34)
+        for _ in range(20):
+            graph = UndirectedGraph()
+            nodes = [graph.new_node() for _ in range(rng.randint(1, 60))]
+            for _ in range(rng.randint(0, 60)):
+                graph.new_edge(rng.choice(nodes), rng.choice(nodes))
+
+            self.assertEqual(as_sets(get_connected_components(graph)),
+                             as_sets(get_connected_components_vectorized(graph)))
+
+    def test_directed_graph(self):
+        """Does the ''get_connected_components_vectorized'' function ignore edge direction on a directed graph?"""
+        graph = DirectedGraph()
+        for _ in range(5):
+            graph.new_node()
+        graph.new_edge(2, 1)
+        graph.new_edge(3, 2)
+        graph.new_edge(5, 4)
+
+        self.assertEqual([[1, 2, 3], [4, 5]], as_sets(get_connected_components_vectorized(graph)))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_component_labels(self):
+        """Does the ''connected_component_labels'' function label each node with the smallest index in its component?"""
+        # A long path given in reverse order needs several rounds of hooking
+        sources = numpy.arange(1, 50)
+        targets = numpy.arange(0, 49)
+        labels = connected_component_labels(52, sources[::-1], targets[::-1])
+
+        self.assertEqual([0] * 50 + [50, 51], labels.tolist())
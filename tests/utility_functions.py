@@ -1,5 +1,7 @@
 """Provides utility functions for unit testing."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ..pygraph import (DirectedGraph, UndirectedGraph,
                      build_triangle_graph, build_k5_graph, build_k33_graph, build_5_cycle_graph,
                      merge_graphs)
@@ -269,3 +271,37 @@ def build_petersons_graph():
     graph.new_edge(5, 10)
 
     return graph
+
+
+def build_ladder_graph(num_rungs):
+    """Builds a ladder graph with the given number of rungs."""
+    graph = UndirectedGraph()
+    left_nodes = [graph.new_node() for _ in range(num_rungs)]
+    right_nodes = [graph.new_node() for _ in range(num_rungs)]
+    for index in range(num_rungs):
+        graph.new_edge(left_nodes[index], right_nodes[index])
+        if index > 0:
+            graph.new_edge(left_nodes[index - 1], left_nodes[index])
+            graph.new_edge(right_nodes[index - 1], right_nodes[index])
+    return graph
+
+
+def build_directed_copy(graph):
+    """Builds a directed graph with the same nodes as the given graph, and an arc for each of its edges."""
+    directed_graph = DirectedGraph()
+    node_lookup = dict((node_id, directed_graph.new_node()) for node_id in graph.get_all_node_ids())
+    for edge in graph.get_all_edge_objects():
+        node_a, node_b = edge['vertices']
+        directed_graph.new_edge(node_lookup[node_a], node_lookup[node_b])
+    return directed_graph
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """A thread pool that counts the calls to its ''map'' method, to verify that work was handed out to it."""
+    def __init__(self, max_workers=2):
+        super(RecordingExecutor, self).__init__(max_workers=max_workers)
+        self.num_maps = 0
+
+    def map(self, *args, **kwargs):
+        self.num_maps += 1
+        return super(RecordingExecutor, self).map(*args, **kwargs)